@@ -20,6 +20,7 @@ import {
 } from 'lucide-react'
 
 const Admin = ({ user }) => {
+  const authHeaders = (extra = {}) => ({ ...extra, Authorization: `Bearer ${user.access_token}` })
   const [questionLists, setQuestionLists] = useState([])
   const [categories, setCategories] = useState([])
   const [isLoading, setIsLoading] = useState(true)
@@ -47,8 +48,8 @@ const Admin = ({ user }) => {
   const fetchData = async () => {
     try {
       const [listsRes, categoriesRes] = await Promise.all([
-        fetch('/api/question-lists'),
-        fetch(`/api/categories?user_id=${user.id}`)
+        fetch('/api/question-lists', { headers: authHeaders() }),
+        fetch(`/api/categories`, { headers: authHeaders() })
       ])
 
       if (listsRes.ok) {
@@ -79,10 +80,9 @@ const Admin = ({ user }) => {
       
       const response = await fetch('/api/question-lists/upload-text', {
         method: 'POST',
-        headers: { 'Content-Type': 'application/json' },
+        headers: authHeaders({ 'Content-Type': 'application/json' }),
         body: JSON.stringify({
-          ...uploadForm,
-          created_by: user.id
+          ...uploadForm
         })
       })
 
@@ -106,7 +106,7 @@ const Admin = ({ user }) => {
 
   const viewQuestions = async (list) => {
     try {
-      const response = await fetch(`/api/question-lists/${list.id}/questions`)
+      const response = await fetch(`/api/question-lists/${list.id}/questions`, { headers: authHeaders() })
       if (response.ok) {
         const data = await response.json()
         setSelectedList(data.list)
@@ -124,8 +124,7 @@ const Admin = ({ user }) => {
     try {
       const response = await fetch(`/api/question-lists/${listId}`, {
         method: 'DELETE',
-        headers: { 'Content-Type': 'application/json' },
-        body: JSON.stringify({ user_id: user.id })
+        headers: authHeaders()
       })
 
       if (response.ok) {
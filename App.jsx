@@ -20,7 +20,13 @@ function App() {
     // Verificar se há usuário logado no localStorage
     const savedUser = localStorage.getItem('medcards_user')
     if (savedUser) {
-      setUser(JSON.parse(savedUser))
+      const parsed = JSON.parse(savedUser)
+      // Sessões salvas antes do login com token precisam entrar de novo
+      if (parsed.access_token) {
+        setUser(parsed)
+      } else {
+        localStorage.removeItem('medcards_user')
+      }
     }
     setIsLoading(false)
   }, [])
@@ -19,6 +19,7 @@ import {
 } from 'lucide-react'
 
 const Categories = ({ user }) => {
+  const authHeaders = (extra = {}) => ({ ...extra, Authorization: `Bearer ${user.access_token}` })
   const [categories, setCategories] = useState([])
   const [themes, setThemes] = useState([])
   const [cards, setCards] = useState([])
@@ -55,9 +56,9 @@ const Categories = ({ user }) => {
   const fetchData = async () => {
     try {
       const [categoriesRes, cardsRes, questionListsRes] = await Promise.all([
-        fetch(`/api/categories?user_id=${user.id}`),
-        fetch(`/api/cards?user_id=${user.id}`),
-        fetch('/api/question-lists')
+        fetch(`/api/categories`, { headers: authHeaders() }),
+        fetch(`/api/cards`, { headers: authHeaders() }),
+        fetch('/api/question-lists', { headers: authHeaders() })
       ])
 
       if (categoriesRes.ok) {
@@ -87,7 +88,7 @@ const Categories = ({ user }) => {
 
   const fetchThemes = async (categoryId) => {
     try {
-      const response = await fetch(`/api/themes?category_id=${categoryId}`)
+      const response = await fetch(`/api/themes?category_id=${categoryId}`, { headers: authHeaders() })
       if (response.ok) {
         const themesData = await response.json()
         setThemes(themesData)
@@ -107,8 +108,8 @@ const Categories = ({ user }) => {
     try {
       const response = await fetch('/api/categories', {
         method: 'POST',
-        headers: { 'Content-Type': 'application/json' },
-        body: JSON.stringify({ ...categoryForm, user_id: user.id })
+        headers: authHeaders({ 'Content-Type': 'application/json' }),
+        body: JSON.stringify(categoryForm)
       })
 
       if (response.ok) {
@@ -126,7 +127,7 @@ const Categories = ({ user }) => {
     try {
       const response = await fetch('/api/themes', {
         method: 'POST',
-        headers: { 'Content-Type': 'application/json' },
+        headers: authHeaders({ 'Content-Type': 'application/json' }),
         body: JSON.stringify({ ...themeForm, category_id: selectedCategory.id })
       })
 
@@ -145,8 +146,8 @@ const Categories = ({ user }) => {
     try {
       const response = await fetch('/api/cards', {
         method: 'POST',
-        headers: { 'Content-Type': 'application/json' },
-        body: JSON.stringify({ ...cardForm, user_id: user.id })
+        headers: authHeaders({ 'Content-Type': 'application/json' }),
+        body: JSON.stringify(cardForm)
       })
 
       if (response.ok) {
@@ -196,7 +197,7 @@ const Categories = ({ user }) => {
 
   const fetchQuestionsFromList = async (listId) => {
     try {
-      const response = await fetch(`/api/question-lists/${listId}/questions`)
+      const response = await fetch(`/api/question-lists/${listId}/questions`, { headers: authHeaders() })
       if (response.ok) {
         const data = await response.json()
         setSelectedQuestions(data.questions)
@@ -217,15 +218,14 @@ const Categories = ({ user }) => {
       const promises = selectedQuestions.map(question => 
         fetch('/api/cards', {
           method: 'POST',
-          headers: { 'Content-Type': 'application/json' },
+          headers: authHeaders({ 'Content-Type': 'application/json' }),
           body: JSON.stringify({
             question: question.question_text,
             answer: cardForm.answer || ' ', // Resposta opcional ou espaço
             category_id: cardForm.category_id,
             theme_id: cardForm.theme_id || null,
             difficulty: cardForm.difficulty,
-            tags: cardForm.tags,
-            user_id: user.id
+            tags: cardForm.tags
           })
         })
       )
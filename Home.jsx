@@ -15,6 +15,7 @@ import {
 } from 'lucide-react'
 
 const Home = ({ user }) => {
+  const authHeaders = (extra = {}) => ({ ...extra, Authorization: `Bearer ${user.access_token}` })
   const [stats, setStats] = useState({
     totalCards: 0,
     studiedToday: 0,
@@ -33,9 +34,9 @@ const Home = ({ user }) => {
     try {
       // Buscar estatísticas gerais
       const [cardsResponse, performanceResponse, historyResponse] = await Promise.all([
-        fetch(`http://localhost:5000/api/cards?user_id=${user.id}`),
-        fetch(`http://localhost:5000/api/reports/performance?user_id=${user.id}&days=1`),
-        fetch(`http://localhost:5000/api/study/history?user_id=${user.id}&limit=3`)
+        fetch(`http://localhost:5000/api/cards`, { headers: authHeaders() }),
+        fetch(`http://localhost:5000/api/reports/performance?days=1`, { headers: authHeaders() }),
+        fetch(`http://localhost:5000/api/study/history?limit=3`, { headers: authHeaders() })
       ])
 
       if (cardsResponse.ok) {
@@ -58,7 +59,7 @@ const Home = ({ user }) => {
       }
 
       // Buscar cards para revisão
-      const reviewResponse = await fetch(`http://localhost:5000/api/cards/study?user_id=${user.id}&limit=1`)
+      const reviewResponse = await fetch(`http://localhost:5000/api/cards/study?limit=1`, { headers: authHeaders() })
       if (reviewResponse.ok) {
         const reviewCards = await reviewResponse.json()
         setStats(prev => ({ ...prev, cardsToReview: reviewCards.length }))
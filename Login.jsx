@@ -46,7 +46,8 @@ const Login = ({ onLogin }) => {
       const data = await response.json()
 
       if (response.ok) {
-        onLogin(data.user)
+        // O token vai junto do usuário salvo; as páginas o enviam como Bearer
+        onLogin({ ...data.user, access_token: data.access_token })
       } else {
         setError(data.error || 'Erro ao processar solicitação')
       }
@@ -34,6 +34,7 @@ import {
 } from 'lucide-react'
 
 const Reports = ({ user }) => {
+  const authHeaders = (extra = {}) => ({ ...extra, Authorization: `Bearer ${user.access_token}` })
   const [timeRange, setTimeRange] = useState('7')
   const [performanceData, setPerformanceData] = useState(null)
   const [progressData, setProgressData] = useState([])
@@ -48,8 +49,8 @@ const Reports = ({ user }) => {
     setIsLoading(true)
     try {
       const [performanceRes, progressRes] = await Promise.all([
-        fetch(`/api/reports/performance?user_id=${user.id}&days=${timeRange}`),
-        fetch(`/api/reports/progress?user_id=${user.id}&days=${timeRange}`)
+        fetch(`/api/reports/performance?days=${timeRange}`, { headers: authHeaders() }),
+        fetch(`/api/reports/progress?days=${timeRange}`, { headers: authHeaders() })
       ])
 
       if (performanceRes.ok) {
@@ -17,6 +17,7 @@ import {
 } from 'lucide-react'
 
 const Study = ({ user }) => {
+  const authHeaders = (extra = {}) => ({ ...extra, Authorization: `Bearer ${user.access_token}` })
   const [studySession, setStudySession] = useState(null)
   const [currentCard, setCurrentCard] = useState(null)
   const [cards, setCards] = useState([])
@@ -45,7 +46,7 @@ const Study = ({ user }) => {
     setIsLoading(true)
     try {
       // Buscar cards para estudo
-      const cardsResponse = await fetch(`/api/cards/study?user_id=${user.id}&limit=20`)
+      const cardsResponse = await fetch(`/api/cards/study?limit=20`, { headers: authHeaders() })
       if (!cardsResponse.ok) throw new Error('Erro ao buscar cards')
       
       const studyCards = await cardsResponse.json()
@@ -58,9 +59,8 @@ const Study = ({ user }) => {
       // Iniciar sessão de estudo
       const sessionResponse = await fetch('/api/study/start', {
         method: 'POST',
-        headers: { 'Content-Type': 'application/json' },
+        headers: authHeaders({ 'Content-Type': 'application/json' }),
         body: JSON.stringify({
-          user_id: user.id,
           session_type: 'study'
         })
       })
@@ -92,9 +92,8 @@ const Study = ({ user }) => {
     try {
       await fetch('/api/study/answer', {
         method: 'POST',
-        headers: { 'Content-Type': 'application/json' },
+        headers: authHeaders({ 'Content-Type': 'application/json' }),
         body: JSON.stringify({
-          user_id: user.id,
           card_id: currentCard.id,
           session_id: studySession.id,
           is_correct: isCorrect,
@@ -136,7 +135,7 @@ const Study = ({ user }) => {
     try {
       await fetch('http://localhost:5000/api/study/end', {
         method: 'POST',
-        headers: { 'Content-Type': 'application/json' },
+        headers: authHeaders({ 'Content-Type': 'application/json' }),
         body: JSON.stringify({
           session_id: studySession.id
         })
@@ -0,0 +1,23 @@
+#!/usr/bin/env python3
+import os
+import sys
+sys.path.insert(0, os.path.dirname(__file__))
+
+from src.main import app, db
+from src.models.daily_stats import DailyUserStats
+
+def backfill_stats(user_id=None):
+    with app.app_context():
+        db.create_all()
+        
+        # Recalcular os agregados diários a partir do histórico de revisões
+        total = DailyUserStats.rebuild(user_id=user_id)
+        db.session.commit()
+        
+        if user_id is None:
+            print(f"Estatísticas diárias reconstruídas: {total} linhas")
+        else:
+            print(f"Estatísticas diárias do usuário {user_id} reconstruídas: {total} linhas")
+
+if __name__ == '__main__':
+    backfill_stats(int(sys.argv[1]) if len(sys.argv) > 1 else None)
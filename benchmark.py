@@ -0,0 +1,312 @@
+#!/usr/bin/env python3
+"""Benchmark dos fluxos principais (estudo, respostas, relatórios, listagem, importação).
+
+Uso:
+    python benchmark.py --database /tmp/bench.db --seed-users 10        # offline, via test client
+    python benchmark.py --url http://localhost:5000 --username ana --password ...  # contra um servidor local
+    python benchmark.py --compare main.json minha-branch.json           # compara dois resultados
+
+Mede p50/p90/p99 e vazão de cada cenário e grava o resultado em JSON
+(benchmarks/<branch>-<commit>-<data>.json) para comparar branches.
+"""
+import argparse
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+import urllib.error
+import urllib.request
+sys.path.insert(0, os.path.dirname(__file__))
+
+RESULTS_DIR = os.path.join(os.path.dirname(__file__), 'benchmarks')
+
+class TestClientTransport:
+    """Requisições em processo pelo test client do Flask (sem rede)"""
+
+    def __init__(self, app):
+        self.app = app
+
+    def request(self, method, path, body=None, token=None):
+        client = self.app.test_client()
+        headers = {'Authorization': f'Bearer {token}'} if token else {}
+        response = client.open(path, method=method, json=body, headers=headers)
+        return response.status_code, response.get_json(silent=True)
+
+class HttpTransport:
+    """Requisições HTTP contra um servidor já em execução"""
+
+    def __init__(self, base_url):
+        self.base_url = base_url.rstrip('/')
+
+    def request(self, method, path, body=None, token=None):
+        data = json.dumps(body).encode('utf-8') if body is not None else None
+        headers = {'Content-Type': 'application/json'}
+        if token:
+            headers['Authorization'] = f'Bearer {token}'
+        request = urllib.request.Request(self.base_url + path, data=data, method=method, headers=headers)
+        try:
+            with urllib.request.urlopen(request, timeout=60) as response:
+                payload = response.read()
+                status = response.status
+        except urllib.error.HTTPError as error:
+            payload = error.read()
+            status = error.code
+        try:
+            return status, json.loads(payload) if payload else None
+        except ValueError:
+            return status, None
+
+def percentile(sorted_values, fraction):
+    """Percentil pelo método nearest-rank"""
+    if not sorted_values:
+        return None
+    index = max(0, min(len(sorted_values) - 1, int(round(fraction * len(sorted_values) + 0.5)) - 1))
+    return sorted_values[index]
+
+def build_scenarios(context):
+    """Cenários: nome -> função(i) que retorna (método, caminho, corpo, token)"""
+    token = context['token']
+    admin_token = context.get('admin_token')
+    category_id = context.get('category_id')
+    card_ids = context.get('card_ids') or [0]
+    session_id = context.get('session_id')
+
+    def answer_body(i):
+        return {'card_id': card_ids[i % len(card_ids)], 'session_id': session_id,
+                'is_correct': i % 3 != 0, 'response_time': 5 + i % 20, 'difficulty_rating': 1 + i % 5}
+
+    scenarios = {
+        'study_start': lambda i: ('POST', '/api/study/start', {'session_type': 'study'}, token),
+        'study_answer': lambda i: ('POST', '/api/study/answer', answer_body(i), token),
+        'study_answers_batch': lambda i: ('POST', '/api/study/answers/batch', {
+            'session_id': session_id,
+            'answers': [dict(answer_body(i * 10 + n), idempotency_key=f'bench-{context["run_id"]}-{i}-{n}')
+                        for n in range(10)]
+        }, token),
+        'reports_performance': lambda i: ('GET', '/api/reports/performance?days=30', None, token),
+        'reports_progress': lambda i: ('GET', '/api/reports/progress?days=30', None, token),
+        'cards_due': lambda i: ('GET', '/api/cards/due?limit=20', None, token),
+        'cards_page': lambda i: ('GET', '/api/cards/page?limit=50', None, token),
+        'categories': lambda i: ('GET', '/api/categories', None, token),
+        'question_list_import': lambda i: ('POST', '/api/question-lists/upload-text', {
+            'name': f'Benchmark {context["run_id"]} #{i}',
+            'category_id': category_id,
+            'questions_text': '\n'.join(
+                f'{n + 1}. Pergunta sintética {i}-{n} sobre fisiologia cardiovascular?' for n in range(200)
+            )
+        }, admin_token),
+    }
+    if session_id is None:
+        # Sem sessão de estudo não há como registrar respostas
+        scenarios.pop('study_answer')
+        scenarios.pop('study_answers_batch')
+    if admin_token is None:
+        # A importação de listas é restrita a administradores
+        scenarios.pop('question_list_import')
+    return scenarios
+
+def run_scenario(transport, build, iterations, warmup, concurrency):
+    for i in range(warmup):
+        transport.request(*build(-1 - i))
+
+    def timed(i):
+        start = time.perf_counter()
+        status, _ = transport.request(*build(i))
+        return time.perf_counter() - start, status
+
+    started = time.perf_counter()
+    if concurrency > 1:
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            samples = list(executor.map(timed, range(iterations)))
+    else:
+        samples = [timed(i) for i in range(iterations)]
+    wall = time.perf_counter() - started
+
+    latencies = sorted(elapsed for elapsed, _ in samples)
+    statuses = {}
+    for _, status in samples:
+        statuses[str(status)] = statuses.get(str(status), 0) + 1
+    errors = sum(count for status, count in statuses.items() if int(status) >= 400)
+    return {
+        'iterations': iterations,
+        'concurrency': concurrency,
+        'p50_ms': round(percentile(latencies, 0.50) * 1000, 3),
+        'p90_ms': round(percentile(latencies, 0.90) * 1000, 3),
+        'p99_ms': round(percentile(latencies, 0.99) * 1000, 3),
+        'mean_ms': round(sum(latencies) / len(latencies) * 1000, 3),
+        'max_ms': round(latencies[-1] * 1000, 3),
+        'throughput_rps': round(iterations / wall, 2) if wall else None,
+        'statuses': statuses,
+        'errors': errors,
+        # Rota inexistente nesta versão: o número não deve entrar em comparações
+        'unavailable': statuses.get('404', 0) + statuses.get('405', 0) == iterations
+    }
+
+def local_context(app, db):
+    """Usuário, categoria, cards e sessão do banco local (o mais populado)"""
+    from src.models.user import User
+    from src.models.category import Category
+    from src.models.card import Card
+    from src.models.study import StudySession, CardReview
+    from src.utils.auth_tokens import issue_token
+
+    with app.app_context():
+        user_id = db.session.query(Card.user_id).group_by(Card.user_id).order_by(
+            db.func.count(Card.id).desc()
+        ).limit(1).scalar()
+        if user_id is None:
+            return None
+        admin = User.query.filter_by(is_admin=True).first()
+        category = Category.query.filter_by(user_id=user_id).first()
+        card_ids = [row[0] for row in db.session.query(Card.id).filter(Card.user_id == user_id).limit(500).all()]
+        dataset = {
+            'users': db.session.query(db.func.count(User.id)).scalar(),
+            'cards': db.session.query(db.func.count(Card.id)).scalar(),
+            'reviews': db.session.query(db.func.count(CardReview.id)).scalar()
+        }
+        session = StudySession(user_id=user_id, session_type='study')
+        db.session.add(session)
+        db.session.commit()
+        return {'token': issue_token(db.session.get(User, user_id)),
+                'admin_token': issue_token(admin) if admin else None,
+                'category_id': category.id if category else None, 'card_ids': card_ids, 'session_id': session.id,
+                'dataset': dataset}
+
+def login(transport, username, password):
+    """Token de acesso via /api/auth/login"""
+    status, body = transport.request('POST', '/api/auth/login', {'username': username, 'password': password})
+    if status != 200 or not body:
+        raise SystemExit(f'Falha no login de {username}: {status} {(body or {}).get("error")}')
+    return body['access_token']
+
+def remote_context(transport, token, admin_token=None):
+    """Descobre categoria, cards e sessão pela própria API"""
+    context = {'token': token, 'admin_token': admin_token}
+    status, categories = transport.request('GET', '/api/categories', token=token)
+    if status == 200 and categories:
+        context['category_id'] = categories[0]['id']
+    status, page = transport.request('GET', '/api/cards/page?fields=id&limit=500', token=token)
+    if status == 200 and page:
+        context['card_ids'] = [card['id'] for card in page.get('cards', [])]
+    status, session = transport.request('POST', '/api/study/start', {'session_type': 'study'}, token=token)
+    if status in (200, 201) and session:
+        context['session_id'] = session.get('id') or (session.get('session') or {}).get('id')
+    return context
+
+def git_info():
+    def git(*args):
+        try:
+            return subprocess.run(['git', *args], capture_output=True, text=True, timeout=5,
+                                  cwd=os.path.dirname(os.path.abspath(__file__))).stdout.strip() or None
+        except (OSError, subprocess.SubprocessError):
+            return None
+    return {'branch': git('rev-parse', '--abbrev-ref', 'HEAD'), 'commit': git('rev-parse', '--short', 'HEAD')}
+
+def compare(baseline_path, candidate_path):
+    with open(baseline_path) as f:
+        baseline = json.load(f)
+    with open(candidate_path) as f:
+        candidate = json.load(f)
+    print(f"{'cenário':<24}{'p50 (ms)':>26}{'p99 (ms)':>26}{'req/s':>26}")
+    for name, result in candidate['results'].items():
+        before = baseline['results'].get(name)
+        if not before or before.get('unavailable') or result.get('unavailable'):
+            continue
+
+        def cell(key):
+            old, new = before.get(key), result.get(key)
+            if not old or new is None:
+                return f'{new}'
+            return f'{old:.1f} → {new:.1f} ({(new - old) / old * 100:+.0f}%)'
+        print(f"{name:<24}{cell('p50_ms'):>26}{cell('p99_ms'):>26}{cell('throughput_rps'):>26}")
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Benchmark dos endpoints do MedCards')
+    parser.add_argument('--url', help='servidor já em execução (senão usa o test client)')
+    parser.add_argument('--database', help='arquivo SQLite do benchmark offline (DATABASE_URL)')
+    parser.add_argument('--username', help='usuário usado contra --url')
+    parser.add_argument('--password', help='senha de --username')
+    parser.add_argument('--admin-username', help='administrador para o cenário de importação (--url)')
+    parser.add_argument('--admin-password', help='senha de --admin-username')
+    parser.add_argument('--seed-users', type=int, default=5, help='usuários gerados se o banco estiver vazio')
+    parser.add_argument('--seed-cards', type=int, default=2000)
+    parser.add_argument('--seed-reviews', type=int, default=5000)
+    parser.add_argument('--iterations', type=int, default=200)
+    parser.add_argument('--warmup', type=int, default=10)
+    parser.add_argument('--concurrency', type=int, default=1)
+    parser.add_argument('--scenario', action='append', help='roda só os cenários informados')
+    parser.add_argument('--output', help='arquivo JSON de saída')
+    parser.add_argument('--compare', nargs=2, metavar=('BASE', 'NOVO'), help='compara dois resultados')
+    args = parser.parse_args(argv)
+
+    if args.compare:
+        compare(*args.compare)
+        return 0
+
+    dataset = None
+    if args.url:
+        if not args.username or not args.password:
+            parser.error('--username e --password são obrigatórios com --url')
+        transport = HttpTransport(args.url)
+        admin_token = None
+        if args.admin_username:
+            admin_token = login(transport, args.admin_username, args.admin_password or '')
+        context = remote_context(transport, login(transport, args.username, args.password), admin_token)
+    else:
+        if args.database:
+            os.environ['DATABASE_URL'] = f'sqlite:///{os.path.abspath(args.database)}'
+        from src.main import app, db
+        context = local_context(app, db)
+        if context is None:
+            import seed_synthetic
+            seed_synthetic.generate(users=args.seed_users, cards=args.seed_cards, reviews=args.seed_reviews)
+            context = local_context(app, db)
+        dataset = context.pop('dataset')
+        transport = TestClientTransport(app)
+
+    context['run_id'] = datetime.utcnow().strftime('%Y%m%d%H%M%S')
+    scenarios = build_scenarios(context)
+    if args.scenario:
+        scenarios = {name: build for name, build in scenarios.items() if name in args.scenario}
+
+    results = {}
+    for name, build in scenarios.items():
+        results[name] = run_scenario(transport, build, args.iterations, args.warmup, args.concurrency)
+        result = results[name]
+        note = ' (rota indisponível)' if result['unavailable'] else ''
+        print(f"{name:<24} p50 {result['p50_ms']:>9.2f} ms  p99 {result['p99_ms']:>9.2f} ms  "
+              f"{result['throughput_rps']:>9.1f} req/s  erros {result['errors']}{note}")
+
+    info = git_info()
+    report = {
+        'meta': {
+            'timestamp': datetime.utcnow().isoformat(),
+            'git_branch': info['branch'],
+            'git_commit': info['commit'],
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'mode': 'http' if args.url else 'test_client',
+            'url': args.url,
+            'dataset': dataset,
+            'iterations': args.iterations,
+            'warmup': args.warmup,
+            'concurrency': args.concurrency
+        },
+        'results': results
+    }
+    output = args.output
+    if not output:
+        os.makedirs(RESULTS_DIR, exist_ok=True)
+        branch = (info['branch'] or 'local').replace('/', '-')
+        output = os.path.join(RESULTS_DIR, f"{branch}-{info['commit'] or 'nogit'}-{context['run_id']}.json")
+    with open(output, 'w') as f:
+        json.dump(report, f, indent=2, ensure_ascii=False)
+    print(f"Resultado salvo em {output}")
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,42 @@
+#!/usr/bin/env python3
+"""Aplica as migrações de schema pendentes e verifica os planos das consultas.
+
+Uso:
+    python migrate.py            # aplica as migrações pendentes
+    python migrate.py --status   # lista as migrações pendentes
+    python migrate.py --check    # EXPLAIN QUERY PLAN das consultas quentes (sai com 1 se houver SCAN)
+"""
+import os
+import sys
+sys.path.insert(0, os.path.dirname(__file__))
+
+from src.main import app
+from src.models.migrations import run_migrations, pending_migrations, check_query_plans
+
+def main(argv):
+    with app.app_context():
+        if '--status' in argv:
+            pending = pending_migrations()
+            for version, description in pending:
+                print(f"pendente: {version} - {description}")
+            if not pending:
+                print("Schema em dia.")
+            return 0
+
+        if '--check' in argv:
+            offenders = check_query_plans()
+            for name, plan in offenders.items():
+                print(f"Varredura completa em '{name}':")
+                for detail in plan:
+                    print(f"    {detail}")
+            if offenders:
+                return 1
+            print("Todas as consultas quentes usam índice.")
+            return 0
+
+        applied = run_migrations()
+        print(f"Migrações aplicadas: {', '.join(applied)}" if applied else "Nenhuma migração pendente.")
+        return 0
+
+if __name__ == '__main__':
+    sys.exit(main(sys.argv[1:]))
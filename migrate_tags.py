@@ -0,0 +1,22 @@
+#!/usr/bin/env python3
+import os
+import sys
+sys.path.insert(0, os.path.dirname(__file__))
+
+from src.main import app, db
+from src.models.tag import Tag
+
+def migrate_tags():
+    with app.app_context():
+        # Criar as tabelas tag e card_tag se ainda não existirem
+        db.create_all()
+        
+        # A migração 0004 já faz isso na inicialização; aqui é refeito sob demanda
+        # (ex: depois de importar cards direto no banco)
+        total = Tag.backfill()
+        db.session.commit()
+        
+        print(f"Tags migradas de {total} cards")
+
+if __name__ == '__main__':
+    migrate_tags()
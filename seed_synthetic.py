@@ -0,0 +1,237 @@
+#!/usr/bin/env python3
+"""Gera um banco sintético realista para testes de carga.
+
+Uso:
+    DATABASE_URL=sqlite:////tmp/bench.db python seed_synthetic.py --users 20 --cards 5000 --reviews 20000
+
+Os números de categorias, temas, cards e revisões são por usuário. O primeiro
+usuário criado é administrador (necessário para importar listas de perguntas).
+"""
+import argparse
+from datetime import datetime, timedelta
+import json
+import os
+import random
+import sys
+sys.path.insert(0, os.path.dirname(__file__))
+
+from src.main import app, db
+from src.models.user import User
+from src.models.category import Category, Theme
+from src.models.card import Card
+from src.models.study import StudySession, CardReview
+from src.models.question_list import QuestionList, PresetQuestion
+from src.models.daily_stats import DailyUserStats
+from src.utils.bulk_insert import insert_returning_ids
+from werkzeug.security import generate_password_hash
+
+BATCH_SIZE = 2000
+REVIEWS_PER_SESSION = 20
+
+SPECIALTIES = {
+    'Anatomia': ['Membro superior', 'Membro inferior', 'Tórax', 'Abdome', 'Cabeça e pescoço', 'Neuroanatomia'],
+    'Fisiologia': ['Cardiovascular', 'Respiratória', 'Renal', 'Endócrina', 'Digestiva', 'Neurofisiologia'],
+    'Farmacologia': ['Antibióticos', 'Anti-hipertensivos', 'Analgésicos', 'Anticoagulantes', 'Psicofármacos'],
+    'Patologia': ['Inflamação', 'Neoplasias', 'Distúrbios hemodinâmicos', 'Imunopatologia'],
+    'Cardiologia': ['Insuficiência cardíaca', 'Arritmias', 'Síndromes coronarianas', 'Valvopatias'],
+    'Pediatria': ['Neonatologia', 'Crescimento e desenvolvimento', 'Imunização', 'Doenças exantemáticas'],
+    'Microbiologia': ['Bactérias gram-positivas', 'Bactérias gram-negativas', 'Vírus', 'Fungos', 'Parasitas'],
+    'Clínica Médica': ['Diabetes', 'Hipertensão', 'Pneumonias', 'Doença renal crônica', 'Hepatopatias'],
+}
+
+TERMS = [
+    'nervo mediano', 'artéria coronária direita', 'músculo deltoide', 'néfron', 'alvéolo pulmonar',
+    'insulina', 'cortisol', 'amoxicilina', 'losartana', 'varfarina', 'heparina', 'digoxina',
+    'fibrilação atrial', 'infarto agudo do miocárdio', 'estenose aórtica', 'sarampo', 'varicela',
+    'Staphylococcus aureus', 'Escherichia coli', 'Candida albicans', 'cetoacidose diabética',
+    'cirrose hepática', 'síndrome nefrótica', 'tromboembolismo pulmonar', 'meningite bacteriana',
+    'plexo braquial', 'ventrículo esquerdo', 'glomérulo', 'hipotálamo', 'tireoide',
+]
+
+QUESTION_TEMPLATES = [
+    'Qual é a principal função do(a) {term}?',
+    'Qual o mecanismo de ação relacionado a {term}?',
+    'Cite as principais manifestações clínicas associadas a {term}.',
+    'Qual o tratamento de primeira linha envolvendo {term}?',
+    'Como se faz o diagnóstico diferencial de {term}?',
+    'Qual a inervação/irrigação relacionada a {term}?',
+    'Quais os efeitos adversos mais comuns de {term}?',
+]
+
+ANSWER_TEMPLATES = [
+    '{term}: atua principalmente na regulação de {other}, com repercussão sobre {third}.',
+    'Relaciona-se a {other}; na prática clínica, avaliar {third} e sinais associados.',
+    'Primeira linha: abordagem de {other}. Monitorar {third}.',
+]
+
+def _question(rng, serial):
+    term = rng.choice(TERMS)
+    question = rng.choice(QUESTION_TEMPLATES).format(term=term)
+    answer = rng.choice(ANSWER_TEMPLATES).format(term=term, other=rng.choice(TERMS), third=rng.choice(TERMS))
+    # O sufixo garante textos distintos mesmo com poucos termos
+    return f'{question} (#{serial})', answer
+
+def _batches(rows, size=BATCH_SIZE):
+    for start in range(0, len(rows), size):
+        yield rows[start:start + size]
+
+def generate(users=10, categories=5, themes=4, cards=1000, reviews=3000, days=90,
+             question_lists=3, questions_per_list=200, seed=42):
+    """Gera os dados e retorna um resumo com os ids criados.
+
+    Os inserts usam executemany em lotes (Core), com um commit por usuário.
+    Os agregados diários são reconstruídos no final a partir das revisões.
+    """
+    rng = random.Random(seed)
+    now = datetime.utcnow()
+    password_hash = generate_password_hash('bench123')
+    summary = {'users': [], 'cards': 0, 'reviews': 0, 'question_lists': []}
+
+    with app.app_context():
+        db.create_all()
+        tag_pool = ['revisão', 'prova', 'residência', 'alto rendimento', 'difícil', 'favorita']
+        offset = db.session.query(db.func.count(User.id)).scalar()
+
+        for n in range(users):
+            username = f'bench{offset + n + 1}'
+            user_id = insert_returning_ids(User.__table__, [{
+                'username': username,
+                'email': f'{username}@medcards.test',
+                'password_hash': password_hash,
+                'is_admin': offset + n == 0,
+                'created_at': now - timedelta(days=days)
+            }])[0]
+
+            specialties = rng.sample(sorted(SPECIALTIES), min(categories, len(SPECIALTIES)))
+            category_ids = insert_returning_ids(Category.__table__, [
+                {'user_id': user_id, 'name': name, 'color': '#2E86AB', 'icon': '📚', 'created_at': now}
+                for name in specialties
+            ])
+            theme_rows = []
+            for category_id, name in zip(category_ids, specialties):
+                for theme_name in SPECIALTIES[name][:themes]:
+                    theme_rows.append({'category_id': category_id, 'name': theme_name, 'created_at': now})
+            theme_ids = insert_returning_ids(Theme.__table__, theme_rows)
+            themes_by_category = {}
+            for theme_id, row in zip(theme_ids, theme_rows):
+                themes_by_category.setdefault(row['category_id'], []).append(theme_id)
+
+            card_ids = []
+            card_rows = []
+            for serial in range(cards):
+                question, answer = _question(rng, serial)
+                category_id = rng.choice(category_ids)
+                created_at = now - timedelta(days=rng.uniform(0, days), seconds=serial)
+                review_count = rng.randint(0, 12)
+                tags = rng.sample(tag_pool, rng.randint(0, 2))
+                card_rows.append({
+                    'user_id': user_id,
+                    'category_id': category_id,
+                    'theme_id': rng.choice(themes_by_category.get(category_id) or [None]),
+                    'question': question,
+                    'answer': answer,
+                    'difficulty': rng.choice(('easy', 'medium', 'medium', 'hard')),
+                    'tags': json.dumps(tags) if tags else None,
+                    'created_at': created_at,
+                    'updated_at': created_at,
+                    'next_review': now + timedelta(days=rng.uniform(-10, 30)),
+                    'review_count': review_count,
+                    'ease_factor': round(rng.uniform(1.3, 2.8), 2)
+                })
+            for batch in _batches(card_rows):
+                ids = Card.bulk_create(batch)
+                if ids is None:
+                    ids = [row[0] for row in db.session.query(Card.id).filter(
+                        Card.user_id == user_id).order_by(Card.id.desc()).limit(len(batch)).all()][::-1]
+                card_ids.extend(ids)
+
+            # Revisões agrupadas em sessões de estudo espalhadas pelo período
+            review_times = sorted(now - timedelta(days=rng.uniform(0, days)) for _ in range(reviews if card_ids else 0))
+            session_rows = []
+            for start in range(0, len(review_times), REVIEWS_PER_SESSION):
+                chunk = review_times[start:start + REVIEWS_PER_SESSION]
+                session_rows.append({
+                    'user_id': user_id,
+                    'started_at': chunk[0],
+                    'ended_at': chunk[-1] + timedelta(minutes=1),
+                    'total_cards': len(chunk),
+                    'correct_answers': 0,
+                    'session_type': 'study'
+                })
+            session_ids = []
+            for batch in _batches(session_rows):
+                session_ids.extend(insert_returning_ids(StudySession.__table__, batch))
+
+            review_rows = []
+            correct_by_session = [0] * len(session_ids)
+            for index, reviewed_at in enumerate(review_times):
+                session_index = index // REVIEWS_PER_SESSION
+                is_correct = rng.random() < 0.7
+                correct_by_session[session_index] += is_correct
+                review_rows.append({
+                    'user_id': user_id,
+                    'card_id': rng.choice(card_ids),
+                    'session_id': session_ids[session_index],
+                    'is_correct': is_correct,
+                    'response_time': rng.randint(2, 60),
+                    'difficulty_rating': rng.randint(1, 5),
+                    'reviewed_at': reviewed_at
+                })
+            for batch in _batches(review_rows):
+                db.session.execute(CardReview.__table__.insert(), batch)
+            if session_ids:
+                db.session.execute(
+                    StudySession.__table__.update().where(
+                        StudySession.__table__.c.id == db.bindparam('session_id')
+                    ).values(correct_answers=db.bindparam('correct')),
+                    [{'session_id': session_id, 'correct': correct}
+                     for session_id, correct in zip(session_ids, correct_by_session)]
+                )
+
+            db.session.commit()
+            summary['users'].append({'id': user_id, 'username': username, 'category_ids': category_ids})
+            summary['cards'] += len(card_ids)
+            summary['reviews'] += len(review_rows)
+
+        admin_id = summary['users'][0]['id'] if summary['users'] else None
+        for n in range(question_lists if admin_id else 0):
+            list_id = insert_returning_ids(QuestionList.__table__, [{
+                'name': f'Lista sintética {offset + n + 1}',
+                'description': 'Gerada para testes de carga',
+                'created_by': admin_id,
+                'is_active': True,
+                'created_at': now,
+                'updated_at': now
+            }])[0]
+            db.session.execute(PresetQuestion.__table__.insert(), [
+                {'question_list_id': list_id, 'question_text': _question(rng, serial)[0],
+                 'order_index': (serial + 1) * 100, 'created_at': now}
+                for serial in range(questions_per_list)
+            ])
+            summary['question_lists'].append(list_id)
+
+        DailyUserStats.rebuild()
+        db.session.commit()
+    return summary
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Gera dados sintéticos para testes de carga')
+    parser.add_argument('--users', type=int, default=10)
+    parser.add_argument('--categories', type=int, default=5, help='categorias por usuário')
+    parser.add_argument('--themes', type=int, default=4, help='temas por categoria')
+    parser.add_argument('--cards', type=int, default=1000, help='cards por usuário')
+    parser.add_argument('--reviews', type=int, default=3000, help='revisões por usuário')
+    parser.add_argument('--days', type=int, default=90, help='período coberto pelas revisões')
+    parser.add_argument('--question-lists', type=int, default=3)
+    parser.add_argument('--questions-per-list', type=int, default=200)
+    parser.add_argument('--seed', type=int, default=42)
+    args = parser.parse_args(argv)
+
+    summary = generate(users=args.users, categories=args.categories, themes=args.themes, cards=args.cards,
+                       reviews=args.reviews, days=args.days, question_lists=args.question_lists,
+                       questions_per_list=args.questions_per_list, seed=args.seed)
+    print(f"Usuários: {len(summary['users'])}, cards: {summary['cards']}, revisões: {summary['reviews']}, "
+          f"listas: {len(summary['question_lists'])}")
+
+if __name__ == '__main__':
+    main()
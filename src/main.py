@@ -0,0 +1,133 @@
+import os
+import sys
+# DON'T CHANGE THIS !!!
+sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
+
+from flask import Flask, send_from_directory
+from flask_cors import CORS
+from src.models.user import db
+from src.routes.user import user_bp
+from src.routes.auth import auth_bp
+from src.routes.categories import categories_bp
+from src.routes.cards import cards_bp
+from src.routes.study import study_bp
+from src.routes.question_lists import question_lists_bp
+from src.routes.jobs import jobs_bp
+from src.routes.study_answers import study_answers_bp
+from src.routes.search import search_bp
+from src.routes.metrics import metrics_bp
+from src.routes.user_data import user_data_bp
+from src.routes.anki_import import anki_import_bp
+from src.routes.reports import reports_bp
+from src.models.search_index import ensure_search_index
+from src.models.migrations import run_migrations
+from src.models.due_queue import due_queue
+from src.utils.job_runner import job_runner
+from src.utils.response_cache import response_cache, track_user_writes
+from src.utils.db_config import configure_database, install_pragmas
+from src.utils.instrumentation import metrics
+from src.utils import auth_tokens
+from src.utils.passwords import password_hasher
+from src.utils.write_buffer import write_buffer
+from src.utils.fast_json import FastJSONProvider
+
+# Importar todos os modelos para garantir que sejam criados
+from src.models.user import User
+from src.models.category import Category, Theme
+from src.models.card import Card
+from src.models.study import StudySession, CardReview, StudyGoal, AnswerReceipt
+from src.models.question_list import QuestionList, PresetQuestion
+from src.models.job import Job
+from src.models.daily_stats import DailyUserStats
+from src.models.tag import Tag
+
+app = Flask(__name__, static_folder=os.path.join(os.path.dirname(__file__), 'static'))
+app.config['SECRET_KEY'] = 'medcards-secret-key-2024'
+
+# jsonify/get_json com orjson quando instalado (datas serializadas nativamente)
+app.json = FastJSONProvider(app)
+
+# Habilitar CORS para todas as rotas
+CORS(app)
+
+# Registrar blueprints
+app.register_blueprint(auth_bp, url_prefix='/api/auth')
+app.register_blueprint(user_bp, url_prefix='/api')
+app.register_blueprint(categories_bp, url_prefix='/api')
+app.register_blueprint(cards_bp, url_prefix='/api')
+app.register_blueprint(study_bp, url_prefix='/api')
+app.register_blueprint(question_lists_bp, url_prefix='/api')
+app.register_blueprint(jobs_bp, url_prefix='/api')
+app.register_blueprint(study_answers_bp, url_prefix='/api')
+app.register_blueprint(search_bp, url_prefix='/api')
+app.register_blueprint(user_data_bp, url_prefix='/api')
+app.register_blueprint(anki_import_bp, url_prefix='/api')
+app.register_blueprint(reports_bp, url_prefix='/api')
+app.register_blueprint(metrics_bp)
+
+# Configuração do banco de dados
+# URIs vêm do ambiente (DATABASE_URL / DATABASE_READ_URL); padrão é o SQLite local
+configure_database(app, os.path.join(os.path.dirname(__file__), 'database', 'app.db'))
+app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
+db.init_app(app)
+install_pragmas(app, db)
+with app.app_context():
+    db.create_all()
+    # Índices e alterações de schema em bancos já existentes
+    run_migrations()
+    # Índice de busca textual (FTS5, apenas SQLite)
+    ensure_search_index()
+
+# Cache de respostas por usuário ('memory' em dev, 'sqlite' compartilhado entre workers em produção)
+app.config['RESPONSE_CACHE_BACKEND'] = os.environ.get('MEDCARDS_CACHE_BACKEND', 'memory')
+app.config['RESPONSE_CACHE_TTL'] = int(os.environ.get('MEDCARDS_CACHE_TTL', 60))
+response_cache.init_app(app)
+
+# Escritas feitas pelo ORM invalidam o cache do usuário afetado após o commit
+track_user_writes(Card, lambda connection, target: target.user_id)
+track_user_writes(Category, lambda connection, target: target.user_id)
+track_user_writes(Theme, lambda connection, target: connection.execute(
+    db.select(Category.__table__.c.user_id).where(Category.__table__.c.id == target.category_id)
+).scalar())
+track_user_writes(CardReview, lambda connection, target: target.user_id)
+track_user_writes(StudySession, lambda connection, target: target.user_id)
+
+# Latência, SQL por requisição e alertas de N+1 (/metrics e cabeçalho Server-Timing)
+app.config['METRICS_TOKEN'] = os.environ.get('MEDCARDS_METRICS_TOKEN')
+metrics.init_app(app)
+
+# Tokens de acesso assinados, cache de principais e pool limitado de hashing de senha
+auth_tokens.init_app(app)
+password_hasher.init_app(app)
+
+# Buffer write-behind de last_login (gravado a cada
+# WRITE_BUFFER_INTERVAL segundos e no encerramento do processo)
+app.config['WRITE_BUFFER_INTERVAL'] = float(os.environ.get('MEDCARDS_WRITE_BUFFER_INTERVAL', 2.0))
+write_buffer.init_app(app)
+
+# Fila de revisão em memória (só com um único worker: MEDCARDS_DUE_QUEUE=1)
+due_queue.init_app(app)
+
+# Executor de tarefas em segundo plano (importações do admin)
+job_runner.init_app(app)
+job_runner.resume_pending()
+
+@app.route('/', defaults={'path': ''})
+@app.route('/<path:path>')
+def serve(path):
+    static_folder_path = app.static_folder
+    if static_folder_path is None:
+            return "Static folder not configured", 404
+
+    if path != "" and os.path.exists(os.path.join(static_folder_path, path)):
+        return send_from_directory(static_folder_path, path)
+    else:
+        index_path = os.path.join(static_folder_path, 'index.html')
+        if os.path.exists(index_path):
+            return send_from_directory(static_folder_path, 'index.html')
+        else:
+            return "index.html not found", 404
+
+
+if __name__ == '__main__':
+    app.run(host='0.0.0.0', port=5000, debug=True)
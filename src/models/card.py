@@ -0,0 +1,232 @@
+from datetime import datetime, timedelta
+import json
+from src.models.user import db
+from src.models.due_queue import due_queue
+from src.models.tag import Tag, card_tag
+from src.utils.bulk_insert import insert_returning_ids
+from src.utils.fast_json import row_encoder
+
+class Card(db.Model):
+    __table_args__ = (
+        # Fila de revisão: WHERE user_id = ? AND next_review <= ? ORDER BY next_review, id
+        db.Index('ix_card_user_next_review', 'user_id', 'next_review', 'id'),
+        # Listagem paginada: WHERE user_id = ? ORDER BY created_at, id
+        db.Index('ix_card_user_created_at', 'user_id', 'created_at', 'id'),
+        # Contagens agrupadas por categoria/tema
+        db.Index('ix_card_category_id', 'category_id'),
+        db.Index('ix_card_theme_id', 'theme_id'),
+    )
+
+    # Campos aceitos na projeção de GET /api/cards (mesmas chaves de to_dict)
+    FIELDS = ('id', 'user_id', 'category_id', 'theme_id', 'question', 'answer', 'difficulty', 'tags',
+              'created_at', 'updated_at', 'next_review', 'review_count', 'ease_factor')
+    DATETIME_FIELDS = ('created_at', 'updated_at', 'next_review')
+
+    id = db.Column(db.Integer, primary_key=True)
+    user_id = db.Column(db.Integer, db.ForeignKey('user.id'), nullable=False)
+    category_id = db.Column(db.Integer, db.ForeignKey('category.id'), nullable=False)
+    theme_id = db.Column(db.Integer, db.ForeignKey('theme.id'), nullable=True)
+    question = db.Column(db.Text, nullable=False)
+    answer = db.Column(db.Text, nullable=False)
+    difficulty = db.Column(db.Enum('easy', 'medium', 'hard', name='difficulty_enum'), default='medium')
+    tags = db.Column(db.Text)  # JSON array as string
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    next_review = db.Column(db.DateTime, default=datetime.utcnow)
+    review_count = db.Column(db.Integer, default=0)
+    ease_factor = db.Column(db.Float, default=2.5)  # Para algoritmo de repetição espaçada
+    
+    # Relacionamentos
+    reviews = db.relationship('CardReview', backref='card', lazy=True, cascade='all, delete-orphan')
+
+    def get_tags(self):
+        """Retorna as tags como lista"""
+        if self.tags:
+            try:
+                return json.loads(self.tags)
+            except:
+                return []
+        return []
+    
+    def set_tags(self, tags_list):
+        """Define as tags a partir de uma lista"""
+        self.tags = Card.serialize_tags(tags_list)
+
+    @staticmethod
+    def serialize_tags(tags_list):
+        """Serializa uma lista de tags para o formato da coluna"""
+        return json.dumps(tags_list) if tags_list else None
+    
+    def calculate_next_review(self, is_correct, difficulty_rating):
+        """Calcula a próxima data de revisão baseada no algoritmo de repetição espaçada"""
+        if is_correct:
+            self.review_count += 1
+            if self.review_count == 1:
+                interval = 1  # 1 dia
+            elif self.review_count == 2:
+                interval = 6  # 6 dias
+            else:
+                # Fórmula do SuperMemo SM-2
+                if difficulty_rating >= 3:
+                    self.ease_factor = self.ease_factor + (0.1 - (5 - difficulty_rating) * (0.08 + (5 - difficulty_rating) * 0.02))
+                else:
+                    self.ease_factor = max(1.3, self.ease_factor - 0.2)
+                
+                interval = self.review_count * self.ease_factor
+        else:
+            # Se errou, volta para o início
+            self.review_count = 0
+            interval = 0.01  # ~15 minutos
+            self.ease_factor = max(1.3, self.ease_factor - 0.2)
+        
+        self.next_review = datetime.utcnow() + timedelta(days=interval)
+        return self.next_review
+
+    @classmethod
+    def due_cards(cls, user_id, limit=20, after=None, now=None, use_queue=False):
+        """Busca cards vencidos do usuário em ordem de (next_review, id).
+
+        `after` é o cursor (next_review, id) do último card da página anterior
+        (paginação por chave). Com `use_queue` (e a fila ligada), a primeira
+        página é servida pelo heap em memória do usuário, carregado do índice
+        na primeira chamada; os cards lidos são conferidos contra next_review.
+        """
+        now = now or datetime.utcnow()
+
+        if use_queue and due_queue.enabled and after is None:
+            if not due_queue.has(user_id):
+                rows = db.session.query(cls.id, cls.next_review).filter(cls.user_id == user_id).all()
+                due_queue.load(user_id, rows)
+            due = due_queue.peek_due(user_id, now, limit)
+            if due is not None:
+                ids = [card_id for _, card_id in due]
+                cards = {card.id: card for card in cls.query.filter(cls.id.in_(ids)).all()} if ids else {}
+                result = [cards[card_id] for card_id in ids
+                          if card_id in cards and cards[card_id].next_review and cards[card_id].next_review <= now]
+                if len(result) == len(ids):
+                    return result
+                # Heap desatualizado (escrita de outro worker): recarregar e usar o banco
+                due_queue.invalidate(user_id)
+
+        query = cls.query.filter(cls.user_id == user_id, cls.next_review <= now)
+        if after is not None:
+            after_review, after_id = after
+            query = query.filter(db.or_(
+                cls.next_review > after_review,
+                db.and_(cls.next_review == after_review, cls.id > after_id)
+            ))
+        return query.order_by(cls.next_review, cls.id).limit(limit).all()
+
+    @classmethod
+    def bulk_create(cls, rows):
+        """Insere vários cards com executemany e sincroniza as tags.
+
+        `rows` são dicts com as colunas do card (tags já serializadas).
+        Não faz commit. Retorna os ids inseridos, na ordem de `rows`.
+        """
+        if not rows:
+            return []
+        # Inserts via Core não disparam os eventos do ORM
+        for user_id in {row['user_id'] for row in rows}:
+            due_queue.invalidate_on_commit(db.session, user_id)
+        ids = insert_returning_ids(cls.__table__, rows)
+
+        Tag.sync_cards([(card_id, row['user_id'], json.loads(row['tags']))
+                        for card_id, row in zip(ids, rows) if row.get('tags')])
+        return ids
+
+    @classmethod
+    def page(cls, user_id, fields=None, filters=None, after=None, limit=100):
+        """Página de cards em ordem de (created_at, id), carregando só as colunas pedidas.
+
+        `fields` limita as colunas (id e created_at sempre vêm, por causa do
+        cursor); `filters` aceita category_id, theme_id, difficulty e tag;
+        `after` é o cursor (created_at, id) do último card da página anterior.
+        Retorna linhas (Row) com os atributos pedidos.
+        """
+        fields = [name for name in (fields or cls.FIELDS) if name in cls.FIELDS]
+        columns = [getattr(cls, name) for name in dict.fromkeys(['id', 'created_at'] + fields)]
+        query = db.session.query(*columns).filter(cls.user_id == user_id)
+
+        filters = filters or {}
+        for name in ('category_id', 'theme_id', 'difficulty'):
+            if filters.get(name) is not None:
+                query = query.filter(getattr(cls, name) == filters[name])
+        if filters.get('tag'):
+            query = query.filter(cls.id.in_(Tag.card_ids_query(user_id, filters['tag'])))
+
+        if after is not None:
+            after_created, after_id = after
+            query = query.filter(db.or_(
+                cls.created_at > after_created,
+                db.and_(cls.created_at == after_created, cls.id > after_id)
+            ))
+        return query.order_by(cls.created_at, cls.id).limit(limit).all()
+
+    @staticmethod
+    def parse_tags(value):
+        try:
+            return json.loads(value) if value else []
+        except ValueError:
+            return []
+
+    @classmethod
+    def page_encoder(cls, fields=None):
+        """Função que converte as linhas de page() em dicts no formato de to_dict.
+
+        Trabalha por posição de coluna, sem hidratar objetos; as datas ficam
+        como datetime e são convertidas pelo serializador JSON da aplicação.
+        """
+        fields = [name for name in (fields or cls.FIELDS) if name in cls.FIELDS]
+        selected = list(dict.fromkeys(['id', 'created_at'] + fields))
+        positions = [selected.index(name) for name in fields]
+        encode = row_encoder(fields, {'tags': cls.parse_tags})
+        return lambda row: encode([row[position] for position in positions])
+
+    def __repr__(self):
+        return f'<Card {self.id}: {self.question[:50]}...>'
+
+    def to_dict(self):
+        return {
+            'id': self.id,
+            'user_id': self.user_id,
+            'category_id': self.category_id,
+            'theme_id': self.theme_id,
+            'question': self.question,
+            'answer': self.answer,
+            'difficulty': self.difficulty,
+            'tags': self.get_tags(),
+            'created_at': self.created_at.isoformat() if self.created_at else None,
+            'updated_at': self.updated_at.isoformat() if self.updated_at else None,
+            'next_review': self.next_review.isoformat() if self.next_review else None,
+            'review_count': self.review_count,
+            'ease_factor': self.ease_factor
+        }
+
+
+@db.event.listens_for(Card, 'after_insert')
+@db.event.listens_for(Card, 'after_update')
+def _update_due_queue(mapper, connection, target):
+    session = db.inspect(target).session
+    if session is not None:
+        due_queue.update_on_commit(session, target.user_id, target.id, target.next_review)
+
+@db.event.listens_for(Card, 'after_delete')
+def _remove_from_due_queue(mapper, connection, target):
+    session = db.inspect(target).session
+    if session is not None:
+        due_queue.update_on_commit(session, target.user_id, target.id, None)
+
+@db.event.listens_for(Card, 'after_insert')
+def _insert_card_tags(mapper, connection, target):
+    if target.tags:
+        Tag.sync_cards([(target.id, target.user_id, target.get_tags())], connection=connection)
+
+@db.event.listens_for(Card, 'after_update')
+def _update_card_tags(mapper, connection, target):
+    if db.inspect(target).attrs.tags.history.has_changes():
+        Tag.sync_cards([(target.id, target.user_id, target.get_tags())], connection=connection)
+
+@db.event.listens_for(Card, 'after_delete')
+def _delete_card_tags(mapper, connection, target):
+    connection.execute(card_tag.delete().where(card_tag.c.card_id == target.id))
@@ -0,0 +1,94 @@
+from datetime import datetime
+from src.models.user import db
+from src.models.card import Card
+
+class Category(db.Model):
+    __table_args__ = (
+        db.Index('ix_category_user_id', 'user_id'),
+    )
+
+    id = db.Column(db.Integer, primary_key=True)
+    user_id = db.Column(db.Integer, db.ForeignKey('user.id'), nullable=False)
+    name = db.Column(db.String(100), nullable=False)
+    color = db.Column(db.String(7), default='#2E86AB')  # Hex color
+    icon = db.Column(db.String(50), default='📚')
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    
+    # Relacionamentos
+    themes = db.relationship('Theme', backref='category', lazy=True, cascade='all, delete-orphan')
+    cards = db.relationship('Card', backref='category', lazy=True)
+
+    def __repr__(self):
+        return f'<Category {self.name}>'
+
+    @staticmethod
+    def counts(category_ids):
+        """Retorna {category_id: (themes_count, cards_count)} com duas consultas agrupadas"""
+        if not category_ids:
+            return {}
+        themes = dict(db.session.query(Theme.category_id, db.func.count(Theme.id)).filter(
+            Theme.category_id.in_(category_ids)
+        ).group_by(Theme.category_id).all())
+        cards = dict(db.session.query(Card.category_id, db.func.count(Card.id)).filter(
+            Card.category_id.in_(category_ids)
+        ).group_by(Card.category_id).all())
+        return {category_id: (themes.get(category_id, 0), cards.get(category_id, 0))
+                for category_id in category_ids}
+
+    def to_dict(self, themes_count=None, cards_count=None):
+        # Contar via COUNT para não carregar os cards só para contá-los
+        if themes_count is None:
+            themes_count = Theme.query.filter_by(category_id=self.id).count()
+        if cards_count is None:
+            cards_count = Card.query.filter_by(category_id=self.id).count()
+        
+        return {
+            'id': self.id,
+            'user_id': self.user_id,
+            'name': self.name,
+            'color': self.color,
+            'icon': self.icon,
+            'created_at': self.created_at.isoformat() if self.created_at else None,
+            'themes_count': themes_count,
+            'cards_count': cards_count
+        }
+
+class Theme(db.Model):
+    __table_args__ = (
+        db.Index('ix_theme_category_id', 'category_id'),
+    )
+
+    id = db.Column(db.Integer, primary_key=True)
+    category_id = db.Column(db.Integer, db.ForeignKey('category.id'), nullable=False)
+    name = db.Column(db.String(100), nullable=False)
+    description = db.Column(db.Text)
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    
+    # Relacionamentos
+    cards = db.relationship('Card', backref='theme', lazy=True)
+
+    def __repr__(self):
+        return f'<Theme {self.name}>'
+
+    @staticmethod
+    def cards_counts(theme_ids):
+        """Retorna {theme_id: cards_count} com uma consulta agrupada"""
+        if not theme_ids:
+            return {}
+        return dict(db.session.query(Card.theme_id, db.func.count(Card.id)).filter(
+            Card.theme_id.in_(theme_ids)
+        ).group_by(Card.theme_id).all())
+
+    def to_dict(self, cards_count=None):
+        if cards_count is None:
+            cards_count = Card.query.filter_by(theme_id=self.id).count()
+        
+        return {
+            'id': self.id,
+            'category_id': self.category_id,
+            'name': self.name,
+            'description': self.description,
+            'created_at': self.created_at.isoformat() if self.created_at else None,
+            'cards_count': cards_count
+        }
+
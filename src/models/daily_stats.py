@@ -0,0 +1,211 @@
+from datetime import datetime, timedelta
+from sqlalchemy.dialects import postgresql, sqlite
+from src.models.user import db
+from src.models.card import Card
+from src.models.study import CardReview
+
+class DailyUserStats(db.Model):
+    """Agregado diário de revisões por usuário e categoria (base dos relatórios)"""
+    __tablename__ = 'daily_user_stats'
+
+    user_id = db.Column(db.Integer, db.ForeignKey('user.id'), primary_key=True)
+    date = db.Column(db.Date, primary_key=True)
+    category_id = db.Column(db.Integer, primary_key=True)
+    reviews = db.Column(db.Integer, nullable=False, default=0)
+    correct_answers = db.Column(db.Integer, nullable=False, default=0)
+    response_time_sum = db.Column(db.Integer, nullable=False, default=0)  # em segundos
+    new_cards = db.Column(db.Integer, nullable=False, default=0)
+
+    COUNTERS = ('reviews', 'correct_answers', 'response_time_sum', 'new_cards')
+
+    def __repr__(self):
+        return f'<DailyUserStats {self.user_id} {self.date} {self.category_id}>'
+
+    def to_dict(self):
+        return {
+            'user_id': self.user_id,
+            'date': self.date.isoformat() if self.date else None,
+            'category_id': self.category_id,
+            'reviews': self.reviews,
+            'correct_answers': self.correct_answers,
+            'response_time_sum': self.response_time_sum,
+            'new_cards': self.new_cards
+        }
+
+    @classmethod
+    def increment(cls, rows, connection=None):
+        """Soma contadores aos agregados, criando as linhas que faltarem.
+
+        `rows` são dicts com user_id, date, category_id e os contadores.
+        """
+        if not rows:
+            return
+        connection = connection or db.session.connection()
+        table = cls.__table__
+        dialect = connection.dialect.name
+
+        if dialect in ('sqlite', 'postgresql'):
+            insert = sqlite.insert if dialect == 'sqlite' else postgresql.insert
+            statement = insert(table)
+            statement = statement.on_conflict_do_update(
+                index_elements=['user_id', 'date', 'category_id'],
+                set_={name: table.c[name] + statement.excluded[name] for name in cls.COUNTERS}
+            )
+            connection.execute(statement, rows)
+            return
+
+        for row in rows:
+            key = (table.c.user_id == row['user_id']) & (table.c.date == row['date']) & \
+                  (table.c.category_id == row['category_id'])
+            result = connection.execute(table.update().where(key).values(
+                {name: table.c[name] + row[name] for name in cls.COUNTERS}
+            ))
+            if not result.rowcount:
+                connection.execute(table.insert(), row)
+
+    @classmethod
+    def record_reviews(cls, reviews, connection=None):
+        """Atualiza os agregados a partir de revisões recém-gravadas.
+
+        `reviews` são dicts com user_id, card_id, is_correct, response_time,
+        reviewed_at, além de category_id e is_new (primeira revisão do card).
+        """
+        totals = {}
+        for review in reviews:
+            reviewed_at = review.get('reviewed_at') or datetime.utcnow()
+            key = (review['user_id'], reviewed_at.date(), review['category_id'])
+            row = totals.setdefault(key, dict.fromkeys(cls.COUNTERS, 0))
+            row['reviews'] += 1
+            row['correct_answers'] += 1 if review['is_correct'] else 0
+            row['response_time_sum'] += review.get('response_time') or 0
+            row['new_cards'] += 1 if review.get('is_new') else 0
+
+        cls.increment([
+            {'user_id': user_id, 'date': date, 'category_id': category_id, **counters}
+            for (user_id, date, category_id), counters in totals.items()
+        ], connection=connection)
+
+    @classmethod
+    def rebuild(cls, user_id=None):
+        """Recalcula os agregados a partir de card_review (backfill). Não faz commit."""
+        delete = cls.__table__.delete()
+        if user_id is not None:
+            delete = delete.where(cls.__table__.c.user_id == user_id)
+        db.session.execute(delete)
+
+        review_date = db.func.date(CardReview.reviewed_at)
+        query = db.session.query(
+            CardReview.user_id, review_date, Card.category_id,
+            db.func.count(CardReview.id),
+            db.func.sum(db.case((CardReview.is_correct, 1), else_=0)),
+            db.func.coalesce(db.func.sum(CardReview.response_time), 0)
+        ).join(Card, Card.id == CardReview.card_id).group_by(
+            CardReview.user_id, review_date, Card.category_id
+        )
+
+        # Primeira revisão de cada card: conta como card novo naquele dia
+        first_review = db.session.query(
+            CardReview.card_id, db.func.min(CardReview.reviewed_at).label('first_at')
+        ).group_by(CardReview.card_id)
+        if user_id is not None:
+            query = query.filter(CardReview.user_id == user_id)
+            first_review = first_review.filter(CardReview.user_id == user_id)
+        first_review = first_review.subquery()
+        first_date = db.func.date(first_review.c.first_at)
+        new_cards = db.session.query(
+            Card.user_id, first_date, Card.category_id, db.func.count()
+        ).join(first_review, first_review.c.card_id == Card.id).group_by(
+            Card.user_id, first_date, Card.category_id
+        )
+        new_counts = {(uid, str(day), cid): count for uid, day, cid, count in new_cards}
+
+        rows = []
+        for uid, day, cid, reviews, correct, response_time in query:
+            rows.append({
+                'user_id': uid,
+                'date': day if not isinstance(day, str) else datetime.strptime(day, '%Y-%m-%d').date(),
+                'category_id': cid,
+                'reviews': reviews,
+                'correct_answers': correct or 0,
+                'response_time_sum': response_time or 0,
+                'new_cards': new_counts.get((uid, str(day), cid), 0)
+            })
+        if rows:
+            db.session.execute(cls.__table__.insert(), rows)
+        return len(rows)
+
+    @classmethod
+    def _since(cls, days):
+        return datetime.utcnow().date() - timedelta(days=max(int(days), 1) - 1)
+
+    @classmethod
+    def performance(cls, user_id, days=7):
+        """Resumo de desempenho dos últimos `days` dias, por categoria"""
+        rows = db.session.query(
+            cls.category_id,
+            db.func.sum(cls.reviews), db.func.sum(cls.correct_answers),
+            db.func.sum(cls.response_time_sum), db.func.sum(cls.new_cards)
+        ).filter(cls.user_id == user_id, cls.date >= cls._since(days)).group_by(cls.category_id).all()
+
+        categories = []
+        total_reviews = total_correct = total_time = total_new = 0
+        for category_id, reviews, correct, response_time, new_cards in rows:
+            total_reviews += reviews
+            total_correct += correct
+            total_time += response_time
+            total_new += new_cards
+            categories.append({
+                'category_id': category_id,
+                'total_reviews': reviews,
+                'correct_answers': correct,
+                'accuracy': round(correct / reviews * 100, 1) if reviews else 0,
+                'new_cards': new_cards
+            })
+
+        return {
+            'total_reviews': total_reviews,
+            'correct_answers': total_correct,
+            'accuracy': round(total_correct / total_reviews * 100, 1) if total_reviews else 0,
+            'average_response_time': round(total_time / total_reviews, 1) if total_reviews else 0,
+            'new_cards': total_new,
+            'categories': categories
+        }
+
+    @classmethod
+    def progress(cls, user_id, days=7):
+        """Série diária dos últimos `days` dias"""
+        rows = db.session.query(
+            cls.date, db.func.sum(cls.reviews), db.func.sum(cls.correct_answers), db.func.sum(cls.new_cards)
+        ).filter(cls.user_id == user_id, cls.date >= cls._since(days)).group_by(cls.date).order_by(cls.date).all()
+
+        return [{
+            'date': day.isoformat(),
+            'total_reviews': reviews,
+            'correct_answers': correct,
+            'accuracy': round(correct / reviews * 100, 1) if reviews else 0,
+            'new_cards': new_cards
+        } for day, reviews, correct, new_cards in rows]
+
+
+@db.event.listens_for(CardReview, 'after_insert')
+def _rollup_card_review(mapper, connection, target):
+    """Revisões gravadas pelo ORM (uma a uma) atualizam o agregado na mesma transação"""
+    card_table = Card.__table__
+    review_table = CardReview.__table__
+    category_id = connection.execute(
+        db.select(card_table.c.category_id).where(card_table.c.id == target.card_id)
+    ).scalar()
+    previous = connection.execute(
+        db.select(review_table.c.id).where(
+            review_table.c.card_id == target.card_id, review_table.c.id != target.id
+        ).limit(1)
+    ).first()
+    DailyUserStats.record_reviews([{
+        'user_id': target.user_id,
+        'card_id': target.card_id,
+        'category_id': category_id,
+        'is_correct': target.is_correct,
+        'response_time': target.response_time,
+        'reviewed_at': target.reviewed_at,
+        'is_new': previous is None
+    }], connection=connection)
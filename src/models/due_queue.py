@@ -0,0 +1,131 @@
+import heapq
+import os
+import threading
+import time
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+
+class DueQueue:
+    """Fila de prioridade em memória, por usuário, dos cards a revisar.
+
+    Guarda pares (next_review, card_id) num heap por usuário. Entradas
+    antigas não são removidas do heap: ficam obsoletas e são descartadas
+    quando chegam ao topo (remoção preguiçosa). Só usuários carregados via
+    `load` são acompanhados; para os demais o banco continua sendo a fonte.
+
+    O heap é do processo: alterações são aplicadas só depois do commit
+    (`update_on_commit`/`invalidate_on_commit`), mas escritas feitas por
+    outros workers não chegam aqui. Por isso a fila vem desligada
+    (DUE_QUEUE_ENABLED / MEDCARDS_DUE_QUEUE=1 para ligar, pensado para um
+    único worker) e cada heap é recarregado do banco após `ttl` segundos.
+    """
+
+    def __init__(self, max_users=1000, ttl=30):
+        self.max_users = max_users
+        self.ttl = ttl
+        self.enabled = False
+        self._heaps = {}
+        self._current = {}
+        self._loaded_at = {}
+        self._lock = threading.Lock()
+
+    def init_app(self, app):
+        self.enabled = app.config.setdefault('DUE_QUEUE_ENABLED', os.environ.get('MEDCARDS_DUE_QUEUE', '0') == '1')
+        self.ttl = app.config.setdefault('DUE_QUEUE_TTL', self.ttl)
+        self.invalidate()
+
+    def has(self, user_id):
+        with self._lock:
+            loaded_at = self._loaded_at.get(user_id)
+            return loaded_at is not None and time.monotonic() - loaded_at < self.ttl
+
+    def load(self, user_id, rows):
+        """Carrega o heap de um usuário a partir de pares (card_id, next_review)"""
+        with self._lock:
+            if user_id not in self._heaps and len(self._heaps) >= self.max_users:
+                # Descartar o usuário mais antigo para limitar a memória
+                oldest = next(iter(self._heaps))
+                self._drop(oldest)
+            current = {card_id: next_review for card_id, next_review in rows if next_review}
+            heap = [(next_review, card_id) for card_id, next_review in current.items()]
+            heapq.heapify(heap)
+            self._heaps[user_id] = heap
+            self._current[user_id] = current
+            self._loaded_at[user_id] = time.monotonic()
+
+    def update(self, user_id, card_id, next_review):
+        """Registra a nova data de revisão de um card (ignorado se o usuário não está carregado)"""
+        with self._lock:
+            heap = self._heaps.get(user_id)
+            if heap is None:
+                return
+            if next_review is None:
+                self._current[user_id].pop(card_id, None)
+                return
+            self._current[user_id][card_id] = next_review
+            heapq.heappush(heap, (next_review, card_id))
+
+    def remove(self, user_id, card_id):
+        with self._lock:
+            if user_id in self._current:
+                self._current[user_id].pop(card_id, None)
+
+    def _drop(self, user_id):
+        self._heaps.pop(user_id, None)
+        self._current.pop(user_id, None)
+        self._loaded_at.pop(user_id, None)
+
+    def invalidate(self, user_id=None):
+        with self._lock:
+            if user_id is None:
+                self._heaps.clear()
+                self._current.clear()
+                self._loaded_at.clear()
+            else:
+                self._drop(user_id)
+
+    def update_on_commit(self, session, user_id, card_id, next_review):
+        """Agenda `update` (ou remoção, com next_review None) para depois do commit"""
+        session.info.setdefault('due_queue_changes', []).append(('update', user_id, card_id, next_review))
+
+    def invalidate_on_commit(self, session, user_id):
+        """Agenda `invalidate` do usuário para depois do commit (escritas em lote via Core)"""
+        session.info.setdefault('due_queue_changes', []).append(('invalidate', user_id, None, None))
+
+    def peek_due(self, user_id, now, limit):
+        """Retorna até `limit` pares (next_review, card_id) vencidos, sem removê-los"""
+        with self._lock:
+            heap = self._heaps.get(user_id)
+            if heap is None:
+                return None
+            current = self._current[user_id]
+            due = []
+            seen = set()
+            while heap and len(due) < limit:
+                next_review, card_id = heap[0]
+                if current.get(card_id) != next_review or card_id in seen:
+                    heapq.heappop(heap)  # entrada obsoleta ou duplicada
+                    continue
+                if next_review > now:
+                    break
+                due.append(heapq.heappop(heap))
+                seen.add(card_id)
+            for entry in due:
+                heapq.heappush(heap, entry)
+            return due
+
+
+due_queue = DueQueue()
+
+@event.listens_for(Session, 'after_commit')
+def _apply_due_queue_changes(session):
+    for kind, user_id, card_id, next_review in session.info.pop('due_queue_changes', ()):
+        if kind == 'invalidate':
+            due_queue.invalidate(user_id)
+        else:
+            due_queue.update(user_id, card_id, next_review)
+
+@event.listens_for(Session, 'after_rollback')
+def _discard_due_queue_changes(session):
+    session.info.pop('due_queue_changes', None)
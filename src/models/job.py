@@ -0,0 +1,54 @@
+from datetime import datetime
+import json
+from src.models.user import db
+
+class Job(db.Model):
+    """Tarefa em segundo plano (ex: importações pesadas do admin)"""
+    __tablename__ = 'jobs'
+    
+    id = db.Column(db.Integer, primary_key=True)
+    job_type = db.Column(db.String(50), nullable=False)
+    status = db.Column(db.Enum('queued', 'running', 'succeeded', 'failed', 'cancelled', name='job_status_enum'),
+                       nullable=False, default='queued', index=True)
+    payload = db.Column(db.Text)  # JSON
+    result = db.Column(db.Text)  # JSON
+    error = db.Column(db.Text)
+    progress = db.Column(db.Integer, default=0)
+    attempts = db.Column(db.Integer, default=0)
+    created_by = db.Column(db.Integer)
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    started_at = db.Column(db.DateTime)
+    finished_at = db.Column(db.DateTime)
+    # Worker que executa a tarefa e último sinal de vida dele (ver JobRunner)
+    worker_id = db.Column(db.String(100))
+    heartbeat_at = db.Column(db.DateTime)
+    cancel_requested = db.Column(db.Boolean, default=False)
+
+    def get_payload(self):
+        return json.loads(self.payload) if self.payload else {}
+
+    def get_result(self):
+        return json.loads(self.result) if self.result else None
+
+    def __repr__(self):
+        return f'<Job {self.id}: {self.job_type} ({self.status})>'
+
+    def to_dict(self, include_payload=False):
+        data = {
+            'id': self.id,
+            'job_type': self.job_type,
+            'status': self.status,
+            'result': self.get_result(),
+            'error': self.error,
+            'progress': self.progress,
+            'attempts': self.attempts,
+            'created_by': self.created_by,
+            'created_at': self.created_at.isoformat() if self.created_at else None,
+            'started_at': self.started_at.isoformat() if self.started_at else None,
+            'finished_at': self.finished_at.isoformat() if self.finished_at else None,
+            'worker_id': self.worker_id,
+            'cancel_requested': bool(self.cancel_requested)
+        }
+        if include_payload:
+            data['payload'] = self.get_payload()
+        return data
@@ -0,0 +1,140 @@
+from datetime import datetime
+import re
+from sqlalchemy import inspect, text
+from src.models.user import db
+from src.models.tag import Tag
+
+def _add_column(table, name, ddl):
+    """Passo de migração que adiciona uma coluna se ela ainda não existe"""
+    def step(connection):
+        if name not in {column['name'] for column in inspect(connection).get_columns(table)}:
+            connection.execute(text(f'ALTER TABLE {table} ADD COLUMN {name} {ddl}'))
+    return step
+
+def _key_receipts_by_user(connection):
+    """answer_receipts passa de PK (idempotency_key) para (user_id, idempotency_key).
+
+    O SQLite não altera a chave primária de uma tabela: recria e copia.
+    """
+    inspector = inspect(connection)
+    if 'answer_receipts' not in inspector.get_table_names():
+        return
+    if inspector.get_pk_constraint('answer_receipts')['constrained_columns'] != ['idempotency_key']:
+        return
+    connection.execute(text('ALTER TABLE answer_receipts RENAME TO answer_receipts_old'))
+    connection.execute(text(
+        'CREATE TABLE answer_receipts ('
+        'user_id INTEGER NOT NULL REFERENCES user (id), idempotency_key VARCHAR(100) NOT NULL, '
+        'card_id INTEGER NOT NULL, session_id INTEGER NOT NULL, created_at DATETIME, '
+        'PRIMARY KEY (user_id, idempotency_key))'
+    ))
+    connection.execute(text(
+        'INSERT INTO answer_receipts (user_id, idempotency_key, card_id, session_id, created_at) '
+        'SELECT user_id, idempotency_key, card_id, session_id, created_at FROM answer_receipts_old'
+    ))
+    connection.execute(text('DROP TABLE answer_receipts_old'))
+
+def _backfill_tags(connection):
+    """Popula tag/card_tag com as tags JSON dos cards gravados antes das tabelas existirem"""
+    Tag.backfill(connection=connection)
+
+# Migrações versionadas, aplicadas em ordem. db.create_all() só cria tabelas
+# novas; tudo o que muda tabelas existentes (índices, colunas) entra aqui.
+# Cada passo usa IF NOT EXISTS (ou _add_column) para também valer em bancos criados do zero.
+MIGRATIONS = [
+    ('0001', 'Índices das consultas críticas', [
+        'CREATE INDEX IF NOT EXISTS ix_card_user_next_review ON card (user_id, next_review, id)',
+        'CREATE INDEX IF NOT EXISTS ix_card_user_created_at ON card (user_id, created_at, id)',
+        'CREATE INDEX IF NOT EXISTS ix_card_category_id ON card (category_id)',
+        'CREATE INDEX IF NOT EXISTS ix_card_theme_id ON card (theme_id)',
+        'CREATE INDEX IF NOT EXISTS ix_card_review_user_reviewed_at ON card_review (user_id, reviewed_at)',
+        'CREATE INDEX IF NOT EXISTS ix_card_review_card_id ON card_review (card_id)',
+        'CREATE INDEX IF NOT EXISTS ix_card_review_session_id ON card_review (session_id)',
+        'CREATE INDEX IF NOT EXISTS ix_preset_questions_list_order ON preset_questions (question_list_id, order_index)',
+        'CREATE INDEX IF NOT EXISTS ix_category_user_id ON category (user_id)',
+        'CREATE INDEX IF NOT EXISTS ix_theme_category_id ON theme (category_id)',
+    ]),
+    ('0002', 'Dono, heartbeat e pedido de cancelamento das tarefas', [
+        _add_column('jobs', 'worker_id', 'VARCHAR(100)'),
+        _add_column('jobs', 'heartbeat_at', 'DATETIME'),
+        _add_column('jobs', 'cancel_requested', 'BOOLEAN DEFAULT 0'),
+    ]),
+    ('0003', 'Chaves de idempotência por usuário', [
+        _key_receipts_by_user,
+    ]),
+    ('0004', 'Tags normalizadas a partir da coluna JSON dos cards', [
+        _backfill_tags,
+    ]),
+]
+
+# Consultas quentes que não podem cair em varredura completa de tabela
+HOT_QUERIES = {
+    'fila de revisão': "SELECT id FROM card WHERE user_id = 1 AND next_review <= '2024-01-01' "
+                       "ORDER BY next_review, id LIMIT 20",
+    'listagem de cards': 'SELECT id FROM card WHERE user_id = 1 ORDER BY created_at, id LIMIT 100',
+    'cards por categoria': 'SELECT category_id, count(id) FROM card WHERE category_id IN (1, 2) GROUP BY category_id',
+    'cards por tema': 'SELECT theme_id, count(id) FROM card WHERE theme_id IN (1, 2) GROUP BY theme_id',
+    'revisões do período': "SELECT count(id) FROM card_review WHERE user_id = 1 AND reviewed_at >= '2024-01-01'",
+    'revisões do card': 'SELECT id FROM card_review WHERE card_id = 1 LIMIT 1',
+    'revisões da sessão': 'SELECT id FROM card_review WHERE session_id = 1',
+    'perguntas da lista': 'SELECT id, question_text FROM preset_questions WHERE question_list_id = 1 ORDER BY order_index',
+    'contagem das listas': 'SELECT question_list_id, count(id) FROM preset_questions '
+                           'WHERE question_list_id IN (1, 2) GROUP BY question_list_id',
+    'categorias do usuário': 'SELECT id FROM category WHERE user_id = 1',
+    'temas da categoria': 'SELECT id FROM theme WHERE category_id = 1',
+    'estatísticas diárias': "SELECT sum(reviews) FROM daily_user_stats WHERE user_id = 1 AND date >= '2024-01-01'",
+}
+
+_FULL_SCAN = re.compile(r'^SCAN (TABLE )?(\w+)$')
+
+def _ensure_version_table(connection):
+    connection.execute(text(
+        'CREATE TABLE IF NOT EXISTS schema_migrations ('
+        'version VARCHAR(20) PRIMARY KEY, description VARCHAR(200), applied_at TIMESTAMP)'
+    ))
+
+def applied_versions(connection):
+    _ensure_version_table(connection)
+    return {row[0] for row in connection.execute(text('SELECT version FROM schema_migrations'))}
+
+def pending_migrations(engine=None):
+    engine = engine or db.engine
+    with engine.begin() as connection:
+        applied = applied_versions(connection)
+    return [(version, description) for version, description, _ in MIGRATIONS if version not in applied]
+
+def run_migrations(engine=None):
+    """Aplica as migrações pendentes, cada uma na sua transação. Retorna as versões aplicadas."""
+    engine = engine or db.engine
+    applied_now = []
+    for version, description, statements in MIGRATIONS:
+        with engine.begin() as connection:
+            if version in applied_versions(connection):
+                continue
+            for statement in statements:
+                if callable(statement):
+                    statement(connection)
+                else:
+                    connection.execute(text(statement))
+            connection.execute(text(
+                'INSERT INTO schema_migrations (version, description, applied_at) VALUES (:version, :description, :now)'
+            ), {'version': version, 'description': description, 'now': datetime.utcnow()})
+        applied_now.append(version)
+    return applied_now
+
+def check_query_plans(engine=None):
+    """Roda EXPLAIN QUERY PLAN nas consultas quentes (SQLite).
+
+    Retorna {nome: [linhas do plano]} apenas das consultas que fazem varredura
+    completa de alguma tabela; vazio significa que todas usam índice.
+    """
+    engine = engine or db.engine
+    if engine.dialect.name != 'sqlite':
+        return {}
+    offenders = {}
+    with engine.connect() as connection:
+        for name, query in HOT_QUERIES.items():
+            plan = [row[-1] for row in connection.execute(text(f'EXPLAIN QUERY PLAN {query}'))]
+            if any(_FULL_SCAN.match(detail) for detail in plan):
+                offenders[name] = plan
+    return offenders
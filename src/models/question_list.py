@@ -15,9 +15,33 @@ class QuestionList(db.Model):
     
     # Relacionamentos removidos para evitar problemas de foreign key
     
-    def to_dict(self):
-        # Contar perguntas manualmente
-        questions_count = PresetQuestion.query.filter_by(question_list_id=self.id).count()
+    @staticmethod
+    def version_stamp(list_id=None):
+        """Carimbo barato de versão: maior updated_at e total de listas (ou de uma lista)"""
+        query = db.session.query(db.func.max(QuestionList.updated_at), db.func.count(QuestionList.id))
+        if list_id is not None:
+            query = query.filter(QuestionList.id == list_id)
+        updated_at, total = query.one()
+        if not total:
+            return None
+        return f"{updated_at.timestamp() if updated_at else 0:.6f}-{total}"
+
+    @staticmethod
+    def questions_counts(list_ids):
+        """Conta as perguntas de várias listas com uma única consulta agrupada"""
+        if not list_ids:
+            return {}
+        rows = db.session.query(
+            PresetQuestion.question_list_id, db.func.count(PresetQuestion.id)
+        ).filter(
+            PresetQuestion.question_list_id.in_(list_ids)
+        ).group_by(PresetQuestion.question_list_id).all()
+        return dict(rows)
+    
+    def to_dict(self, questions_count=None):
+        # Contar perguntas manualmente se a contagem não foi pré-calculada
+        if questions_count is None:
+            questions_count = PresetQuestion.query.filter_by(question_list_id=self.id).count()
         
         return {
             'id': self.id,
@@ -33,6 +57,10 @@ class QuestionList(db.Model):
 
 class PresetQuestion(db.Model):
     __tablename__ = 'preset_questions'
+    __table_args__ = (
+        # Perguntas da lista em ordem: WHERE question_list_id = ? ORDER BY order_index
+        db.Index('ix_preset_questions_list_order', 'question_list_id', 'order_index'),
+    )
     
     id = db.Column(db.Integer, primary_key=True)
     question_list_id = db.Column(db.Integer, nullable=False)
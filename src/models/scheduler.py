@@ -0,0 +1,193 @@
+from datetime import datetime, timedelta
+from sqlalchemy import bindparam
+from src.models.user import db
+from src.models.card import Card
+from src.models.due_queue import due_queue
+
+try:
+    import numpy as np
+except ImportError:  # NumPy é opcional: sem ele o cálculo em lote usa um laço simples
+    np = None
+
+# Mesmos parâmetros de Card.calculate_next_review
+MIN_EASE_FACTOR = 1.3
+FAILED_INTERVAL = 0.01  # ~15 minutos
+
+# Tamanho dos lotes de leitura/escrita no banco
+BATCH_SIZE = 5000
+
+def sm2_intervals(review_count, ease_factor, is_correct, difficulty_rating):
+    """Versão vetorizada do SM-2 de Card.calculate_next_review.
+
+    Recebe sequências do mesmo tamanho e retorna (review_count, ease_factor,
+    interval_days) novos, calculados com as mesmas operações em float64 para
+    dar resultados idênticos ao método de um único card.
+    """
+    if np is None:
+        return _sm2_intervals_scalar(review_count, ease_factor, is_correct, difficulty_rating)
+
+    review_count = np.asarray(review_count, dtype=np.int64)
+    ease_factor = np.asarray(ease_factor, dtype=np.float64)
+    is_correct = np.asarray(is_correct, dtype=bool)
+    rating = np.asarray(difficulty_rating, dtype=np.float64)
+
+    new_count = np.where(is_correct, review_count + 1, 0)
+    decreased = np.maximum(MIN_EASE_FACTOR, ease_factor - 0.2)
+    adjusted = ease_factor + (0.1 - (5 - rating) * (0.08 + (5 - rating) * 0.02))
+
+    mature = is_correct & (new_count > 2)
+    new_ease = np.where(~is_correct, decreased,
+                        np.where(mature, np.where(rating >= 3, adjusted, decreased), ease_factor))
+
+    interval = np.where(~is_correct, FAILED_INTERVAL,
+                        np.where(new_count == 1, 1.0,
+                                 np.where(new_count == 2, 6.0, new_count * new_ease)))
+    return new_count, new_ease, interval
+
+def _sm2_intervals_scalar(review_count, ease_factor, is_correct, difficulty_rating):
+    new_counts, new_eases, intervals = [], [], []
+    for count, ease, correct, rating in zip(review_count, ease_factor, is_correct, difficulty_rating):
+        if correct:
+            count += 1
+            if count == 1:
+                interval = 1
+            elif count == 2:
+                interval = 6
+            else:
+                if rating >= 3:
+                    ease = ease + (0.1 - (5 - rating) * (0.08 + (5 - rating) * 0.02))
+                else:
+                    ease = max(MIN_EASE_FACTOR, ease - 0.2)
+                interval = count * ease
+        else:
+            count = 0
+            interval = FAILED_INTERVAL
+            ease = max(MIN_EASE_FACTOR, ease - 0.2)
+        new_counts.append(count)
+        new_eases.append(ease)
+        intervals.append(interval)
+    return new_counts, new_eases, intervals
+
+def _write_back(rows):
+    """Grava review_count/ease_factor/next_review com um único executemany"""
+    if not rows:
+        return
+    table = Card.__table__
+    db.session.execute(
+        table.update().where(table.c.id == bindparam('b_id')).values(
+            review_count=bindparam('review_count'),
+            ease_factor=bindparam('ease_factor'),
+            next_review=bindparam('next_review')
+        ),
+        rows
+    )
+
+def apply_answers(user_id, answers, now=None):
+    """Aplicar respostas (card_id, is_correct, difficulty_rating) a vários cards de uma vez.
+
+    Respostas repetidas do mesmo card são aplicadas em sequência, como
+    chamadas sucessivas de Card.calculate_next_review. Cards que não são do
+    usuário são ignorados. Não faz commit. Retorna {card_id: next_review}.
+    """
+    now = now or datetime.utcnow()
+    answers = list(answers)
+    if not answers:
+        return {}
+
+    card_ids = list(dict.fromkeys(card_id for card_id, _, _ in answers))
+    state = {}
+    for start in range(0, len(card_ids), BATCH_SIZE):
+        state.update({row.id: [row.review_count or 0, row.ease_factor, None] for row in db.session.query(
+            Card.id, Card.review_count, Card.ease_factor
+        ).filter(Card.user_id == user_id, Card.id.in_(card_ids[start:start + BATCH_SIZE])).all()})
+    answers = [answer for answer in answers if answer[0] in state]
+
+    # Cada rodada tem no máximo uma resposta por card e parte do estado da anterior
+    remaining = answers
+    while remaining:
+        current, deferred, seen = [], [], set()
+        for answer in remaining:
+            if answer[0] in seen:
+                deferred.append(answer)
+            else:
+                seen.add(answer[0])
+                current.append(answer)
+        remaining = deferred
+
+        new_count, new_ease, interval = sm2_intervals(
+            [state[card_id][0] for card_id, _, _ in current],
+            [state[card_id][1] for card_id, _, _ in current],
+            [is_correct for _, is_correct, _ in current],
+            [rating for _, _, rating in current]
+        )
+        for (card_id, _, _), count, ease, days in zip(current, new_count, new_ease, interval):
+            state[card_id] = [int(count), float(ease), now + timedelta(days=float(days))]
+
+    rows = [{'b_id': card_id, 'review_count': count, 'ease_factor': ease, 'next_review': next_review}
+            for card_id, (count, ease, next_review) in state.items() if next_review is not None]
+    _write_back(rows)
+    due_queue.invalidate_on_commit(db.session, user_id)
+
+    return {row['b_id']: row['next_review'] for row in rows}
+
+def reschedule_overdue(user_id, spread_days=7, now=None):
+    """Redistribuir os cards atrasados (ex: após férias) ao longo dos próximos dias.
+
+    Os cards mantêm a ordem original de vencimento e são espalhados
+    uniformemente em `spread_days` dias a partir de agora. Não faz commit.
+    """
+    now = now or datetime.utcnow()
+    card_ids = [card_id for (card_id,) in db.session.query(Card.id).filter(
+        Card.user_id == user_id, Card.next_review < now
+    ).order_by(Card.next_review, Card.id).all()]
+    if not card_ids:
+        return 0
+
+    total = len(card_ids)
+    if np is not None:
+        offsets = np.arange(total, dtype=np.float64) * (spread_days / total)
+    else:
+        offsets = [position * (spread_days / total) for position in range(total)]
+
+    table = Card.__table__
+    statement = table.update().where(table.c.id == bindparam('b_id')).values(
+        next_review=bindparam('next_review')
+    )
+    for start in range(0, total, BATCH_SIZE):
+        db.session.execute(statement, [
+            {'b_id': card_id, 'next_review': now + timedelta(days=float(offset))}
+            for card_id, offset in zip(card_ids[start:start + BATCH_SIZE], offsets[start:start + BATCH_SIZE])
+        ])
+    due_queue.invalidate_on_commit(db.session, user_id)
+    return total
+
+def apply_ease_policy(user_id, ease_delta=0.0, min_ease=MIN_EASE_FACTOR, max_ease=None, category_id=None):
+    """Ajustar o ease_factor de todo o baralho: soma `ease_delta` e limita a [min_ease, max_ease].
+
+    Não faz commit. Retorna o número de cards alterados.
+    """
+    query = db.session.query(Card.id, Card.ease_factor).filter(Card.user_id == user_id)
+    if category_id:
+        query = query.filter(Card.category_id == category_id)
+    rows = query.all()
+    if not rows:
+        return 0
+
+    card_ids = [row.id for row in rows]
+    eases = [row.ease_factor if row.ease_factor is not None else 2.5 for row in rows]
+    if np is not None:
+        new_eases = np.clip(np.asarray(eases, dtype=np.float64) + ease_delta, min_ease, max_ease)
+    else:
+        new_eases = [max(min_ease, ease + ease_delta) for ease in eases]
+        if max_ease is not None:
+            new_eases = [min(max_ease, ease) for ease in new_eases]
+
+    changed = [{'b_id': card_id, 'ease_factor': float(new)}
+               for card_id, old, new in zip(card_ids, eases, new_eases) if float(new) != old]
+    table = Card.__table__
+    statement = table.update().where(table.c.id == bindparam('b_id')).values(
+        ease_factor=bindparam('ease_factor')
+    )
+    for start in range(0, len(changed), BATCH_SIZE):
+        db.session.execute(statement, changed[start:start + BATCH_SIZE])
+    return len(changed)
@@ -0,0 +1,142 @@
+import html
+import re
+from sqlalchemy import text
+from src.models.user import db
+
+# Tabelas FTS5 com conteúdo externo: o texto fica só nas tabelas originais e os
+# triggers mantêm o índice em dia. remove_diacritics 2 faz "femur" achar "fêmur".
+# O dono do card vai no índice como coluna UNINDEXED (filtra, mas não é buscada).
+TOKENIZER = "unicode61 remove_diacritics 2"
+
+# Marcadores passados ao snippet(): caracteres de controle que não aparecem no
+# texto. O trecho é escapado e só depois os marcadores viram <mark></mark>.
+MARK_START = '\x02'
+MARK_END = '\x03'
+
+SCHEMA = [
+    f"""CREATE VIRTUAL TABLE IF NOT EXISTS card_fts USING fts5(
+        question, answer, user_id UNINDEXED, content='card', content_rowid='id', tokenize='{TOKENIZER}')""",
+    """CREATE TRIGGER IF NOT EXISTS card_fts_ai AFTER INSERT ON card BEGIN
+        INSERT INTO card_fts(rowid, question, answer, user_id) VALUES (new.id, new.question, new.answer, new.user_id);
+    END""",
+    """CREATE TRIGGER IF NOT EXISTS card_fts_ad AFTER DELETE ON card BEGIN
+        INSERT INTO card_fts(card_fts, rowid, question, answer, user_id)
+        VALUES ('delete', old.id, old.question, old.answer, old.user_id);
+    END""",
+    """CREATE TRIGGER IF NOT EXISTS card_fts_au AFTER UPDATE OF question, answer, user_id ON card BEGIN
+        INSERT INTO card_fts(card_fts, rowid, question, answer, user_id)
+        VALUES ('delete', old.id, old.question, old.answer, old.user_id);
+        INSERT INTO card_fts(rowid, question, answer, user_id) VALUES (new.id, new.question, new.answer, new.user_id);
+    END""",
+    f"""CREATE VIRTUAL TABLE IF NOT EXISTS preset_question_fts USING fts5(
+        question_text, content='preset_questions', content_rowid='id', tokenize='{TOKENIZER}')""",
+    """CREATE TRIGGER IF NOT EXISTS preset_question_fts_ai AFTER INSERT ON preset_questions BEGIN
+        INSERT INTO preset_question_fts(rowid, question_text) VALUES (new.id, new.question_text);
+    END""",
+    """CREATE TRIGGER IF NOT EXISTS preset_question_fts_ad AFTER DELETE ON preset_questions BEGIN
+        INSERT INTO preset_question_fts(preset_question_fts, rowid, question_text)
+        VALUES ('delete', old.id, old.question_text);
+    END""",
+    """CREATE TRIGGER IF NOT EXISTS preset_question_fts_au AFTER UPDATE OF question_text ON preset_questions BEGIN
+        INSERT INTO preset_question_fts(preset_question_fts, rowid, question_text)
+        VALUES ('delete', old.id, old.question_text);
+        INSERT INTO preset_question_fts(rowid, question_text) VALUES (new.id, new.question_text);
+    END""",
+]
+
+# Índice de cards da versão anterior (sem user_id): recriado por ensure_search_index
+DROP_CARD_FTS = [
+    "DROP TRIGGER IF EXISTS card_fts_ai",
+    "DROP TRIGGER IF EXISTS card_fts_ad",
+    "DROP TRIGGER IF EXISTS card_fts_au",
+    "DROP TABLE IF EXISTS card_fts",
+]
+
+def is_supported(engine=None):
+    engine = engine or db.engine
+    return engine.dialect.name == 'sqlite'
+
+def ensure_search_index(engine=None):
+    """Cria as tabelas FTS5 e os triggers; na primeira vez, indexa os dados existentes"""
+    engine = engine or db.engine
+    if not is_supported(engine):
+        return False
+    with engine.begin() as connection:
+        existing = {name for (name,) in connection.execute(text(
+            "SELECT name FROM sqlite_master WHERE type = 'table' AND name IN ('card_fts', 'preset_question_fts')"
+        ))}
+        if 'card_fts' in existing:
+            columns = {row[1] for row in connection.execute(text("PRAGMA table_info(card_fts)"))}
+            if 'user_id' not in columns:
+                for statement in DROP_CARD_FTS:
+                    connection.execute(text(statement))
+                existing.discard('card_fts')
+        for statement in SCHEMA:
+            connection.execute(text(statement))
+        if len(existing) < 2:
+            rebuild_search_index(connection)
+    return True
+
+def rebuild_search_index(connection=None):
+    connection = connection or db.session.connection()
+    connection.execute(text("INSERT INTO card_fts(card_fts) VALUES ('rebuild')"))
+    connection.execute(text("INSERT INTO preset_question_fts(preset_question_fts) VALUES ('rebuild')"))
+
+def to_match_query(query):
+    """Converte o texto digitado numa consulta FTS5 segura (termos com prefixo)"""
+    terms = re.findall(r'\w+', query or '')
+    return ' '.join(f'"{term}"*' for term in terms[:20])
+
+def highlight(snippet):
+    """Escapa o HTML do trecho e troca os marcadores do snippet() por <mark></mark>"""
+    if snippet is None:
+        return None
+    return html.escape(snippet).replace(MARK_START, '<mark>').replace(MARK_END, '</mark>')
+
+def search_cards(user_id, query, limit=20, offset=0):
+    match = to_match_query(query)
+    if not match:
+        return []
+    rows = db.session.execute(text("""
+        SELECT card.id, card.category_id, card.theme_id,
+               snippet(card_fts, 0, :mark_start, :mark_end, '…', 12) AS question_snippet,
+               snippet(card_fts, 1, :mark_start, :mark_end, '…', 12) AS answer_snippet,
+               bm25(card_fts, 2.0, 1.0) AS rank
+        FROM card_fts JOIN card ON card.id = card_fts.rowid
+        WHERE card_fts MATCH :match AND card_fts.user_id = :user_id
+        ORDER BY rank LIMIT :limit OFFSET :offset
+    """), {'match': match, 'user_id': user_id, 'limit': limit, 'offset': offset,
+          'mark_start': MARK_START, 'mark_end': MARK_END})
+    return [{
+        'type': 'card',
+        'id': row.id,
+        'category_id': row.category_id,
+        'theme_id': row.theme_id,
+        'question_snippet': highlight(row.question_snippet),
+        'answer_snippet': highlight(row.answer_snippet),
+        'rank': row.rank
+    } for row in rows]
+
+def search_preset_questions(query, list_id=None, limit=20, offset=0):
+    match = to_match_query(query)
+    if not match:
+        return []
+    rows = db.session.execute(text("""
+        SELECT preset_questions.id, preset_questions.question_list_id,
+               snippet(preset_question_fts, 0, :mark_start, :mark_end, '…', 12) AS snippet,
+               bm25(preset_question_fts) AS rank
+        FROM preset_question_fts
+        JOIN preset_questions ON preset_questions.id = preset_question_fts.rowid
+        JOIN question_lists ON question_lists.id = preset_questions.question_list_id
+        WHERE preset_question_fts MATCH :match AND question_lists.is_active = 1
+          AND (:list_id IS NULL OR preset_questions.question_list_id = :list_id)
+        ORDER BY rank LIMIT :limit OFFSET :offset
+    """), {'match': match, 'list_id': list_id, 'limit': limit, 'offset': offset,
+          'mark_start': MARK_START, 'mark_end': MARK_END})
+    return [{
+        'type': 'preset_question',
+        'id': row.id,
+        'question_list_id': row.question_list_id,
+        'snippet': highlight(row.snippet),
+        'rank': row.rank
+    } for row in rows]
@@ -45,6 +45,14 @@ class StudySession(db.Model):
         }
 
 class CardReview(db.Model):
+    __table_args__ = (
+        # Relatórios por período: WHERE user_id = ? AND reviewed_at >= ?
+        db.Index('ix_card_review_user_reviewed_at', 'user_id', 'reviewed_at'),
+        # Cascade ao excluir card/sessão
+        db.Index('ix_card_review_card_id', 'card_id'),
+        db.Index('ix_card_review_session_id', 'session_id'),
+    )
+
     id = db.Column(db.Integer, primary_key=True)
     user_id = db.Column(db.Integer, db.ForeignKey('user.id'), nullable=False)
     card_id = db.Column(db.Integer, db.ForeignKey('card.id'), nullable=False)
@@ -69,6 +77,22 @@ class CardReview(db.Model):
             'reviewed_at': self.reviewed_at.isoformat() if self.reviewed_at else None
         }
 
+class AnswerReceipt(db.Model):
+    """Chave de idempotência de uma resposta já registrada (envio em lote).
+
+    As chaves são geradas pelo cliente, então só são únicas por usuário.
+    """
+    __tablename__ = 'answer_receipts'
+    
+    user_id = db.Column(db.Integer, db.ForeignKey('user.id'), primary_key=True)
+    idempotency_key = db.Column(db.String(100), primary_key=True)
+    card_id = db.Column(db.Integer, nullable=False)
+    session_id = db.Column(db.Integer, nullable=False)
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+
+    def __repr__(self):
+        return f'<AnswerReceipt {self.user_id}:{self.idempotency_key}>'
+
 class StudyGoal(db.Model):
     id = db.Column(db.Integer, primary_key=True)
     user_id = db.Column(db.Integer, db.ForeignKey('user.id'), nullable=False)
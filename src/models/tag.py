@@ -0,0 +1,133 @@
+from datetime import datetime
+import json
+from src.models.user import db
+
+# Associação card <-> tag; o índice por tag_id atende os filtros por tag
+card_tag = db.Table(
+    'card_tag',
+    db.Column('card_id', db.Integer, db.ForeignKey('card.id', ondelete='CASCADE'), primary_key=True),
+    db.Column('tag_id', db.Integer, db.ForeignKey('tag.id', ondelete='CASCADE'), primary_key=True),
+    db.Index('ix_card_tag_tag_id', 'tag_id', 'card_id')
+)
+
+class Tag(db.Model):
+    __table_args__ = (
+        db.UniqueConstraint('user_id', 'name', name='uq_tag_user_name'),
+    )
+
+    id = db.Column(db.Integer, primary_key=True)
+    user_id = db.Column(db.Integer, db.ForeignKey('user.id'), nullable=False)
+    name = db.Column(db.String(100), nullable=False)
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+
+    def __repr__(self):
+        return f'<Tag {self.name}>'
+
+    def to_dict(self):
+        return {
+            'id': self.id,
+            'user_id': self.user_id,
+            'name': self.name,
+            'created_at': self.created_at.isoformat() if self.created_at else None
+        }
+
+    @staticmethod
+    def normalize(names):
+        """Remove espaços, vazios e duplicatas mantendo a ordem"""
+        result = []
+        for name in names or []:
+            name = str(name).strip()[:100]
+            if name and name not in result:
+                result.append(name)
+        return result
+
+    @classmethod
+    def _ensure(cls, connection, user_id, names):
+        """Retorna {name: tag_id}, criando as tags que ainda não existem"""
+        table = cls.__table__
+        if not names:
+            return {}
+        existing = dict(connection.execute(
+            db.select(table.c.name, table.c.id).where(table.c.user_id == user_id, table.c.name.in_(names))
+        ).all())
+        missing = [name for name in names if name not in existing]
+        if missing:
+            connection.execute(table.insert(), [
+                {'user_id': user_id, 'name': name, 'created_at': datetime.utcnow()} for name in missing
+            ])
+            existing.update(connection.execute(
+                db.select(table.c.name, table.c.id).where(table.c.user_id == user_id, table.c.name.in_(missing))
+            ).all())
+        return existing
+
+    @classmethod
+    def sync_cards(cls, cards, connection=None):
+        """Atualiza card_tag para cards dados como (card_id, user_id, lista de nomes)"""
+        connection = connection or db.session.connection()
+        cards = [(card_id, user_id, cls.normalize(names)) for card_id, user_id, names in cards]
+        if not cards:
+            return
+
+        card_ids = [card_id for card_id, _, _ in cards]
+        for start in range(0, len(card_ids), 500):
+            connection.execute(card_tag.delete().where(card_tag.c.card_id.in_(card_ids[start:start + 500])))
+
+        by_user = {}
+        for card_id, user_id, names in cards:
+            by_user.setdefault(user_id, []).append((card_id, names))
+
+        links = []
+        for user_id, user_cards in by_user.items():
+            names = list(dict.fromkeys(name for _, card_names in user_cards for name in card_names))
+            tag_ids = cls._ensure(connection, user_id, names)
+            links.extend({'card_id': card_id, 'tag_id': tag_ids[name]}
+                         for card_id, card_names in user_cards for name in card_names)
+        if links:
+            connection.execute(card_tag.insert(), links)
+
+    @classmethod
+    def backfill(cls, batch_size=5000, connection=None):
+        """Popula tag/card_tag a partir da coluna JSON Card.tags. Não faz commit."""
+        connection = connection or db.session.connection()
+        card_table = db.metadata.tables['card']
+        last_id = 0
+        total = 0
+        while True:
+            rows = connection.execute(
+                db.select(card_table.c.id, card_table.c.user_id, card_table.c.tags).where(
+                    card_table.c.id > last_id, card_table.c.tags.isnot(None)
+                ).order_by(card_table.c.id).limit(batch_size)
+            ).all()
+            if not rows:
+                return total
+            cards = []
+            for card_id, user_id, tags in rows:
+                try:
+                    names = json.loads(tags) if tags else []
+                except ValueError:
+                    names = []
+                cards.append((card_id, user_id, names if isinstance(names, list) else []))
+            cls.sync_cards(cards, connection)
+            total += len(rows)
+            last_id = rows[-1][0]
+
+    @classmethod
+    def card_ids_query(cls, user_id, name):
+        """Subconsulta com os ids dos cards que têm a tag (busca pelo índice)"""
+        return db.select(card_tag.c.card_id).join(cls.__table__, cls.__table__.c.id == card_tag.c.tag_id).where(
+            cls.__table__.c.user_id == user_id, cls.__table__.c.name == name
+        )
+
+    @classmethod
+    def facets(cls, user_id, category_id=None):
+        """Contagem de cards por tag do usuário (nuvem de tags)"""
+        card_table = db.metadata.tables['card']
+        query = db.session.query(cls.name, db.func.count(card_tag.c.card_id)).join(
+            card_tag, card_tag.c.tag_id == cls.id
+        ).filter(cls.user_id == user_id)
+        if category_id:
+            query = query.join(card_table, card_table.c.id == card_tag.c.card_id).filter(
+                card_table.c.category_id == category_id
+            )
+        rows = query.group_by(cls.name).order_by(db.func.count(card_tag.c.card_id).desc(), cls.name).all()
+        return [{'tag': name, 'count': count} for name, count in rows]
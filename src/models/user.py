@@ -1,8 +1,11 @@
 from flask_sqlalchemy import SQLAlchemy
 from datetime import datetime
 from werkzeug.security import generate_password_hash, check_password_hash
+from src.utils.db_config import RoutingSession
+from src.utils.write_buffer import write_buffer
 
-db = SQLAlchemy()
+# Leituras de requisições GET vão para o pool somente leitura (ver db_config)
+db = SQLAlchemy(session_options={'class_': RoutingSession})
 
 class User(db.Model):
     id = db.Column(db.Integer, primary_key=True)
@@ -30,11 +33,12 @@ class User(db.Model):
         return f'<User {self.username}>'
 
     def to_dict(self):
+        last_login = write_buffer.overlay(self, ('last_login',))['last_login']
         return {
             'id': self.id,
             'username': self.username,
             'email': self.email,
             'is_admin': self.is_admin,
             'created_at': self.created_at.isoformat() if self.created_at else None,
-            'last_login': self.last_login.isoformat() if self.last_login else None
+            'last_login': last_login.isoformat() if last_login else None
         }
@@ -0,0 +1,213 @@
+from flask import Blueprint, request, jsonify, Response, stream_with_context, g
+from sqlalchemy import bindparam
+from datetime import datetime
+import io
+from src.models.user import db
+from src.models.category import Category, Theme
+from src.models.card import Card
+from src.models.study import StudySession, CardReview
+from src.models.tag import Tag
+from src.models.due_queue import due_queue
+from src.models.daily_stats import DailyUserStats
+from src.utils.anki_package import AnkiPackage, AnkiPackageError, DECK_SEPARATOR, MILLISECONDS_PER_DAY, note_to_question
+from src.utils.auth_tokens import require_user
+from src.utils.bulk_insert import insert_returning_ids
+from src.utils.fast_json import dumps
+from src.utils.response_cache import mark_user_dirty
+
+anki_import_bp = Blueprint('anki_import', __name__)
+
+# Notas (ou revisões) lidas e gravadas por transação
+ANKI_IMPORT_BATCH_SIZE = 2000
+
+# Botão do Anki (1=errei, 2=difícil, 3=bom, 4=fácil) -> difficulty_rating (1-5)
+EASE_TO_RATING = {1: 1, 2: 2, 3: 4, 4: 5}
+
+class AnkiImporter:
+    """Importa um pacote .apkg para `user_id`.
+
+    Baralhos 'Pai::Filho' viram categoria 'Pai' e tema 'Filho' (níveis
+    abaixo do segundo ficam no nome do tema); categorias e temas com o mesmo
+    nome são reaproveitados. Cada nota vira um card com o agendamento do seu
+    primeiro card no Anki. Com `include_reviews`, o histórico (revlog) vira
+    CardReview, agrupado numa sessão de revisão por dia.
+
+    Cada lote é gravado e commitado na sua transação; se a importação falhar
+    no meio, os lotes anteriores permanecem.
+    """
+
+    def __init__(self, package, user_id, include_reviews=False, batch_size=ANKI_IMPORT_BATCH_SIZE):
+        self.package = package
+        self.user_id = user_id
+        self.include_reviews = include_reviews
+        self.batch_size = batch_size
+        self.card_ids = {}  # id da nota no Anki -> id do card
+        self.counts = {'notes': 0, 'cards': 0, 'skipped': 0, 'sessions': 0, 'reviews': 0}
+        self._locations = {}  # id do baralho -> (category_id, theme_id)
+        self._categories = {name: category_id for category_id, name in db.session.query(Category.id, Category.name)
+                            .filter(Category.user_id == user_id)}
+        self._themes = {(category_id, name): theme_id for theme_id, category_id, name
+                        in db.session.query(Theme.id, Theme.category_id, Theme.name)
+                        .filter(Theme.category_id.in_(list(self._categories.values()) or [0]))}
+
+    def _deck_location(self, deck_id):
+        """(category_id, theme_id) do baralho, criando categoria e tema se preciso"""
+        if deck_id in self._locations:
+            return self._locations[deck_id]
+        name = self.package.decks.get(deck_id) or 'Anki'
+        category_name, _, theme_name = (part.strip() for part in name.partition(DECK_SEPARATOR))
+        category_name = category_name[:100] or 'Anki'
+
+        category_id = self._categories.get(category_name)
+        if category_id is None:
+            category = Category(user_id=self.user_id, name=category_name)
+            db.session.add(category)
+            db.session.flush()
+            category_id = self._categories[category_name] = category.id
+
+        theme_id = None
+        if theme_name:
+            theme_name = theme_name[:100]
+            theme_id = self._themes.get((category_id, theme_name))
+            if theme_id is None:
+                theme = Theme(category_id=category_id, name=theme_name)
+                db.session.add(theme)
+                db.session.flush()
+                theme_id = self._themes[(category_id, theme_name)] = theme.id
+
+        self._locations[deck_id] = (category_id, theme_id)
+        return category_id, theme_id
+
+    def import_notes(self):
+        now = datetime.utcnow()
+        for notes in self.package.iter_notes(self.batch_size):
+            note_ids = []
+            rows = []
+            for note_id, fields, tags, deck_id, card_type, due, interval, factor, reps in notes:
+                question, answer = note_to_question(fields)
+                if not question or not answer:
+                    self.counts['skipped'] += 1
+                    continue
+                category_id, theme_id = self._deck_location(deck_id)
+                note_ids.append(note_id)
+                rows.append({
+                    'user_id': self.user_id,
+                    'category_id': category_id,
+                    'theme_id': theme_id,
+                    'question': question,
+                    'answer': answer,
+                    'difficulty': 'medium',
+                    'tags': Card.serialize_tags(tags),
+                    'created_at': datetime.utcfromtimestamp(note_id / 1000),
+                    'next_review': self.package.due_date(card_type, due, now),
+                    'review_count': reps or 0,
+                    'ease_factor': factor / 1000 if factor else 2.5
+                })
+            self.counts['notes'] += len(notes)
+
+            if rows:
+                card_ids = insert_returning_ids(Card.__table__, rows)
+                self.card_ids.update(zip(note_ids, card_ids))
+                Tag.sync_cards([(card_id, self.user_id, Card.parse_tags(row['tags']))
+                                for card_id, row in zip(card_ids, rows) if row['tags']])
+                self.counts['cards'] += len(rows)
+            db.session.commit()
+            yield dict(self.counts)
+
+    def import_reviews(self):
+        days = self.package.review_days()
+        session_rows = [{
+            'user_id': self.user_id,
+            'started_at': datetime.utcfromtimestamp(first / 1000),
+            'ended_at': datetime.utcfromtimestamp(last / 1000),
+            'total_cards': total,
+            'correct_answers': correct,
+            'session_type': 'review'
+        } for _, first, last, total, correct in days]
+        session_ids = dict(zip((day for day, *_ in days), insert_returning_ids(StudySession.__table__, session_rows)))
+        self.counts['sessions'] = len(session_ids)
+        db.session.commit()
+
+        # Revisões de notas que não viraram card: descontadas dos totais da sessão
+        dropped = {}
+        for reviews in self.package.iter_reviews(self.batch_size):
+            rows = []
+            for reviewed_ms, note_id, ease, time_ms in reviews:
+                session_id = session_ids[reviewed_ms // MILLISECONDS_PER_DAY]
+                card_id = self.card_ids.get(note_id)
+                if card_id is None:
+                    total, correct = dropped.get(session_id, (0, 0))
+                    dropped[session_id] = (total + 1, correct + (ease > 1))
+                    continue
+                rows.append({
+                    'user_id': self.user_id,
+                    'card_id': card_id,
+                    'session_id': session_id,
+                    'is_correct': ease > 1,
+                    'response_time': round((time_ms or 0) / 1000),
+                    'difficulty_rating': EASE_TO_RATING.get(ease, 3),
+                    'reviewed_at': datetime.utcfromtimestamp(reviewed_ms / 1000)
+                })
+            if rows:
+                db.session.execute(CardReview.__table__.insert(), rows)
+                self.counts['reviews'] += len(rows)
+            db.session.commit()
+            yield dict(self.counts)
+
+        if dropped:
+            table = StudySession.__table__
+            db.session.execute(
+                table.update().where(table.c.id == bindparam('b_id')).values(
+                    total_cards=table.c.total_cards - bindparam('b_total'),
+                    correct_answers=table.c.correct_answers - bindparam('b_correct')
+                ),
+                [{'b_id': session_id, 'b_total': total, 'b_correct': correct}
+                 for session_id, (total, correct) in dropped.items()]
+            )
+
+    def run(self):
+        """Gera o progresso (contagens acumuladas) a cada lote gravado"""
+        yield from self.import_notes()
+        if self.include_reviews and self.card_ids:
+            yield from self.import_reviews()
+            # Inserts em lote não passam pelos eventos do ORM: recalcular os agregados
+            DailyUserStats.rebuild(user_id=self.user_id)
+        due_queue.invalidate_on_commit(db.session, self.user_id)
+        mark_user_dirty(db.session, self.user_id)
+        db.session.commit()
+
+@anki_import_bp.route('/anki/import', methods=['POST'])
+@require_user
+def import_anki_package():
+    """Importar um baralho do Anki (.apkg, multipart ou corpo bruto) com progresso em NDJSON"""
+    try:
+        upload = request.files.get('file')
+        params = request.form if upload else request.args
+        include_reviews = params.get('include_reviews', 'false').lower() in ('1', 'true', 'yes')
+
+        try:
+            package = AnkiPackage(upload.stream if upload else io.BytesIO(request.get_data()))
+        except AnkiPackageError as e:
+            return jsonify({'error': str(e)}), 400
+
+        importer = AnkiImporter(package, g.principal.id, include_reviews=include_reviews)
+
+        def generate():
+            try:
+                for progress in importer.run():
+                    yield dumps(progress) + b'\n'
+                yield dumps({
+                    'done': True,
+                    'message': f"{importer.counts['cards']} cards importados do Anki",
+                    **importer.counts
+                }) + b'\n'
+            except Exception as e:
+                db.session.rollback()
+                yield dumps({'error': str(e), **importer.counts}) + b'\n'
+            finally:
+                package.close()
+
+        return Response(stream_with_context(generate()), mimetype='application/x-ndjson')
+    except Exception as e:
+        db.session.rollback()
+        return jsonify({'error': str(e)}), 500
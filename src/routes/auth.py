@@ -1,6 +1,9 @@
-from flask import Blueprint, request, jsonify
+from flask import Blueprint, request, jsonify, current_app, g
 from datetime import datetime
 from src.models.user import db, User
+from src.utils.auth_tokens import issue_token, require_user
+from src.utils.passwords import password_hasher, PasswordPoolBusy
+from src.utils.write_buffer import write_buffer
 
 auth_bp = Blueprint('auth', __name__)
 
@@ -25,16 +28,22 @@ def register():
             username=data['username'],
             email=data['email']
         )
-        user.set_password(data['password'])
+        user.password_hash = password_hasher.hash(data['password'])
         
         db.session.add(user)
         db.session.commit()
         
         return jsonify({
             'message': 'Usuário criado com sucesso',
-            'user': user.to_dict()
+            'user': user.to_dict(),
+            'access_token': issue_token(user),
+            'token_type': 'Bearer',
+            'expires_in': current_app.config['ACCESS_TOKEN_TTL']
         }), 201
         
+    except PasswordPoolBusy as e:
+        db.session.rollback()
+        return jsonify({'error': str(e)}), 503, {'Retry-After': '1'}
     except Exception as e:
         db.session.rollback()
         return jsonify({'error': str(e)}), 500
@@ -50,24 +59,38 @@ def login():
         # Buscar usuário
         user = User.query.filter_by(username=data['username']).first()
         
-        if not user or not user.check_password(data['password']):
+        # Hash verificado no pool limitado, fora das threads de requisição
+        if not user or not password_hasher.verify(user.password_hash, data['password']):
             return jsonify({'error': 'Credenciais inválidas'}), 401
         
-        # Atualizar último login
-        user.last_login = datetime.utcnow()
-        db.session.commit()
+        # Último login vai pelo buffer de escrita (sem transação própria por login)
+        write_buffer.assign(User, user.id, last_login=datetime.utcnow())
         
         return jsonify({
             'message': 'Login realizado com sucesso',
-            'user': user.to_dict()
+            'user': user.to_dict(),
+            'access_token': issue_token(user),
+            'token_type': 'Bearer',
+            'expires_in': current_app.config['ACCESS_TOKEN_TTL']
         }), 200
         
+    except PasswordPoolBusy as e:
+        return jsonify({'error': str(e)}), 503, {'Retry-After': '1'}
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
+@auth_bp.route('/me', methods=['GET'])
+@require_user
+def get_current_user():
+    """Usuário do token (sem consultar o banco quando o principal está em cache)"""
+    return jsonify(g.principal._asdict()), 200
+
 @auth_bp.route('/profile/<int:user_id>', methods=['GET'])
+@require_user
 def get_profile(user_id):
     try:
+        if g.principal.id != user_id and not g.principal.is_admin:
+            return jsonify({'error': 'Acesso negado aos dados de outro usuário'}), 403
         user = User.query.get_or_404(user_id)
         return jsonify(user.to_dict()), 200
     except Exception as e:
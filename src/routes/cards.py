@@ -0,0 +1,365 @@
+from flask import Blueprint, request, jsonify, g
+from datetime import datetime
+from src.models.user import db
+from src.models.card import Card
+from src.models.category import Category, Theme
+from src.models import scheduler
+from src.models.tag import Tag
+from src.utils.auth_tokens import require_user
+from src.utils.response_cache import response_cache, mark_user_dirty
+
+cards_bp = Blueprint('cards', __name__)
+
+@cards_bp.route('/cards', methods=['GET'])
+@require_user
+def get_cards():
+    """Cards do usuário, com filtros opcionais por categoria e tema"""
+    try:
+        query = Card.query.filter_by(user_id=g.principal.id)
+        
+        category_id = request.args.get('category_id', type=int)
+        if category_id:
+            query = query.filter_by(category_id=category_id)
+        theme_id = request.args.get('theme_id', type=int)
+        if theme_id:
+            query = query.filter_by(theme_id=theme_id)
+        
+        cards = query.order_by(Card.created_at.desc()).all()
+        return jsonify([card.to_dict() for card in cards]), 200
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+@cards_bp.route('/cards/study', methods=['GET'])
+@require_user
+def get_study_cards():
+    """Cards vencidos para uma sessão de estudo, os mais atrasados primeiro"""
+    try:
+        limit = min(request.args.get('limit', 20, type=int), 200)
+        cards = Card.due_cards(g.principal.id, limit=limit)
+        return jsonify([card.to_dict() for card in cards]), 200
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+@cards_bp.route('/cards', methods=['POST'])
+@require_user
+def create_card():
+    try:
+        data = request.get_json()
+        
+        required_fields = ['category_id', 'question', 'answer']
+        if not data or not all(data.get(field) for field in required_fields):
+            return jsonify({'error': 'category_id, question e answer são obrigatórios'}), 400
+        
+        try:
+            check_card_targets(owned_targets(g.principal.id), data['category_id'], data.get('theme_id'))
+        except ValueError as e:
+            return jsonify({'error': str(e)}), 400
+        
+        card = Card(
+            user_id=g.principal.id,
+            category_id=data['category_id'],
+            theme_id=data.get('theme_id'),
+            question=data['question'],
+            answer=data['answer'],
+            difficulty=data.get('difficulty', 'medium')
+        )
+        
+        # Definir tags se fornecidas
+        if data.get('tags'):
+            card.set_tags(data['tags'])
+        
+        db.session.add(card)
+        db.session.commit()
+        
+        return jsonify(card.to_dict()), 201
+    except Exception as e:
+        db.session.rollback()
+        return jsonify({'error': str(e)}), 500
+
+def encode_cursor(moment, row_id):
+    """Cursor de paginação por chave no formato <datetime ISO>|<id>"""
+    return f"{moment.isoformat()}|{row_id}"
+
+def decode_cursor(cursor):
+    moment, row_id = cursor.rsplit('|', 1)
+    return datetime.fromisoformat(moment), int(row_id)
+
+def owned_targets(user_id):
+    """Categorias do usuário e os temas de cada uma: ({category_id}, {theme_id: category_id})"""
+    category_ids = {category_id for (category_id,) in db.session.query(Category.id).filter(
+        Category.user_id == user_id
+    ).all()}
+    themes = dict(db.session.query(Theme.id, Theme.category_id).filter(
+        Theme.category_id.in_(category_ids)
+    ).all()) if category_ids else {}
+    return category_ids, themes
+
+def _as_id(value):
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
+
+def check_card_targets(targets, category_id, theme_id=None):
+    """Garante que categoria e tema existem, são do usuário e o tema é da categoria"""
+    category_ids, themes = targets
+    if _as_id(category_id) not in category_ids:
+        raise ValueError(f'Categoria {category_id} não encontrada')
+    if theme_id and themes.get(_as_id(theme_id)) != _as_id(category_id):
+        raise ValueError(f'Tema {theme_id} não encontrado na categoria {category_id}')
+
+def build_card_row(user_id, data, targets):
+    """Valida os dados de um card do usuário e monta a linha para inserção em lote.
+
+    `targets` vem de owned_targets(user_id), carregado uma vez por requisição.
+    """
+    required_fields = ['category_id', 'question', 'answer']
+    if not data or not all(data.get(field) for field in required_fields):
+        raise ValueError('category_id, question e answer são obrigatórios')
+    check_card_targets(targets, data['category_id'], data.get('theme_id'))
+    
+    difficulty = data.get('difficulty') or 'medium'
+    if difficulty not in ('easy', 'medium', 'hard'):
+        raise ValueError(f'difficulty inválida: {difficulty}')
+    
+    return {
+        'user_id': user_id,
+        'category_id': _as_id(data['category_id']),
+        'theme_id': _as_id(data.get('theme_id')),
+        'question': data['question'],
+        'answer': data['answer'],
+        'difficulty': difficulty,
+        'tags': Card.serialize_tags(data.get('tags'))
+    }
+
+def _bulk_status(created, total):
+    """201 se todos os itens foram criados, 207 se só parte, 400 se nenhum"""
+    if not created:
+        return 400
+    return 201 if created == total else 207
+
+@cards_bp.route('/cards/bulk', methods=['POST'])
+@require_user
+def create_cards_bulk():
+    """Criar vários cards numa única transação"""
+    try:
+        data = request.get_json()
+        
+        if not data or not isinstance(data.get('cards'), list):
+            return jsonify({'error': 'cards é obrigatório'}), 400
+        
+        # Campos comuns (category_id, theme_id, ...) aplicados a todos os cards
+        defaults = data.get('defaults') or {}
+        
+        targets = owned_targets(g.principal.id)
+        results = []
+        rows = []
+        for index, card_data in enumerate(data['cards']):
+            try:
+                if card_data is not None and not isinstance(card_data, dict):
+                    raise ValueError('cada card deve ser um objeto')
+                rows.append(build_card_row(g.principal.id, {**defaults, **(card_data or {})}, targets))
+                results.append({'index': index, 'status': 'created'})
+            except ValueError as e:
+                results.append({'index': index, 'status': 'error', 'error': str(e)})
+        
+        ids = Card.bulk_create(rows)
+        if rows:
+            mark_user_dirty(db.session, g.principal.id)
+        db.session.commit()
+        
+        created = iter(ids)
+        for result in results:
+            if result['status'] == 'created':
+                result['id'] = next(created)
+        
+        return jsonify({
+            'created': len(rows),
+            'failed': len(results) - len(rows),
+            'results': results
+        }), _bulk_status(len(rows), len(results))
+    except Exception as e:
+        db.session.rollback()
+        return jsonify({'error': str(e)}), 500
+
+@cards_bp.route('/cards/due', methods=['GET'])
+@require_user
+def get_due_cards():
+    """Fila de revisão paginada por chave (next_review, id)"""
+    try:
+        limit = min(request.args.get('limit', 20, type=int), 200)
+        
+        after = None
+        cursor = request.args.get('cursor')
+        if cursor:
+            try:
+                after = decode_cursor(cursor)
+            except ValueError:
+                return jsonify({'error': 'cursor inválido'}), 400
+        
+        cards = Card.due_cards(g.principal.id, limit=limit, after=after, use_queue=after is None)
+        
+        next_cursor = None
+        if len(cards) == limit:
+            last = cards[-1]
+            next_cursor = encode_cursor(last.next_review, last.id)
+        
+        return jsonify({
+            'cards': [card.to_dict() for card in cards],
+            'next_cursor': next_cursor
+        }), 200
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+@cards_bp.route('/cards/page', methods=['GET'])
+@require_user
+@response_cache.cached()
+def get_cards_page():
+    """Listagem paginada por (created_at, id), com projeção de campos e filtros"""
+    try:
+        limit = min(request.args.get('limit', 100, type=int), 1000)
+        
+        # Ex: fields=id,question,category_id (sem answer nas listagens)
+        fields = None
+        if request.args.get('fields'):
+            fields = [name.strip() for name in request.args['fields'].split(',') if name.strip()]
+            invalid = [name for name in fields if name not in Card.FIELDS]
+            if invalid:
+                return jsonify({'error': f'Campos inválidos: {", ".join(invalid)}'}), 400
+        
+        filters = {
+            'category_id': request.args.get('category_id', type=int),
+            'theme_id': request.args.get('theme_id', type=int),
+            'difficulty': request.args.get('difficulty'),
+            'tag': request.args.get('tag')
+        }
+        
+        after = None
+        cursor = request.args.get('cursor')
+        if cursor:
+            try:
+                after = decode_cursor(cursor)
+            except ValueError:
+                return jsonify({'error': 'cursor inválido'}), 400
+        
+        rows = Card.page(g.principal.id, fields=fields, filters=filters, after=after, limit=limit)
+        
+        next_cursor = None
+        if len(rows) == limit and rows[-1].created_at:
+            next_cursor = encode_cursor(rows[-1].created_at, rows[-1].id)
+        
+        encode = Card.page_encoder(fields)
+        return jsonify({
+            'cards': [encode(row) for row in rows],
+            'next_cursor': next_cursor
+        }), 200
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+@cards_bp.route('/cards/tags', methods=['GET'])
+@require_user
+@response_cache.cached()
+def get_card_tags():
+    """Facetas de tags: quantidade de cards por tag do usuário"""
+    try:
+        return jsonify(Tag.facets(g.principal.id, category_id=request.args.get('category_id', type=int))), 200
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+@cards_bp.route('/cards/reschedule-overdue', methods=['POST'])
+@require_user
+def reschedule_overdue_cards():
+    """Redistribuir cards atrasados ao longo dos próximos dias (ex: volta de férias)"""
+    try:
+        data = request.get_json(silent=True) or {}
+        
+        spread_days = data.get('spread_days', 7)
+        if not isinstance(spread_days, (int, float)) or spread_days <= 0:
+            return jsonify({'error': 'spread_days deve ser positivo'}), 400
+        
+        total = scheduler.reschedule_overdue(g.principal.id, spread_days=spread_days)
+        mark_user_dirty(db.session, g.principal.id)
+        db.session.commit()
+        
+        return jsonify({'message': f'{total} cards reagendados', 'rescheduled': total}), 200
+    except Exception as e:
+        db.session.rollback()
+        return jsonify({'error': str(e)}), 500
+
+@cards_bp.route('/cards/ease-policy', methods=['POST'])
+@require_user
+def apply_ease_policy():
+    """Aplicar uma nova política de ease_factor a todo o baralho do usuário"""
+    try:
+        data = request.get_json(silent=True) or {}
+        
+        changed = scheduler.apply_ease_policy(
+            g.principal.id,
+            ease_delta=data.get('ease_delta', 0.0),
+            min_ease=data.get('min_ease', scheduler.MIN_EASE_FACTOR),
+            max_ease=data.get('max_ease'),
+            category_id=data.get('category_id')
+        )
+        mark_user_dirty(db.session, g.principal.id)
+        db.session.commit()
+        
+        return jsonify({'message': f'{changed} cards atualizados', 'updated': changed}), 200
+    except Exception as e:
+        db.session.rollback()
+        return jsonify({'error': str(e)}), 500
+
+@cards_bp.route('/cards/<int:card_id>', methods=['PUT'])
+@require_user
+def update_card(card_id):
+    try:
+        card = Card.query.filter_by(id=card_id, user_id=g.principal.id).first()
+        if card is None:
+            return jsonify({'error': 'Card não encontrado'}), 404
+        data = request.get_json(silent=True) or {}
+        
+        if data.get('category_id') or data.get('theme_id'):
+            # O tema atual do card também precisa pertencer à nova categoria
+            category_id = data.get('category_id') or card.category_id
+            theme_id = data.get('theme_id') or card.theme_id
+            try:
+                check_card_targets(owned_targets(g.principal.id), category_id, theme_id)
+            except ValueError as e:
+                return jsonify({'error': str(e)}), 400
+        
+        # Atualizar campos se fornecidos
+        if data.get('question'):
+            card.question = data['question']
+        if data.get('answer'):
+            card.answer = data['answer']
+        if data.get('difficulty'):
+            card.difficulty = data['difficulty']
+        if data.get('category_id'):
+            card.category_id = data['category_id']
+        if data.get('theme_id'):
+            card.theme_id = data['theme_id']
+        if 'tags' in data:
+            card.set_tags(data['tags'])
+        
+        card.updated_at = datetime.utcnow()
+        db.session.commit()
+        
+        return jsonify(card.to_dict()), 200
+    except Exception as e:
+        db.session.rollback()
+        return jsonify({'error': str(e)}), 500
+
+@cards_bp.route('/cards/<int:card_id>', methods=['DELETE'])
+@require_user
+def delete_card(card_id):
+    try:
+        card = Card.query.filter_by(id=card_id, user_id=g.principal.id).first()
+        if card is None:
+            return jsonify({'error': 'Card não encontrado'}), 404
+        
+        db.session.delete(card)
+        db.session.commit()
+        
+        return jsonify({'message': 'Card excluído com sucesso'}), 200
+    except Exception as e:
+        db.session.rollback()
+        return jsonify({'error': str(e)}), 500
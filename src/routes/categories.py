@@ -1,32 +1,49 @@
-from flask import Blueprint, request, jsonify
+from flask import Blueprint, request, jsonify, g
 from src.models.user import db
 from src.models.category import Category, Theme
+from src.utils.auth_tokens import require_user
+from src.utils.response_cache import response_cache
+from src.utils.etag import conditional
+
+def _user_version():
+    return response_cache.version(g.principal.id)
+
+def _owned_category(category_id):
+    return Category.query.filter_by(id=category_id, user_id=g.principal.id).first()
+
+def _owned_theme(theme_id):
+    return Theme.query.join(Category, Theme.category_id == Category.id).filter(
+        Theme.id == theme_id, Category.user_id == g.principal.id
+    ).first()
 
 categories_bp = Blueprint('categories', __name__)
 
 # Rotas para Categorias
 @categories_bp.route('/categories', methods=['GET'])
+@require_user
+@conditional(_user_version)
+@response_cache.cached()
 def get_categories():
     try:
-        user_id = request.args.get('user_id')
-        if not user_id:
-            return jsonify({'error': 'user_id é obrigatório'}), 400
-        
-        categories = Category.query.filter_by(user_id=user_id).all()
-        return jsonify([category.to_dict() for category in categories]), 200
+        categories = Category.query.filter_by(user_id=g.principal.id).all()
+        counts = Category.counts([category.id for category in categories])
+        return jsonify([
+            category.to_dict(*counts.get(category.id, (0, 0))) for category in categories
+        ]), 200
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
 @categories_bp.route('/categories', methods=['POST'])
+@require_user
 def create_category():
     try:
         data = request.get_json()
         
-        if not data or not data.get('name') or not data.get('user_id'):
-            return jsonify({'error': 'Nome e user_id são obrigatórios'}), 400
+        if not data or not data.get('name'):
+            return jsonify({'error': 'Nome é obrigatório'}), 400
         
         category = Category(
-            user_id=data['user_id'],
+            user_id=g.principal.id,
             name=data['name'],
             color=data.get('color', '#2E86AB'),
             icon=data.get('icon', '📚')
@@ -35,16 +52,19 @@ def create_category():
         db.session.add(category)
         db.session.commit()
         
-        return jsonify(category.to_dict()), 201
+        return jsonify(category.to_dict(themes_count=0, cards_count=0)), 201
     except Exception as e:
         db.session.rollback()
         return jsonify({'error': str(e)}), 500
 
 @categories_bp.route('/categories/<int:category_id>', methods=['PUT'])
+@require_user
 def update_category(category_id):
     try:
-        category = Category.query.get_or_404(category_id)
-        data = request.get_json()
+        category = _owned_category(category_id)
+        if category is None:
+            return jsonify({'error': 'Categoria não encontrada'}), 404
+        data = request.get_json(silent=True) or {}
         
         if data.get('name'):
             category.name = data['name']
@@ -60,9 +80,12 @@ def update_category(category_id):
         return jsonify({'error': str(e)}), 500
 
 @categories_bp.route('/categories/<int:category_id>', methods=['DELETE'])
+@require_user
 def delete_category(category_id):
     try:
-        category = Category.query.get_or_404(category_id)
+        category = _owned_category(category_id)
+        if category is None:
+            return jsonify({'error': 'Categoria não encontrada'}), 404
         db.session.delete(category)
         db.session.commit()
         return jsonify({'message': 'Categoria deletada com sucesso'}), 200
@@ -72,19 +95,25 @@ def delete_category(category_id):
 
 # Rotas para Temas
 @categories_bp.route('/themes', methods=['GET'])
+@require_user
+@conditional(_user_version)
 def get_themes():
     try:
-        category_id = request.args.get('category_id')
+        query = Theme.query.join(Category, Theme.category_id == Category.id).filter(
+            Category.user_id == g.principal.id
+        )
+        category_id = request.args.get('category_id', type=int)
         if category_id:
-            themes = Theme.query.filter_by(category_id=category_id).all()
-        else:
-            themes = Theme.query.all()
+            query = query.filter(Theme.category_id == category_id)
+        themes = query.all()
         
-        return jsonify([theme.to_dict() for theme in themes]), 200
+        counts = Theme.cards_counts([theme.id for theme in themes])
+        return jsonify([theme.to_dict(cards_count=counts.get(theme.id, 0)) for theme in themes]), 200
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
 @categories_bp.route('/themes', methods=['POST'])
+@require_user
 def create_theme():
     try:
         data = request.get_json()
@@ -92,6 +121,9 @@ def create_theme():
         if not data or not data.get('name') or not data.get('category_id'):
             return jsonify({'error': 'Nome e category_id são obrigatórios'}), 400
         
+        if _owned_category(data['category_id']) is None:
+            return jsonify({'error': 'Categoria não encontrada'}), 404
+        
         theme = Theme(
             category_id=data['category_id'],
             name=data['name'],
@@ -101,16 +133,19 @@ def create_theme():
         db.session.add(theme)
         db.session.commit()
         
-        return jsonify(theme.to_dict()), 201
+        return jsonify(theme.to_dict(cards_count=0)), 201
     except Exception as e:
         db.session.rollback()
         return jsonify({'error': str(e)}), 500
 
 @categories_bp.route('/themes/<int:theme_id>', methods=['PUT'])
+@require_user
 def update_theme(theme_id):
     try:
-        theme = Theme.query.get_or_404(theme_id)
-        data = request.get_json()
+        theme = _owned_theme(theme_id)
+        if theme is None:
+            return jsonify({'error': 'Tema não encontrado'}), 404
+        data = request.get_json(silent=True) or {}
         
         if data.get('name'):
             theme.name = data['name']
@@ -124,9 +159,12 @@ def update_theme(theme_id):
         return jsonify({'error': str(e)}), 500
 
 @categories_bp.route('/themes/<int:theme_id>', methods=['DELETE'])
+@require_user
 def delete_theme(theme_id):
     try:
-        theme = Theme.query.get_or_404(theme_id)
+        theme = _owned_theme(theme_id)
+        if theme is None:
+            return jsonify({'error': 'Tema não encontrado'}), 404
         db.session.delete(theme)
         db.session.commit()
         return jsonify({'message': 'Tema deletado com sucesso'}), 200
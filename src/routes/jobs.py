@@ -0,0 +1,55 @@
+from flask import Blueprint, request, jsonify, g
+from src.models.user import db
+from src.models.job import Job
+from src.utils.job_runner import job_runner
+from src.utils.auth_tokens import require_admin, require_user
+
+jobs_bp = Blueprint('jobs', __name__)
+
+@jobs_bp.route('/jobs/<int:job_id>', methods=['GET'])
+@require_user
+def get_job(job_id):
+    """Consultar o status de uma tarefa em segundo plano (do próprio usuário ou, para admins, qualquer uma)"""
+    try:
+        job = db.session.get(Job, job_id)
+        # Tarefas de outros usuários respondem como inexistentes
+        if job is None or (job.created_by != g.principal.id and not g.principal.is_admin):
+            return jsonify({'error': 'Tarefa não encontrada'}), 404
+        data = job.to_dict()
+        
+        # Progresso ao vivo de tarefas em execução neste processo
+        progress = job_runner.live_progress(job_id)
+        if progress is not None:
+            data['progress'] = progress
+        
+        return jsonify(data), 200
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+@jobs_bp.route('/jobs/<int:job_id>/cancel', methods=['POST'])
+@require_admin
+def cancel_job(job_id):
+    """Cancelar uma tarefa na fila ou em execução"""
+    try:
+        job = Job.query.get_or_404(job_id)
+        if not job_runner.cancel(job):
+            return jsonify({'error': f'Tarefa com status {job.status} não pode ser cancelada'}), 409
+        
+        return jsonify({'message': 'Cancelamento solicitado', 'job': job.to_dict()}), 202
+    except Exception as e:
+        db.session.rollback()
+        return jsonify({'error': str(e)}), 500
+
+@jobs_bp.route('/jobs/<int:job_id>/retry', methods=['POST'])
+@require_admin
+def retry_job(job_id):
+    """Reenfileirar uma tarefa que falhou ou foi cancelada"""
+    try:
+        job = Job.query.get_or_404(job_id)
+        if not job_runner.retry(job):
+            return jsonify({'error': f'Tarefa com status {job.status} não pode ser reexecutada'}), 409
+        
+        return jsonify({'message': 'Tarefa reenfileirada', 'job': job.to_dict()}), 202
+    except Exception as e:
+        db.session.rollback()
+        return jsonify({'error': str(e)}), 500
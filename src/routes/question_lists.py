@@ -0,0 +1,668 @@
+from flask import Blueprint, request, jsonify, Response, stream_with_context, g
+from sqlalchemy import bindparam
+from datetime import datetime
+import bisect
+import hashlib
+import io
+import json
+import re
+from src.models.user import db
+from src.models.question_list import QuestionList, PresetQuestion
+from src.models.category import Category
+from src.models.card import Card
+from src.routes.cards import build_card_row, owned_targets
+from src.utils.job_runner import job_runner, register_job
+from src.utils.response_cache import mark_user_dirty
+from src.utils.etag import conditional
+from src.utils.auth_tokens import require_admin, require_user
+from src.utils.fast_json import row_encoder, json_array_response
+from src.utils import dedup
+
+question_lists_bp = Blueprint('question_lists', __name__)
+
+# Tamanho dos lotes de inserção no upload em streaming
+UPLOAD_BATCH_SIZE = 1000
+
+# Colunas de PresetQuestion.to_dict, lidas sem hidratar objetos
+QUESTION_FIELDS = ('id', 'question_list_id', 'question_text', 'order_index', 'created_at')
+
+# Modos aceitos no parâmetro dedup dos uploads
+DEDUP_MODES = ('exact', 'near')
+
+# Espaçamento entre order_index, para que reenvios possam intercalar perguntas
+# sem renumerar a lista inteira
+ORDER_INDEX_STEP = 100
+
+@question_lists_bp.route('/question-lists', methods=['GET'])
+@conditional(lambda: QuestionList.version_stamp())
+def get_question_lists():
+    """Buscar listas de perguntas disponíveis"""
+    try:
+        category_id = request.args.get('category_id')
+        user_id = request.args.get('user_id')
+        
+        query = QuestionList.query.filter_by(is_active=True)
+        
+        if category_id:
+            query = query.filter_by(category_id=category_id)
+            
+        lists = query.all()
+        counts = QuestionList.questions_counts([q_list.id for q_list in lists])
+        return jsonify([q_list.to_dict(questions_count=counts.get(q_list.id, 0)) for q_list in lists]), 200
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+@question_lists_bp.route('/question-lists/<int:list_id>/questions', methods=['GET'])
+@conditional(lambda list_id: QuestionList.version_stamp(list_id))
+def get_questions_from_list(list_id):
+    """Buscar perguntas de uma lista específica (resposta em streaming)"""
+    try:
+        question_list = QuestionList.query.get_or_404(list_id)
+        counts = QuestionList.questions_counts([list_id])
+        
+        rows = db.session.query(
+            *[getattr(PresetQuestion, name) for name in QUESTION_FIELDS]
+        ).filter_by(question_list_id=list_id).order_by(PresetQuestion.order_index).yield_per(1000)
+        encode = row_encoder(QUESTION_FIELDS)
+        
+        return json_array_response(
+            (encode(row) for row in rows),
+            head={'list': question_list.to_dict(questions_count=counts.get(list_id, 0))},
+            key='questions'
+        )
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+@question_lists_bp.route('/question-lists', methods=['POST'])
+@require_admin
+def create_question_list():
+    """Criar nova lista de perguntas (apenas administradores)"""
+    try:
+        data = request.get_json()
+        
+        if not data or not data.get('name'):
+            return jsonify({'error': 'name é obrigatório'}), 400
+        
+        question_list = QuestionList(
+            name=data['name'],
+            description=data.get('description', ''),
+            category_id=data.get('category_id'),
+            created_by=g.principal.id
+        )
+        
+        db.session.add(question_list)
+        db.session.commit()
+        
+        return jsonify(question_list.to_dict(questions_count=0)), 201
+    except Exception as e:
+        db.session.rollback()
+        return jsonify({'error': str(e)}), 500
+
+@question_lists_bp.route('/question-lists/<int:list_id>/upload', methods=['POST'])
+@require_admin
+def upload_questions_to_list(list_id):
+    """Upload de perguntas para uma lista via texto"""
+    try:
+        data = request.get_json()
+        
+        if not data or 'questions_text' not in data:
+            return jsonify({'error': 'questions_text é obrigatório'}), 400
+        
+        question_list = QuestionList.query.get_or_404(list_id)
+        
+        # Processar texto das perguntas
+        questions_text = data['questions_text']
+        questions = parse_questions_text(questions_text)
+        
+        if not questions:
+            return jsonify({'error': 'Nenhuma pergunta válida encontrada no texto'}), 400
+        
+        if data.get('dedup') and data['dedup'] not in DEDUP_MODES:
+            return jsonify({'error': "dedup deve ser 'exact' ou 'near'"}), 400
+        
+        # Modo assíncrono: a importação (e a remoção de duplicatas) roda em segundo plano
+        if data.get('async'):
+            job = job_runner.submit('import_questions', {
+                'list_id': list_id,
+                'questions_text': questions_text,
+                'dedup': data.get('dedup'),
+                'dedup_threshold': data.get('dedup_threshold', dedup.DEFAULT_THRESHOLD)
+            }, created_by=g.principal.id)
+            return jsonify({'message': 'Importação enfileirada', 'job_id': job.id, 'job': job.to_dict()}), 202
+        
+        # Remover duplicatas (dedup = 'exact' ou 'near') antes de gravar
+        dedup_report = None
+        if data.get('dedup'):
+            questions, dedup_report = remove_duplicates(
+                questions, data['dedup'], question_list.category_id, exclude_list_id=list_id,
+                threshold=data.get('dedup_threshold', dedup.DEFAULT_THRESHOLD)
+            )
+            # Sem perguntas novas, o diff apagaria a lista inteira
+            if not questions:
+                return jsonify({'error': 'Todas as perguntas enviadas são duplicatas', 'dedup': dedup_report}), 400
+        
+        # Aplicar apenas as diferenças em relação às perguntas existentes
+        changes = apply_questions_diff(list_id, questions)
+        
+        question_list.updated_at = datetime.utcnow()
+        db.session.commit()
+        
+        return jsonify({
+            'message': f'{len(questions)} perguntas adicionadas com sucesso',
+            'list': question_list.to_dict(questions_count=len(questions)),
+            'questions_count': len(questions),
+            'changes': changes,
+            'dedup': dedup_report
+        }), 200
+        
+    except Exception as e:
+        db.session.rollback()
+        return jsonify({'error': str(e)}), 500
+
+@question_lists_bp.route('/question-lists/upload-text', methods=['POST'])
+@require_admin
+def upload_questions_from_text():
+    """Criar lista e fazer upload de perguntas via texto em uma única operação"""
+    try:
+        data = request.get_json()
+        
+        required_fields = ['name', 'questions_text']
+        if not data or not all(data.get(field) for field in required_fields):
+            return jsonify({'error': 'name e questions_text são obrigatórios'}), 400
+        
+        # Processar texto das perguntas
+        questions_text = data['questions_text']
+        questions = parse_questions_text(questions_text)
+        
+        if not questions:
+            return jsonify({'error': 'Nenhuma pergunta válida encontrada no texto'}), 400
+        
+        if data.get('dedup') and data['dedup'] not in DEDUP_MODES:
+            return jsonify({'error': "dedup deve ser 'exact' ou 'near'"}), 400
+        
+        # Remover duplicatas (dedup = 'exact' ou 'near') antes de gravar; no modo
+        # assíncrono isso fica para a tarefa
+        dedup_report = None
+        if data.get('dedup') and not data.get('async'):
+            questions, dedup_report = remove_duplicates(
+                questions, data['dedup'], data.get('category_id'),
+                threshold=data.get('dedup_threshold', dedup.DEFAULT_THRESHOLD)
+            )
+            if not questions:
+                return jsonify({'error': 'Todas as perguntas enviadas são duplicatas', 'dedup': dedup_report}), 400
+        
+        # Criar lista
+        question_list = QuestionList(
+            name=data['name'],
+            description=data.get('description', ''),
+            category_id=data.get('category_id'),
+            created_by=g.principal.id
+        )
+        
+        db.session.add(question_list)
+        db.session.flush()  # Para obter o ID
+        
+        # Modo assíncrono: cria a lista agora e importa as perguntas em segundo plano
+        if data.get('async'):
+            db.session.commit()
+            job = job_runner.submit('import_questions', {
+                'list_id': question_list.id,
+                'questions_text': questions_text,
+                'dedup': data.get('dedup'),
+                'dedup_threshold': data.get('dedup_threshold', dedup.DEFAULT_THRESHOLD)
+            }, created_by=g.principal.id)
+            return jsonify({
+                'message': 'Lista criada, importação enfileirada',
+                'list': question_list.to_dict(questions_count=0),
+                'job_id': job.id,
+                'job': job.to_dict()
+            }), 202
+        
+        # Adicionar perguntas
+        for index, question_text in enumerate(questions):
+            preset_question = PresetQuestion(
+                question_list_id=question_list.id,
+                question_text=question_text,
+                order_index=(index + 1) * ORDER_INDEX_STEP
+            )
+            db.session.add(preset_question)
+        
+        db.session.commit()
+        
+        return jsonify({
+            'message': f'Lista criada com {len(questions)} perguntas',
+            'list': question_list.to_dict(questions_count=len(questions)),
+            'questions_count': len(questions),
+            'dedup': dedup_report
+        }), 201
+        
+    except Exception as e:
+        db.session.rollback()
+        return jsonify({'error': str(e)}), 500
+
+@question_lists_bp.route('/question-lists/dedup-report', methods=['POST'])
+def dedup_report():
+    """Relatório de duplicatas de um texto de perguntas, sem gravar nada"""
+    try:
+        data = request.get_json()
+        
+        if not data or 'questions_text' not in data:
+            return jsonify({'error': 'questions_text é obrigatório'}), 400
+        
+        questions = parse_questions_text(data['questions_text'])
+        if not questions:
+            return jsonify({'error': 'Nenhuma pergunta válida encontrada no texto'}), 400
+        
+        # Escopo: a categoria informada ou a da lista que será substituída
+        list_id = data.get('list_id')
+        category_id = data.get('category_id')
+        if list_id and not category_id:
+            category_id = QuestionList.query.get_or_404(list_id).category_id
+        
+        _, report = remove_duplicates(
+            questions, data.get('mode', 'near'), category_id, exclude_list_id=list_id,
+            threshold=data.get('threshold', dedup.DEFAULT_THRESHOLD)
+        )
+        return jsonify(report), 200
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+@question_lists_bp.route('/question-lists/<int:list_id>/materialize', methods=['POST'])
+@require_user
+def materialize_question_list(list_id):
+    """Criar cards para o usuário a partir de todas as perguntas de uma lista"""
+    try:
+        data = request.get_json()
+        
+        if not data or not data.get('category_id'):
+            return jsonify({'error': 'category_id é obrigatório'}), 400
+        
+        QuestionList.query.get_or_404(list_id)
+        
+        questions = db.session.query(PresetQuestion.question_text).filter_by(
+            question_list_id=list_id
+        ).order_by(PresetQuestion.order_index).all()
+        
+        if not questions:
+            return jsonify({'error': 'A lista não possui perguntas'}), 400
+        
+        # Resposta opcional: os cards ficam com um espaço até o usuário preencher
+        card_defaults = {
+            'category_id': data['category_id'],
+            'theme_id': data.get('theme_id'),
+            'answer': data.get('answer') or ' ',
+            'difficulty': data.get('difficulty', 'medium'),
+            'tags': data.get('tags')
+        }
+        targets = owned_targets(g.principal.id)
+        rows = [build_card_row(g.principal.id, {**card_defaults, 'question': question_text}, targets)
+                for (question_text,) in questions]
+        
+        ids = Card.bulk_create(rows)
+        mark_user_dirty(db.session, g.principal.id)
+        db.session.commit()
+        
+        results = [{'index': index, 'status': 'created', 'id': card_id} for index, card_id in enumerate(ids)]
+        
+        return jsonify({
+            'message': f'{len(rows)} cards criados com sucesso',
+            'created': len(rows),
+            'failed': 0,
+            'results': results
+        }), 201
+    except ValueError as e:
+        db.session.rollback()
+        return jsonify({'error': str(e)}), 400
+    except Exception as e:
+        db.session.rollback()
+        return jsonify({'error': str(e)}), 500
+
+def remove_duplicates(questions, mode, category_id=None, exclude_list_id=None, threshold=dedup.DEFAULT_THRESHOLD):
+    """Filtrar duplicatas exatas ('exact') ou também quase-duplicatas ('near').
+
+    Compara as perguntas entre si e com as listas ativas da mesma categoria
+    (exceto a lista que está sendo substituída). Retorna (perguntas mantidas, relatório).
+    """
+    if mode not in DEDUP_MODES:
+        raise ValueError("dedup deve ser 'exact' ou 'near'")
+    
+    existing = []
+    if category_id:
+        query = db.session.query(
+            PresetQuestion.id, PresetQuestion.question_text, PresetQuestion.question_list_id
+        ).join(QuestionList, QuestionList.id == PresetQuestion.question_list_id).filter(
+            QuestionList.category_id == category_id, QuestionList.is_active == True
+        )
+        if exclude_list_id:
+            query = query.filter(PresetQuestion.question_list_id != exclude_list_id)
+        existing = query.all()
+    
+    result = dedup.find_duplicates(questions, existing, threshold=threshold, near=(mode == 'near'))
+    removed = set(result['duplicate_indexes'])
+    kept = [question for index, question in enumerate(questions) if index not in removed]
+    
+    return kept, {
+        'mode': mode,
+        'total': len(questions),
+        'kept': len(kept),
+        'removed': len(removed),
+        'exact': result['exact'],
+        'near': result['near']
+    }
+
+def iter_questions(lines):
+    """Processar linhas de forma incremental e gerar as perguntas válidas"""
+    for line in lines:
+        line = line.strip()
+        if not line:
+            continue
+            
+        # Remover numeração no início (ex: "1.", "2)", "1-", etc.)
+        cleaned_line = re.sub(r'^\d+[\.\)\-\s]+', '', line)
+        
+        # Remover traços no final (ex: "Pergunta - ")
+        cleaned_line = re.sub(r'\s*-\s*$', '', cleaned_line)
+        
+        # Verificar se ainda há conteúdo após limpeza
+        if cleaned_line.strip():
+            yield cleaned_line.strip()
+
+def parse_questions_text(text):
+    """Processar texto e extrair perguntas"""
+    return list(iter_questions(text.strip().split('\n')))
+
+def insert_questions_in_batches(list_id, questions, batch_size=UPLOAD_BATCH_SIZE):
+    """Inserir perguntas em lotes de tamanho fixo, gerando o total inserido após cada lote"""
+    table = PresetQuestion.__table__
+    batch = []
+    total = 0
+    for question_text in questions:
+        total += 1
+        batch.append({
+            'question_list_id': list_id,
+            'question_text': question_text,
+            'order_index': total * ORDER_INDEX_STEP
+        })
+        if len(batch) >= batch_size:
+            db.session.execute(table.insert(), batch)
+            batch = []
+            yield total
+    if batch:
+        db.session.execute(table.insert(), batch)
+        yield total
+
+def question_hash(question_text):
+    """Hash do conteúdo de uma pergunta, usado para comparar uploads"""
+    return hashlib.sha1(question_text.encode('utf-8')).hexdigest()
+
+def _increasing_anchors(pairs):
+    """Maior subsequência crescente de pares (posição nova, posição antiga)"""
+    tails = []
+    tails_idx = []
+    parents = [None] * len(pairs)
+    for i, (_, old_rank) in enumerate(pairs):
+        pos = bisect.bisect_left(tails, old_rank)
+        if pos == len(tails):
+            tails.append(old_rank)
+            tails_idx.append(i)
+        else:
+            tails[pos] = old_rank
+            tails_idx[pos] = i
+        parents[i] = tails_idx[pos - 1] if pos else None
+    
+    anchors = []
+    i = tails_idx[-1] if tails_idx else None
+    while i is not None:
+        anchors.append(pairs[i])
+        i = parents[i]
+    return anchors[::-1]
+
+def diff_questions(existing, questions):
+    """Comparar as perguntas existentes com as novas.
+
+    `existing` são tuplas (id, question_text, order_index) e `questions` a lista
+    nova na ordem final. Perguntas com o mesmo hash reaproveitam a linha; as que
+    mantêm a ordem relativa (âncoras) não são tocadas. Entre duas âncoras, as
+    linhas antigas que sobraram recebem o texto das novas (edições), o excedente
+    vira inserção ou remoção. Os novos order_index são encaixados nos intervalos
+    entre âncoras; sem espaço, a lista inteira é renumerada com passo
+    ORDER_INDEX_STEP. Retorna (inserts, updates, delete_ids).
+    """
+    existing = sorted(existing, key=lambda row: (row[2] or 0, row[0]))
+    
+    by_hash = {}
+    for rank, row in enumerate(existing):
+        by_hash.setdefault(question_hash(row[1]), []).append(rank)
+    
+    # Casar por conteúdo: posição nova -> posição antiga
+    matched = {}
+    for position, question_text in enumerate(questions):
+        ranks = by_hash.get(question_hash(question_text))
+        if ranks:
+            matched[position] = ranks.pop(0)
+    
+    anchors = _increasing_anchors(sorted(matched.items()))
+    anchor_positions = {position for position, _ in anchors}
+    used_ranks = set(matched.values())
+    
+    # Para cada posição nova: linha reaproveitada (rank) ou None (inserção)
+    assigned = [matched.get(position) for position in range(len(questions))]
+    text_changed = set()
+    delete_ranks = []
+    bounds = [(-1, -1)] + anchors + [(len(questions), len(existing))]
+    for (prev_pos, prev_rank), (next_pos, next_rank) in zip(bounds, bounds[1:]):
+        free_ranks = [rank for rank in range(prev_rank + 1, next_rank) if rank not in used_ranks]
+        for position in range(prev_pos + 1, next_pos):
+            if assigned[position] is None and free_ranks:
+                assigned[position] = free_ranks.pop(0)
+                text_changed.add(position)
+        delete_ranks.extend(free_ranks)
+    
+    # Calcular order_index: âncoras mantêm o seu, os demais ocupam os intervalos
+    order = [None] * len(questions)
+    for position, rank in anchors:
+        order[position] = existing[rank][2] or 0
+    bounds = [(-1, 0)] + [(position, order[position]) for position, _ in anchors] + [(len(questions), None)]
+    fits = True
+    for (prev_pos, low), (next_pos, high) in zip(bounds, bounds[1:]):
+        count = next_pos - prev_pos - 1
+        if not count:
+            continue
+        if high is None:
+            for offset in range(count):
+                order[prev_pos + 1 + offset] = low + (offset + 1) * ORDER_INDEX_STEP
+        elif high - low > count:
+            for offset in range(count):
+                order[prev_pos + 1 + offset] = low + (offset + 1) * (high - low) // (count + 1)
+        else:
+            fits = False
+            break
+    if not fits:
+        order = [(position + 1) * ORDER_INDEX_STEP for position in range(len(questions))]
+    
+    inserts = []
+    updates = []
+    for position, question_text in enumerate(questions):
+        rank = assigned[position]
+        if rank is None:
+            inserts.append((order[position], question_text))
+        elif position in text_changed or existing[rank][2] != order[position]:
+            updates.append({
+                'b_id': existing[rank][0],
+                'question_text': question_text,
+                'order_index': order[position]
+            })
+    
+    delete_ids = [existing[rank][0] for rank in delete_ranks]
+    return inserts, updates, delete_ids
+
+def apply_questions_diff(list_id, questions):
+    """Aplicar ao banco somente inserções, atualizações e remoções necessárias"""
+    table = PresetQuestion.__table__
+    existing = db.session.query(
+        PresetQuestion.id, PresetQuestion.question_text, PresetQuestion.order_index
+    ).filter_by(question_list_id=list_id).all()
+    
+    inserts, updates, delete_ids = diff_questions(existing, questions)
+    
+    for start in range(0, len(delete_ids), 500):
+        db.session.execute(table.delete().where(table.c.id.in_(delete_ids[start:start + 500])))
+    if updates:
+        db.session.execute(
+            table.update().where(table.c.id == bindparam('b_id')).values(
+                question_text=bindparam('question_text'),
+                order_index=bindparam('order_index')
+            ),
+            updates
+        )
+    if inserts:
+        db.session.execute(table.insert(), [
+            {'question_list_id': list_id, 'question_text': question_text, 'order_index': order_index}
+            for order_index, question_text in inserts
+        ])
+    
+    return {'inserted': len(inserts), 'updated': len(updates), 'deleted': len(delete_ids)}
+
+@register_job('import_questions')
+def run_import_questions(context, payload):
+    """Tarefa em segundo plano: remover duplicatas (opcional) e substituir as perguntas de uma lista"""
+    list_id = payload['list_id']
+    
+    questions = parse_questions_text(payload['questions_text'])
+    if not questions:
+        raise ValueError('Nenhuma pergunta válida encontrada no texto')
+    
+    dedup_report = None
+    if payload.get('dedup'):
+        category_id = db.session.query(QuestionList.category_id).filter_by(id=list_id).scalar()
+        questions, dedup_report = remove_duplicates(
+            questions, payload['dedup'], category_id, exclude_list_id=list_id,
+            threshold=payload.get('dedup_threshold', dedup.DEFAULT_THRESHOLD)
+        )
+        # Sem perguntas novas, o diff apagaria a lista inteira
+        if not questions:
+            raise ValueError('Todas as perguntas enviadas são duplicatas')
+    
+    context.check_cancelled()
+    changes = apply_questions_diff(list_id, questions)
+    context.report_progress(len(questions))
+    context.check_cancelled()
+    
+    QuestionList.query.filter_by(id=list_id).update({'updated_at': datetime.utcnow()})
+    db.session.commit()
+    
+    return {'list_id': list_id, 'questions_count': len(questions), 'changes': changes, 'dedup': dedup_report}
+
+def _uploaded_lines():
+    """Linhas do arquivo enviado (multipart) ou do corpo bruto da requisição"""
+    upload = request.files.get('file')
+    stream = upload.stream if upload else request.stream
+    return io.TextIOWrapper(stream, encoding='utf-8', errors='replace')
+
+def read_uploaded_questions(lines, questions, batch_size=UPLOAD_BATCH_SIZE):
+    """Acumular em `questions` as perguntas lidas, gerando o total a cada lote lido"""
+    for question_text in iter_questions(lines):
+        questions.append(question_text)
+        if len(questions) % batch_size == 0:
+            yield len(questions)
+
+def _stream_upload(list_id=None, new_list=None):
+    """Resposta NDJSON com o progresso da importação, lote a lote.
+
+    O corpo é lido por inteiro antes de qualquer escrita: a transação só começa
+    depois da leitura da rede, então um cliente lento não segura o lock de
+    escrita do SQLite. Uma lista existente (`list_id`) recebe só as diferenças
+    (apply_questions_diff); `new_list` (campos da QuestionList) cria a lista
+    junto com as perguntas, na mesma transação.
+    """
+    def generate():
+        try:
+            # Encerra a leitura feita na validação antes da espera pela rede
+            db.session.commit()
+            
+            questions = []
+            for parsed in read_uploaded_questions(_uploaded_lines(), questions):
+                yield json.dumps({'list_id': list_id, 'parsed': parsed}) + '\n'
+            
+            if not questions:
+                yield json.dumps({'error': 'Nenhuma pergunta válida encontrada no texto'}) + '\n'
+                return
+            
+            if new_list is None:
+                target_id = list_id
+                changes = apply_questions_diff(target_id, questions)
+                QuestionList.query.filter_by(id=target_id).update({'updated_at': datetime.utcnow()})
+            else:
+                question_list = QuestionList(**new_list)
+                db.session.add(question_list)
+                db.session.flush()  # Para obter o ID
+                target_id = question_list.id
+                for total in insert_questions_in_batches(target_id, questions):
+                    yield json.dumps({'list_id': target_id, 'inserted': total}) + '\n'
+                changes = {'inserted': len(questions), 'updated': 0, 'deleted': 0}
+            db.session.commit()
+            
+            yield json.dumps({
+                'done': True,
+                'message': f'{len(questions)} perguntas importadas com sucesso',
+                'list_id': target_id,
+                'questions_count': len(questions),
+                'changes': changes
+            }) + '\n'
+        except Exception as e:
+            db.session.rollback()
+            yield json.dumps({'error': str(e)}) + '\n'
+    
+    return Response(stream_with_context(generate()), mimetype='application/x-ndjson')
+
+@question_lists_bp.route('/question-lists/<int:list_id>/upload-stream', methods=['POST'])
+@require_admin
+def upload_questions_stream(list_id):
+    """Upload em streaming de perguntas para uma lista (arquivo multipart ou corpo em texto)"""
+    try:
+        QuestionList.query.get_or_404(list_id)
+        
+        return _stream_upload(list_id=list_id)
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+@question_lists_bp.route('/question-lists/upload-stream', methods=['POST'])
+@require_admin
+def create_list_upload_stream():
+    """Criar lista e importar perguntas em streaming numa única operação"""
+    try:
+        params = request.form if request.files else request.args
+        
+        if not params.get('name'):
+            return jsonify({'error': 'name é obrigatório'}), 400
+        
+        return _stream_upload(new_list={
+            'name': params['name'],
+            'description': params.get('description', ''),
+            'category_id': params.get('category_id', type=int),
+            'created_by': g.principal.id
+        })
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+@question_lists_bp.route('/question-lists/<int:list_id>', methods=['DELETE'])
+@require_admin
+def delete_question_list(list_id):
+    """Deletar lista de perguntas (apenas administradores)"""
+    try:
+        question_list = QuestionList.query.get_or_404(list_id)
+        
+        # Marcar como inativa ao invés de deletar
+        question_list.is_active = False
+        question_list.updated_at = datetime.utcnow()
+        
+        db.session.commit()
+        
+        return jsonify({'message': 'Lista desativada com sucesso'}), 200
+        
+    except Exception as e:
+        db.session.rollback()
+        return jsonify({'error': str(e)}), 500
+
@@ -0,0 +1,48 @@
+from flask import Blueprint, request, jsonify, g
+from src.models.user import db
+from src.models.category import Category
+from src.models.daily_stats import DailyUserStats
+from src.utils.auth_tokens import require_user
+from src.utils.response_cache import response_cache
+
+reports_bp = Blueprint('reports', __name__)
+
+# Janela máxima dos relatórios (dias)
+MAX_REPORT_DAYS = 365
+
+def _days():
+    return min(max(request.args.get('days', 7, type=int), 1), MAX_REPORT_DAYS)
+
+@reports_bp.route('/reports/performance', methods=['GET'])
+@require_user
+@response_cache.cached()
+def get_performance():
+    """Desempenho do período por categoria, lido do agregado diário (sem varrer card_review)"""
+    try:
+        report = DailyUserStats.performance(g.principal.id, days=_days())
+        
+        names = dict(db.session.query(Category.id, Category.name).filter(
+            Category.id.in_([category['category_id'] for category in report['categories']])
+        ).all()) if report['categories'] else {}
+        for category in report['categories']:
+            category['name'] = names.get(category['category_id'], 'Sem categoria')
+        # Nome usado pela tela de relatórios
+        report['correct_reviews'] = report['correct_answers']
+        
+        return jsonify(report), 200
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+@reports_bp.route('/reports/progress', methods=['GET'])
+@require_user
+@response_cache.cached()
+def get_progress():
+    """Série diária do período (revisões, acertos e cards novos)"""
+    try:
+        series = DailyUserStats.progress(g.principal.id, days=_days())
+        for day in series:
+            day['total_cards'] = day['total_reviews']
+        
+        return jsonify(series), 200
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
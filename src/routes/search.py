@@ -0,0 +1,37 @@
+from flask import Blueprint, request, jsonify, g
+from src.models import search_index
+from src.utils.auth_tokens import require_user
+
+search_bp = Blueprint('search', __name__)
+
+@search_bp.route('/search', methods=['GET'])
+@require_user
+def search():
+    """Busca textual em cards do usuário e perguntas pré-cadastradas"""
+    try:
+        query = (request.args.get('q') or '').strip()
+        if not query:
+            return jsonify({'error': 'q é obrigatório'}), 400
+        
+        if not search_index.is_supported():
+            return jsonify({'error': 'Busca indisponível neste banco de dados'}), 501
+        
+        scope = request.args.get('scope', 'all')
+        if scope not in ('all', 'cards', 'questions'):
+            return jsonify({'error': 'scope deve ser all, cards ou questions'}), 400
+        
+        limit = min(request.args.get('limit', 20, type=int), 100)
+        page = max(request.args.get('page', 1, type=int), 1)
+        offset = (page - 1) * limit
+        
+        result = {'query': query, 'page': page, 'limit': limit}
+        if scope in ('all', 'cards'):
+            result['cards'] = search_index.search_cards(g.principal.id, query, limit=limit, offset=offset)
+        if scope in ('all', 'questions'):
+            result['questions'] = search_index.search_preset_questions(
+                query, list_id=request.args.get('list_id', type=int), limit=limit, offset=offset
+            )
+        
+        return jsonify(result), 200
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
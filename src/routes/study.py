@@ -0,0 +1,119 @@
+from flask import Blueprint, request, jsonify, g
+from datetime import datetime
+from src.models.user import db
+from src.models.card import Card
+from src.models.study import StudySession, CardReview
+from src.utils.auth_tokens import require_user
+from src.utils.response_cache import mark_user_dirty
+from src.routes.study_answers import parse_answer
+
+study_bp = Blueprint('study', __name__)
+
+SESSION_TYPES = ('study', 'review', 'test')
+
+def _owned_session(session_id):
+    """Sessão do usuário autenticado, ou None"""
+    if not isinstance(session_id, int):
+        return None
+    return StudySession.query.filter_by(id=session_id, user_id=g.principal.id).first()
+
+@study_bp.route('/study/start', methods=['POST'])
+@require_user
+def start_session():
+    """Iniciar uma sessão de estudo"""
+    try:
+        data = request.get_json(silent=True) or {}
+
+        session_type = data.get('session_type', 'study')
+        if session_type not in SESSION_TYPES:
+            return jsonify({'error': f"session_type deve ser {', '.join(SESSION_TYPES)}"}), 400
+
+        session = StudySession(user_id=g.principal.id, session_type=session_type)
+        db.session.add(session)
+        db.session.commit()
+
+        return jsonify(session.to_dict()), 201
+    except Exception as e:
+        db.session.rollback()
+        return jsonify({'error': str(e)}), 500
+
+@study_bp.route('/study/answer', methods=['POST'])
+@require_user
+def record_answer():
+    """Registrar a resposta a um card e reagendá-lo (SM-2)"""
+    try:
+        data = request.get_json(silent=True)
+
+        # Mesma validação estrita das respostas em lote
+        try:
+            answer = parse_answer(data)
+        except ValueError as e:
+            return jsonify({'error': str(e)}), 400
+
+        session = _owned_session(data.get('session_id'))
+        if session is None:
+            return jsonify({'error': 'Sessão não encontrada'}), 404
+        card = Card.query.filter_by(id=answer['card_id'], user_id=g.principal.id).first()
+        if card is None:
+            return jsonify({'error': 'Card não encontrado'}), 404
+
+        card.calculate_next_review(answer['is_correct'], answer['difficulty_rating'])
+        review = CardReview(
+            user_id=g.principal.id,
+            card_id=card.id,
+            session_id=session.id,
+            is_correct=answer['is_correct'],
+            response_time=answer['response_time'],
+            difficulty_rating=answer['difficulty_rating']
+        )
+        db.session.add(review)
+
+        # Contadores da sessão somados no banco (respostas concorrentes não se perdem)
+        session.total_cards = db.func.coalesce(StudySession.total_cards, 0) + 1
+        session.correct_answers = db.func.coalesce(StudySession.correct_answers, 0) + int(answer['is_correct'])
+        mark_user_dirty(db.session, g.principal.id)
+        db.session.commit()
+
+        return jsonify({
+            'review': review.to_dict(),
+            'next_review': card.next_review.isoformat(),
+            'session': session.to_dict()
+        }), 201
+    except Exception as e:
+        db.session.rollback()
+        return jsonify({'error': str(e)}), 500
+
+@study_bp.route('/study/end', methods=['POST'])
+@require_user
+def end_session():
+    """Encerrar uma sessão de estudo"""
+    try:
+        data = request.get_json(silent=True) or {}
+
+        session = _owned_session(data.get('session_id'))
+        if session is None:
+            return jsonify({'error': 'Sessão não encontrada'}), 404
+
+        if not session.ended_at:
+            session.ended_at = datetime.utcnow()
+            mark_user_dirty(db.session, g.principal.id)
+            db.session.commit()
+
+        return jsonify(session.to_dict()), 200
+    except Exception as e:
+        db.session.rollback()
+        return jsonify({'error': str(e)}), 500
+
+@study_bp.route('/study/history', methods=['GET'])
+@require_user
+def get_study_history():
+    """Sessões mais recentes do usuário"""
+    try:
+        limit = min(request.args.get('limit', 10, type=int), 100)
+        sessions = StudySession.query.filter_by(user_id=g.principal.id).order_by(
+            StudySession.started_at.desc(), StudySession.id.desc()
+        ).limit(limit).all()
+
+        return jsonify([session.to_dict() for session in sessions]), 200
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
@@ -0,0 +1,168 @@
+from flask import Blueprint, request, jsonify, g
+from datetime import datetime
+from src.models.user import db
+from src.models.card import Card
+from src.models import scheduler
+from src.models.study import StudySession, CardReview, AnswerReceipt
+from src.models.daily_stats import DailyUserStats
+from src.utils.response_cache import mark_user_dirty
+from src.utils.auth_tokens import require_user
+
+study_answers_bp = Blueprint('study_answers', __name__)
+
+# Limite de respostas por requisição
+MAX_BATCH_SIZE = 500
+
+def _is_int(value):
+    return isinstance(value, int) and not isinstance(value, bool)
+
+def parse_answer(answer):
+    """Valida uma resposta e retorna os campos normalizados; ValueError se inválida.
+
+    Tipos estritos: is_correct precisa ser booleano ("false" não vale como
+    acerto) e difficulty_rating um inteiro de 1 a 5.
+    """
+    if not isinstance(answer, dict):
+        raise ValueError('cada resposta deve ser um objeto')
+    if not _is_int(answer.get('card_id')):
+        raise ValueError('card_id deve ser um inteiro')
+    if not isinstance(answer.get('is_correct'), bool):
+        raise ValueError('is_correct deve ser booleano')
+    difficulty_rating = answer.get('difficulty_rating', 3)
+    if not _is_int(difficulty_rating) or not 1 <= difficulty_rating <= 5:
+        raise ValueError('difficulty_rating deve ser um inteiro de 1 a 5')
+    response_time = answer.get('response_time')
+    if response_time is not None and (not _is_int(response_time) or response_time < 0):
+        raise ValueError('response_time deve ser um inteiro não negativo')
+    key = answer.get('idempotency_key')
+    if key is not None and (not isinstance(key, str) or not key or len(key) > 100):
+        raise ValueError('idempotency_key deve ser um texto de até 100 caracteres')
+    return {
+        'card_id': answer['card_id'],
+        'is_correct': answer['is_correct'],
+        'difficulty_rating': difficulty_rating,
+        'response_time': response_time,
+        'idempotency_key': key
+    }
+
+@study_answers_bp.route('/study/answers/batch', methods=['POST'])
+@require_user
+def record_answers_batch():
+    """Registrar várias respostas de uma sessão numa única transação"""
+    try:
+        data = request.get_json(silent=True)
+        
+        if not isinstance(data, dict) or not _is_int(data.get('session_id')) or 'answers' not in data:
+            return jsonify({'error': 'session_id (inteiro) e answers são obrigatórios'}), 400
+        
+        answers = data['answers']
+        if not isinstance(answers, list) or not answers or len(answers) > MAX_BATCH_SIZE:
+            return jsonify({'error': f'answers deve ser uma lista com 1 a {MAX_BATCH_SIZE} itens'}), 400
+        
+        user_id = g.principal.id
+        session = StudySession.query.filter_by(id=data['session_id'], user_id=user_id).first()
+        if session is None:
+            return jsonify({'error': 'Sessão não encontrada'}), 404
+        
+        # Validação de cada item antes de consultar o banco; inválidos viram erro 400 no resultado
+        parsed = []
+        for answer in answers:
+            try:
+                parsed.append(parse_answer(answer))
+            except ValueError as e:
+                parsed.append(e)
+        valid = [answer for answer in parsed if isinstance(answer, dict)]
+        
+        # Chaves de idempotência já registradas pelo usuário (reenvio de fila offline)
+        keys = [answer['idempotency_key'] for answer in valid if answer['idempotency_key']]
+        seen_keys = set()
+        if keys:
+            seen_keys = {key for (key,) in db.session.query(AnswerReceipt.idempotency_key).filter(
+                AnswerReceipt.user_id == user_id, AnswerReceipt.idempotency_key.in_(keys)
+            ).all()}
+        
+        card_ids = {answer['card_id'] for answer in valid}
+        categories = {card_id: category_id for card_id, category_id in db.session.query(
+            Card.id, Card.category_id
+        ).filter(Card.id.in_(card_ids), Card.user_id == user_id).all()} if card_ids else {}
+        
+        results = []
+        reviews = []
+        receipts = []
+        correct = 0
+        for index, answer in enumerate(parsed):
+            if isinstance(answer, ValueError):
+                results.append({'index': index, 'status': 'error', 'code': 400, 'error': str(answer)})
+                continue
+            
+            card_id = answer['card_id']
+            key = answer['idempotency_key']
+            if key and key in seen_keys:
+                results.append({'index': index, 'status': 'duplicate', 'card_id': card_id})
+                continue
+            
+            if card_id not in categories:
+                results.append({'index': index, 'status': 'error', 'code': 404, 'card_id': card_id,
+                                'error': 'Card não encontrado'})
+                continue
+            
+            is_correct = answer['is_correct']
+            reviews.append({
+                'user_id': user_id,
+                'card_id': card_id,
+                'session_id': session.id,
+                'is_correct': is_correct,
+                'response_time': answer['response_time'],
+                'difficulty_rating': answer['difficulty_rating'],
+                'reviewed_at': datetime.utcnow()
+            })
+            if key:
+                seen_keys.add(key)
+                receipts.append({'idempotency_key': key, 'user_id': user_id,
+                                 'card_id': card_id, 'session_id': session.id})
+            correct += 1 if is_correct else 0
+            results.append({'index': index, 'status': 'recorded', 'card_id': card_id})
+        
+        if reviews:
+            # SM-2 vetorizado para o lote inteiro, gravado num único executemany
+            next_reviews = scheduler.apply_answers(user_id, [
+                (review['card_id'], review['is_correct'], review['difficulty_rating']) for review in reviews
+            ])
+            for result in results:
+                if result['status'] == 'recorded':
+                    result['next_review'] = next_reviews[result['card_id']].isoformat()
+            
+            # Cards sem revisões anteriores contam como novos no agregado diário
+            reviewed_before = {card_id for (card_id,) in db.session.query(CardReview.card_id).filter(
+                CardReview.card_id.in_({review['card_id'] for review in reviews})
+            ).distinct().all()}
+            
+            db.session.execute(CardReview.__table__.insert(), reviews)
+            
+            rollup = []
+            for review in reviews:
+                is_new = review['card_id'] not in reviewed_before
+                reviewed_before.add(review['card_id'])
+                rollup.append({**review, 'category_id': categories[review['card_id']], 'is_new': is_new})
+            DailyUserStats.record_reviews(rollup)
+            if receipts:
+                db.session.execute(AnswerReceipt.__table__.insert(), receipts)
+            
+            # Contadores da sessão na mesma transação das revisões (um UPDATE por lote)
+            session.total_cards = db.func.coalesce(StudySession.total_cards, 0) + len(reviews)
+            session.correct_answers = db.func.coalesce(StudySession.correct_answers, 0) + correct
+            mark_user_dirty(db.session, user_id)
+        
+        db.session.commit()
+        
+        # 200 se todas foram aceitas (duplicatas incluídas), 207 se só parte, 400 se nenhuma
+        accepted = sum(1 for result in results if result['status'] != 'error')
+        status = 200 if accepted == len(results) else 207 if accepted else 400
+        return jsonify({
+            'recorded': len(reviews),
+            'results': results,
+            'session': session.to_dict()
+        }), status
+    except Exception as e:
+        db.session.rollback()
+        return jsonify({'error': str(e)}), 500
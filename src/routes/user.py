@@ -0,0 +1,80 @@
+from flask import Blueprint, request, jsonify, g
+from src.models.user import db, User
+from src.utils.auth_tokens import require_user, require_admin
+
+user_bp = Blueprint('user', __name__)
+
+def _check_self_or_admin(user_id):
+    if g.principal.id != user_id and not g.principal.is_admin:
+        return jsonify({'error': 'Acesso negado aos dados de outro usuário'}), 403
+    return None
+
+@user_bp.route('/users', methods=['GET'])
+@require_admin
+def get_users():
+    try:
+        users = User.query.order_by(User.id).all()
+        return jsonify([user.to_dict() for user in users]), 200
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+@user_bp.route('/users/<int:user_id>', methods=['GET'])
+@require_user
+def get_user(user_id):
+    try:
+        forbidden = _check_self_or_admin(user_id)
+        if forbidden:
+            return forbidden
+
+        user = db.session.get(User, user_id)
+        if user is None:
+            return jsonify({'error': 'Usuário não encontrado'}), 404
+        return jsonify(user.to_dict()), 200
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+@user_bp.route('/users/<int:user_id>', methods=['PUT'])
+@require_user
+def update_user(user_id):
+    try:
+        forbidden = _check_self_or_admin(user_id)
+        if forbidden:
+            return forbidden
+
+        user = db.session.get(User, user_id)
+        if user is None:
+            return jsonify({'error': 'Usuário não encontrado'}), 404
+
+        data = request.get_json(silent=True) or {}
+        if data.get('username') and data['username'] != user.username:
+            if User.query.filter_by(username=data['username']).first():
+                return jsonify({'error': 'Username já existe'}), 400
+            user.username = data['username']
+        if data.get('email') and data['email'] != user.email:
+            if User.query.filter_by(email=data['email']).first():
+                return jsonify({'error': 'Email já está em uso'}), 400
+            user.email = data['email']
+        # Só administradores promovem ou rebaixam usuários
+        if 'is_admin' in data and g.principal.is_admin:
+            user.is_admin = bool(data['is_admin'])
+
+        db.session.commit()
+        return jsonify(user.to_dict()), 200
+    except Exception as e:
+        db.session.rollback()
+        return jsonify({'error': str(e)}), 500
+
+@user_bp.route('/users/<int:user_id>', methods=['DELETE'])
+@require_admin
+def delete_user(user_id):
+    try:
+        user = db.session.get(User, user_id)
+        if user is None:
+            return jsonify({'error': 'Usuário não encontrado'}), 404
+
+        db.session.delete(user)
+        db.session.commit()
+        return jsonify({'message': 'Usuário excluído com sucesso'}), 200
+    except Exception as e:
+        db.session.rollback()
+        return jsonify({'error': str(e)}), 500
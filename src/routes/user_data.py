@@ -0,0 +1,258 @@
+from flask import Blueprint, request, jsonify, Response, stream_with_context, g
+from datetime import datetime, date
+import gzip
+import zlib
+from src.models.user import db
+from src.models.category import Category, Theme
+from src.models.card import Card
+from src.models.study import StudySession, CardReview
+from src.models.tag import Tag
+from src.models.due_queue import due_queue
+from src.models.daily_stats import DailyUserStats
+from src.utils.auth_tokens import require_user
+from src.utils.bulk_insert import insert_returning_ids
+from src.utils.fast_json import dumps, loads, row_encoder
+from src.utils.response_cache import mark_user_dirty
+
+user_data_bp = Blueprint('user_data', __name__)
+
+EXPORT_FORMAT_VERSION = 1
+
+# Linhas lidas do banco por vez (cursor no servidor) e tamanho dos pedaços enviados
+EXPORT_BATCH_SIZE = 2000
+EXPORT_CHUNK_BYTES = 64 * 1024
+
+# Linhas por executemany na importação
+IMPORT_BATCH_SIZE = 5000
+
+# Ordem do arquivo: cada tipo só referencia tipos anteriores
+#   tipo -> (modelo, {coluna: tipo referenciado})
+RECORD_TYPES = {
+    'category': (Category, {}),
+    'theme': (Theme, {'category_id': 'category'}),
+    'card': (Card, {'category_id': 'category', 'theme_id': 'theme'}),
+    'study_session': (StudySession, {}),
+    'card_review': (CardReview, {'card_id': 'card', 'session_id': 'study_session'}),
+}
+
+def _owned_query(record_type, user_id):
+    """SELECT das linhas do usuário de um tipo, em ordem de id"""
+    model = RECORD_TYPES[record_type][0]
+    table = model.__table__
+    columns = [column for column in table.columns if column.name != 'user_id']
+    query = db.select(*columns)
+    if 'user_id' in table.c:
+        query = query.where(table.c.user_id == user_id)
+    else:
+        # Temas pertencem ao usuário pela categoria
+        categories = Category.__table__
+        query = query.where(table.c.category_id.in_(
+            db.select(categories.c.id).where(categories.c.user_id == user_id)
+        ))
+    return query.order_by(table.c.id), [column.name for column in columns]
+
+def _check_owner(user_id):
+    if g.principal.id != user_id and not g.principal.is_admin:
+        return jsonify({'error': 'Acesso negado aos dados de outro usuário'}), 403
+    return None
+
+def export_lines(user_id):
+    """Gera as linhas NDJSON (bytes) com todos os dados de estudo do usuário"""
+    yield dumps({'type': 'header', 'version': EXPORT_FORMAT_VERSION, 'user_id': user_id,
+                 'exported_at': datetime.utcnow()}) + b'\n'
+    counts = {}
+    for record_type in RECORD_TYPES:
+        query, fields = _owned_query(record_type, user_id)
+        encode = row_encoder(('type',) + tuple(fields))
+        counts[record_type] = 0
+        result = db.session.execute(query.execution_options(yield_per=EXPORT_BATCH_SIZE))
+        for rows in result.partitions():
+            counts[record_type] += len(rows)
+            yield b''.join(dumps(encode((record_type,) + tuple(row))) + b'\n' for row in rows)
+    yield dumps({'type': 'end', 'counts': counts}) + b'\n'
+
+def _chunked(lines, compress):
+    """Junta as linhas em pedaços de ~64 KB, comprimindo em gzip se pedido"""
+    compressor = zlib.compressobj(6, zlib.DEFLATED, 31) if compress else None
+    buffer = []
+    size = 0
+    for line in lines:
+        buffer.append(line)
+        size += len(line)
+        if size >= EXPORT_CHUNK_BYTES:
+            data = b''.join(buffer)
+            buffer, size = [], 0
+            data = compressor.compress(data) if compressor else data
+            if data:
+                yield data
+    data = b''.join(buffer)
+    if compressor:
+        data = compressor.compress(data) + compressor.flush()
+    if data:
+        yield data
+
+@user_data_bp.route('/users/<int:user_id>/export', methods=['GET'])
+@require_user(allow_legacy=False)
+def export_user_data(user_id):
+    """Exportar categorias, temas, cards, sessões e revisões do usuário em NDJSON (streaming)"""
+    try:
+        forbidden = _check_owner(user_id)
+        if forbidden:
+            return forbidden
+
+        compress = request.args.get('compress') == 'gzip'
+        filename = f'medcards-user-{user_id}.ndjson' + ('.gz' if compress else '')
+        return Response(
+            stream_with_context(_chunked(export_lines(user_id), compress)),
+            mimetype='application/gzip' if compress else 'application/x-ndjson',
+            headers={'Content-Disposition': f'attachment; filename="{filename}"'}
+        )
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+def _converters(model):
+    """Funções que convertem os campos de data do JSON de volta para objetos"""
+    converters = {}
+    for column in model.__table__.columns:
+        try:
+            python_type = column.type.python_type
+        except NotImplementedError:
+            continue
+        if python_type is datetime:
+            converters[column.name] = lambda value: datetime.fromisoformat(value) if value else None
+        elif python_type is date:
+            converters[column.name] = lambda value: date.fromisoformat(value) if value else None
+    return converters
+
+class UserDataImporter:
+    """Importa um arquivo de export para `user_id`, remapeando os ids.
+
+    As linhas são lidas em streaming e inseridas em lotes de
+    IMPORT_BATCH_SIZE; só os ids de tipos referenciados por outros
+    (categorias, temas, cards, sessões) ficam em memória.
+    """
+
+    def __init__(self, user_id):
+        self.user_id = user_id
+        self.id_maps = {record_type: {} for record_type in RECORD_TYPES}
+        self.counts = {record_type: 0 for record_type in RECORD_TYPES}
+        self.skipped = 0
+        self.tagged_cards = []
+        self._converters = {record_type: _converters(model) for record_type, (model, _) in RECORD_TYPES.items()}
+        self._columns = {record_type: {column.name for column in model.__table__.columns}
+                         for record_type, (model, _) in RECORD_TYPES.items()}
+        self._pending_type = None
+        self._pending = []
+
+    def add(self, record):
+        record_type = record.pop('type', None)
+        if record_type in ('header', 'end'):
+            if record_type == 'header' and record.get('version', EXPORT_FORMAT_VERSION) > EXPORT_FORMAT_VERSION:
+                raise ValueError(f"Versão de exportação não suportada: {record.get('version')}")
+            return
+        if record_type not in RECORD_TYPES:
+            raise ValueError(f'Tipo de registro desconhecido: {record_type}')
+        if record_type != self._pending_type:
+            self.flush()
+            self._pending_type = record_type
+        self._pending.append(record)
+        if len(self._pending) >= IMPORT_BATCH_SIZE:
+            self.flush()
+
+    def _prepare(self, record_type, record):
+        model, references = RECORD_TYPES[record_type]
+        row = {name: value for name, value in record.items() if name in self._columns[record_type] and name != 'id'}
+        for name, convert in self._converters[record_type].items():
+            if name in row:
+                row[name] = convert(row[name])
+        for name, target_type in references.items():
+            old_id = row.get(name)
+            if old_id is None:
+                continue
+            new_id = self.id_maps[target_type].get(old_id)
+            if new_id is None:
+                if model.__table__.c[name].nullable:
+                    row[name] = None
+                    continue
+                return None
+            row[name] = new_id
+        if 'user_id' in self._columns[record_type]:
+            row['user_id'] = self.user_id
+        return row
+
+    def flush(self):
+        record_type, records = self._pending_type, self._pending
+        self._pending = []
+        if not records:
+            return
+        model = RECORD_TYPES[record_type][0]
+        prepared = []
+        for record in records:
+            row = self._prepare(record_type, record)
+            if row is None:
+                self.skipped += 1
+                continue
+            prepared.append((record.get('id'), row))
+        if not prepared:
+            return
+
+        rows = [row for _, row in prepared]
+        if record_type == 'card_review':
+            # Nada referencia as revisões: não precisa dos ids novos
+            db.session.execute(model.__table__.insert(), rows)
+        else:
+            new_ids = insert_returning_ids(model.__table__, rows)
+            id_map = self.id_maps[record_type]
+            for (old_id, row), new_id in zip(prepared, new_ids):
+                if old_id is not None:
+                    id_map[old_id] = new_id
+                if record_type == 'card' and row.get('tags'):
+                    self.tagged_cards.append((new_id, self.user_id, Card.parse_tags(row['tags'])))
+        self.counts[record_type] += len(rows)
+
+    def finish(self):
+        self.flush()
+        Tag.sync_cards(self.tagged_cards)
+        # Inserts em lote não passam pelos eventos do ORM: recalcular derivados
+        DailyUserStats.rebuild(user_id=self.user_id)
+        due_queue.invalidate_on_commit(db.session, self.user_id)
+        mark_user_dirty(db.session, self.user_id)
+        return {'imported': self.counts, 'skipped': self.skipped}
+
+def _import_lines():
+    """Linhas do corpo da requisição, descomprimindo gzip se necessário"""
+    stream = request.stream
+    if request.content_encoding == 'gzip' or request.mimetype == 'application/gzip':
+        stream = gzip.GzipFile(fileobj=stream, mode='rb')
+    for line in stream:
+        line = line.strip()
+        if line:
+            yield line
+
+@user_data_bp.route('/users/<int:user_id>/import', methods=['POST'])
+@require_user(allow_legacy=False)
+def import_user_data(user_id):
+    """Importar um arquivo de export (NDJSON, opcionalmente gzip) para o usuário"""
+    try:
+        forbidden = _check_owner(user_id)
+        if forbidden:
+            return forbidden
+
+        importer = UserDataImporter(user_id)
+        for number, line in enumerate(_import_lines(), start=1):
+            try:
+                record = loads(line)
+            except ValueError:
+                db.session.rollback()
+                return jsonify({'error': f'JSON inválido na linha {number}'}), 400
+            importer.add(record)
+        result = importer.finish()
+        db.session.commit()
+
+        return jsonify({'message': 'Dados importados com sucesso', **result}), 201
+    except ValueError as e:
+        db.session.rollback()
+        return jsonify({'error': str(e)}), 400
+    except Exception as e:
+        db.session.rollback()
+        return jsonify({'error': str(e)}), 500
@@ -0,0 +1,169 @@
+from datetime import datetime, timedelta
+import html
+import json
+import os
+import re
+import sqlite3
+import tempfile
+import zipfile
+
+try:
+    import zstandard
+except ImportError:  # zstandard é opcional: só é preciso para pacotes do formato novo (anki21b)
+    zstandard = None
+
+# Arquivos da coleção dentro do .apkg, do formato mais novo para o mais antigo.
+# Exportações recentes trazem um collection.anki2 vazio só para compatibilidade.
+COLLECTION_FILES = ('collection.anki21b', 'collection.anki21', 'collection.anki2')
+
+# Separador de campos das notas e dos níveis de nome no formato novo
+FIELD_SEPARATOR = '\x1f'
+DECK_SEPARATOR = '::'
+
+MILLISECONDS_PER_DAY = 86400 * 1000
+
+# `due` de cards em aprendizado é um timestamp; nos demais, dias desde a criação da coleção
+LEARNING_DUE_THRESHOLD = 1_000_000_000
+
+_BREAK_RE = re.compile(r'<br\s*/?>|</div>|</p>|</li>', re.IGNORECASE)
+_TAG_RE = re.compile(r'<[^>]+>')
+_SOUND_RE = re.compile(r'\[sound:[^\]]*\]')
+_CLOZE_RE = re.compile(r'\{\{c\d+::(.*?)(?:::(.*?))?\}\}', re.DOTALL)
+_BLANK_LINES_RE = re.compile(r'\n\s*\n+')
+
+class AnkiPackageError(ValueError):
+    """Arquivo que não é um pacote .apkg legível"""
+
+def field_to_text(value):
+    """Converte o HTML de um campo do Anki em texto simples (mídia é descartada)"""
+    value = _BREAK_RE.sub('\n', value)
+    value = _TAG_RE.sub('', value)
+    value = _SOUND_RE.sub('', value)
+    value = html.unescape(value).replace('\xa0', ' ')
+    return _BLANK_LINES_RE.sub('\n', value).strip()
+
+def note_to_question(fields):
+    """(pergunta, resposta) de uma nota a partir dos seus campos.
+
+    Notas cloze viram pergunta com as lacunas ocultas e resposta com o texto
+    completo (mais o campo extra, se houver); as demais usam o primeiro campo
+    como frente e o segundo como verso.
+    """
+    front = fields[0] if fields else ''
+    if _CLOZE_RE.search(front):
+        question = _CLOZE_RE.sub(lambda match: f'[{match.group(2) or "..."}]', front)
+        answer = _CLOZE_RE.sub(lambda match: match.group(1), front)
+        extra = field_to_text(fields[1]) if len(fields) > 1 else ''
+        answer = field_to_text(answer)
+        return field_to_text(question), f'{answer}\n{extra}' if extra else answer
+    return field_to_text(front), field_to_text(fields[1]) if len(fields) > 1 else ''
+
+class AnkiPackage:
+    """Leitura de um pacote .apkg (zip com a coleção SQLite do Anki).
+
+    Só o arquivo da coleção é lido do zip; a mídia não é extraída. A coleção
+    é carregada num banco SQLite em memória (ou num arquivo temporário em
+    Pythons sem `deserialize`) e lida com cursores em lotes.
+    """
+
+    def __init__(self, fileobj):
+        try:
+            with zipfile.ZipFile(fileobj) as archive:
+                names = set(archive.namelist())
+                name = next((name for name in COLLECTION_FILES if name in names), None)
+                if name is None:
+                    raise AnkiPackageError('Pacote .apkg sem arquivo de coleção')
+                data = archive.read(name)
+        except zipfile.BadZipFile:
+            raise AnkiPackageError('Arquivo não é um pacote .apkg válido')
+
+        if name.endswith('.anki21b'):
+            if zstandard is None:
+                raise AnkiPackageError('Pacotes do Anki 2.1.50+ exigem o módulo zstandard; '
+                                       'exporte com "Suporte a versões antigas" ou instale-o')
+            data = zstandard.ZstdDecompressor().stream_reader(data).read()
+
+        self._tempfile = None
+        self.connection = sqlite3.connect(':memory:')
+        if hasattr(self.connection, 'deserialize'):
+            self.connection.deserialize(data)
+        else:
+            self.connection.close()
+            handle, self._tempfile = tempfile.mkstemp(suffix='.anki2')
+            with os.fdopen(handle, 'wb') as output:
+                output.write(data)
+            self.connection = sqlite3.connect(self._tempfile)
+        del data
+
+        try:
+            self.created = self.connection.execute('SELECT crt FROM col').fetchone()[0]
+        except sqlite3.DatabaseError:
+            self.close()
+            raise AnkiPackageError('Coleção do Anki ilegível')
+        self.decks = self._read_decks()
+
+    def _read_decks(self):
+        """{id do baralho: nome completo 'Pai::Filho'}"""
+        tables = {row[0] for row in self.connection.execute("SELECT name FROM sqlite_master WHERE type = 'table'")}
+        if 'decks' in tables:
+            # Formato novo: tabela própria, níveis separados por \x1f
+            return {deck_id: name.replace(FIELD_SEPARATOR, DECK_SEPARATOR)
+                    for deck_id, name in self.connection.execute('SELECT id, name FROM decks')}
+        decks = json.loads(self.connection.execute('SELECT decks FROM col').fetchone()[0] or '{}')
+        return {int(deck_id): deck['name'] for deck_id, deck in decks.items()}
+
+    def count_notes(self):
+        return self.connection.execute('SELECT COUNT(*) FROM notes').fetchone()[0]
+
+    def due_date(self, card_type, due, now):
+        """Próxima revisão de um card do Anki como datetime (UTC)"""
+        if card_type == 0:
+            return now  # novo: na fila desde já
+        if due > LEARNING_DUE_THRESHOLD:
+            return datetime.utcfromtimestamp(due)  # aprendizado: segundos desde a época
+        return datetime.utcfromtimestamp(self.created) + timedelta(days=due)  # revisão: dias desde a criação
+
+    def iter_notes(self, batch_size):
+        """Lotes de notas como tuplas (id, campos, tags, deck_id, tipo, due, ivl, fator, reps).
+
+        Cada nota traz o agendamento do seu primeiro card (menor `ord`).
+        """
+        cursor = self.connection.execute(
+            'SELECT n.id, n.flds, n.tags, c.did, c.type, c.due, c.ivl, c.factor, c.reps, MIN(c.ord) '
+            'FROM notes n JOIN cards c ON c.nid = n.id GROUP BY n.id ORDER BY n.id'
+        )
+        while True:
+            rows = cursor.fetchmany(batch_size)
+            if not rows:
+                return
+            yield [(note_id, fields.split(FIELD_SEPARATOR), tags.split(), *scheduling)
+                   for note_id, fields, tags, *scheduling, _ in rows]
+
+    def review_days(self):
+        """Resumo do histórico por dia UTC: (dia, primeiro ms, último ms, revisões, acertos)"""
+        return self.connection.execute(
+            'SELECT r.id / ? AS day, MIN(r.id), MAX(r.id), COUNT(*), SUM(r.ease > 1) '
+            'FROM revlog r JOIN cards c ON c.id = r.cid WHERE r.ease > 0 GROUP BY day ORDER BY day',
+            (MILLISECONDS_PER_DAY,)
+        ).fetchall()
+
+    def iter_reviews(self, batch_size):
+        """Lotes do histórico (revlog) como (ms, id da nota, botão 1-4, tempo em ms).
+
+        Entradas com ease 0 (reagendamento manual) ficam de fora.
+        """
+        cursor = self.connection.execute(
+            'SELECT r.id, c.nid, r.ease, r.time FROM revlog r JOIN cards c ON c.id = r.cid '
+            'WHERE r.ease > 0 ORDER BY r.id'
+        )
+        while True:
+            rows = cursor.fetchmany(batch_size)
+            if not rows:
+                return
+            yield rows
+
+    def close(self):
+        self.connection.close()
+        if self._tempfile:
+            os.unlink(self._tempfile)
+            self._tempfile = None
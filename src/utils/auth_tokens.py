@@ -0,0 +1,160 @@
+from collections import OrderedDict, namedtuple
+from functools import wraps
+import os
+import threading
+import time
+from flask import current_app, g, jsonify, request
+from itsdangerous import BadSignature, SignatureExpired, URLSafeTimedSerializer
+from sqlalchemy import event
+from src.models.user import db, User
+
+# Tokens de acesso valem 12 horas por padrão (um dia de prova)
+DEFAULT_TOKEN_TTL = 12 * 3600
+TOKEN_SALT = 'medcards-access-token'
+
+# Campos onde clientes antigos mandam o id do usuário
+LEGACY_USER_FIELDS = ('user_id', 'created_by')
+
+# `legacy`: identificado só pelo id enviado pelo cliente, sem token (nunca é admin)
+Principal = namedtuple('Principal', ['id', 'username', 'is_admin', 'legacy'], defaults=(False,))
+
+def _serializer():
+    return URLSafeTimedSerializer(current_app.config['SECRET_KEY'], salt=TOKEN_SALT)
+
+def issue_token(user):
+    """Token assinado (HMAC com SECRET_KEY) que identifica o usuário"""
+    return _serializer().dumps({'uid': user.id})
+
+def verify_token(token):
+    """Retorna o id do usuário do token, ou None se inválido/expirado. Não consulta o banco."""
+    try:
+        payload = _serializer().loads(token, max_age=current_app.config['ACCESS_TOKEN_TTL'])
+    except (SignatureExpired, BadSignature):
+        return None
+    return payload.get('uid') if isinstance(payload, dict) else None
+
+class PrincipalCache:
+    """LRU de principais (id, username, is_admin) com TTL curto.
+
+    Evita um SELECT em user a cada requisição autenticada. Alterações no
+    usuário feitas por este processo invalidam a entrada na hora; nos demais
+    workers valem após o TTL.
+    """
+
+    def __init__(self, max_entries=1024, ttl=60):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, user_id):
+        try:
+            user_id = int(user_id)
+        except (TypeError, ValueError):
+            return None
+        now = time.monotonic()
+        with self._lock:
+            entry = self._data.get(user_id)
+            if entry is not None and entry[1] > now:
+                self._data.move_to_end(user_id)
+                return entry[0]
+
+        row = db.session.query(User.id, User.username, User.is_admin).filter(User.id == user_id).first()
+        principal = Principal(row.id, row.username, bool(row.is_admin)) if row else None
+        with self._lock:
+            self._data[user_id] = (principal, now + self.ttl)
+            self._data.move_to_end(user_id)
+            while len(self._data) > self.max_entries:
+                self._data.popitem(last=False)
+        return principal
+
+    def invalidate(self, user_id):
+        with self._lock:
+            self._data.pop(user_id, None)
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+principal_cache = PrincipalCache()
+
+def init_app(app):
+    app.config.setdefault('ACCESS_TOKEN_TTL', int(os.environ.get('MEDCARDS_TOKEN_TTL', DEFAULT_TOKEN_TTL)))
+    # Só durante a migração do frontend (MEDCARDS_AUTH_LEGACY=1): aceitar o id do
+    # usuário no corpo/query. Desligado por padrão, pois o id não é verificado.
+    app.config.setdefault('AUTH_ALLOW_LEGACY_USER_ID', os.environ.get('MEDCARDS_AUTH_LEGACY', '0') == '1')
+    principal_cache.max_entries = app.config.setdefault('PRINCIPAL_CACHE_SIZE', 1024)
+    principal_cache.ttl = app.config.setdefault('PRINCIPAL_CACHE_TTL', 60)
+
+@event.listens_for(User, 'after_update')
+@event.listens_for(User, 'after_delete')
+def _invalidate_principal(mapper, connection, target):
+    principal_cache.invalidate(target.id)
+
+def _legacy_user_ids():
+    """Ids de usuário enviados pelo cliente (corpo JSON, query string ou formulário)"""
+    sources = [request.get_json(silent=True) or {}, request.args]
+    if request.mimetype in ('multipart/form-data', 'application/x-www-form-urlencoded'):
+        sources.append(request.form)
+    ids = []
+    for source in sources:
+        if not hasattr(source, 'get'):
+            continue
+        for field in LEGACY_USER_FIELDS:
+            value = source.get(field)
+            if value not in (None, ''):
+                ids.append(str(value))
+    return ids
+
+def _authenticate():
+    """Resolve o principal da requisição. Retorna (principal, resposta de erro)."""
+    header = request.headers.get('Authorization', '')
+    claimed = _legacy_user_ids()
+    if header.startswith('Bearer '):
+        user_id = verify_token(header[len('Bearer '):].strip())
+        principal = principal_cache.get(user_id) if user_id else None
+        if principal is None:
+            return None, (jsonify({'error': 'Token inválido ou expirado'}), 401)
+        if any(value != str(principal.id) for value in claimed):
+            return None, (jsonify({'error': 'Usuário informado não corresponde ao token'}), 403)
+        return principal, None
+
+    if current_app.config.get('AUTH_ALLOW_LEGACY_USER_ID') and claimed:
+        principal = principal_cache.get(claimed[0])
+        if principal is not None:
+            # Um id informado pelo cliente nunca concede privilégios de administrador
+            return principal._replace(is_admin=False, legacy=True), None
+    return None, (jsonify({'error': 'Autenticação necessária'}), 401)
+
+def require_user(view=None, allow_legacy=True):
+    """Exige um usuário autenticado e o disponibiliza em g.principal.
+
+    Com `allow_legacy=False` (`@require_user(allow_legacy=False)`), só aceita
+    token: o id informado pelo cliente não basta nem no modo legado.
+    """
+    if view is None:
+        return lambda view: require_user(view, allow_legacy=allow_legacy)
+
+    @wraps(view)
+    def wrapper(*args, **kwargs):
+        principal, error = _authenticate()
+        if error:
+            return error
+        if principal.legacy and not allow_legacy:
+            return jsonify({'error': 'Token de acesso obrigatório para esta operação'}), 401
+        g.principal = principal
+        return view(*args, **kwargs)
+    return wrapper
+
+def require_admin(view):
+    """Como require_user, mas só para administradores"""
+    @wraps(view)
+    def wrapper(*args, **kwargs):
+        principal, error = _authenticate()
+        if error:
+            return error
+        if not principal.is_admin:
+            return jsonify({'error': 'Apenas administradores podem realizar esta operação'}), 403
+        g.principal = principal
+        return view(*args, **kwargs)
+    return wrapper
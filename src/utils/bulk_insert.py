@@ -0,0 +1,26 @@
+from src.models.user import db
+
+def insert_returning_ids(table, rows, session=None):
+    """Insere `rows` em `table` com executemany e retorna os ids na ordem das linhas.
+
+    - SQLite: RETURNING em lote e os ids ordenados. Com a trava de escrita da
+      transação, cada linha recebe o maior rowid + 1, na ordem dos VALUES,
+      então a ordem crescente dos ids é a ordem das linhas. (Pedir
+      sort_by_parameter_order faria o SQLAlchemy inserir linha a linha.)
+    - Dialetos com RETURNING ordenado em lote (PostgreSQL):
+      sort_by_parameter_order=True.
+    - Demais: um INSERT por linha.
+
+    Não faz commit.
+    """
+    if not rows:
+        # Um INSERT sem parâmetros inseriria uma linha só com os defaults
+        return []
+    session = session or db.session
+    dialect = session.get_bind().dialect
+    if dialect.name == 'sqlite' and getattr(dialect, 'insert_executemany_returning', False):
+        return sorted(row[0] for row in session.execute(table.insert().returning(table.c.id), rows))
+    if getattr(dialect, 'insert_executemany_returning_sort_by_parameter_order', False):
+        result = session.execute(table.insert().returning(table.c.id, sort_by_parameter_order=True), rows)
+        return [row[0] for row in result]
+    return [session.execute(table.insert(), row).inserted_primary_key[0] for row in rows]
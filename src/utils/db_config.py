@@ -0,0 +1,89 @@
+import os
+from flask import current_app, has_request_context, request
+from flask_sqlalchemy.session import Session
+from sqlalchemy import event
+
+# PRAGMAs aplicados a cada nova conexão SQLite
+SQLITE_PRAGMAS = {
+    'journal_mode': 'WAL',  # leitores não bloqueiam o escritor (e vice-versa)
+    'synchronous': 'NORMAL',  # seguro com WAL e bem mais barato que FULL
+    'busy_timeout': 5000,  # ms esperando o lock de escrita antes de "database is locked"
+    'cache_size': -65536,  # 64 MB de cache de páginas por conexão
+    'mmap_size': 268435456,  # 256 MB de leitura via mmap
+    'temp_store': 'MEMORY'
+}
+
+READONLY_BIND = 'readonly'
+
+def configure_database(app, default_sqlite_path):
+    """Define URIs e opções do engine a partir do ambiente.
+
+    DATABASE_URL troca o banco (ex: Postgres); DATABASE_READ_URL aponta um
+    pool/réplica só de leitura. Com SQLite em arquivo, o pool de leitura abre
+    o mesmo arquivo em modo somente leitura, aproveitando o WAL.
+    """
+    uri = os.environ.get('DATABASE_URL') or f"sqlite:///{default_sqlite_path}"
+    if uri.startswith('postgres://'):
+        uri = 'postgresql://' + uri[len('postgres://'):]
+    app.config['SQLALCHEMY_DATABASE_URI'] = uri
+
+    pragmas = dict(SQLITE_PRAGMAS)
+    for name in pragmas:
+        value = os.environ.get(f'SQLITE_{name.upper()}')
+        if value is not None:
+            pragmas[name] = value
+    app.config.setdefault('SQLITE_PRAGMAS', pragmas)
+
+    if uri.startswith('sqlite'):
+        app.config.setdefault('SQLALCHEMY_ENGINE_OPTIONS', {
+            'connect_args': {'check_same_thread': False, 'timeout': int(pragmas['busy_timeout']) / 1000}
+        })
+    else:
+        app.config.setdefault('SQLALCHEMY_ENGINE_OPTIONS', {
+            'pool_size': int(os.environ.get('DATABASE_POOL_SIZE', 10)),
+            'max_overflow': int(os.environ.get('DATABASE_MAX_OVERFLOW', 20)),
+            'pool_pre_ping': True
+        })
+
+    read_uri = os.environ.get('DATABASE_READ_URL')
+    if not read_uri and uri.startswith('sqlite:///') and uri != 'sqlite:///:memory:':
+        read_uri = f"sqlite:///file:{uri[len('sqlite:///'):]}?mode=ro&uri=true"
+    if read_uri:
+        binds = app.config.setdefault('SQLALCHEMY_BINDS', {})
+        binds[READONLY_BIND] = {'url': read_uri, **app.config['SQLALCHEMY_ENGINE_OPTIONS']}
+    app.config.setdefault('DATABASE_READONLY_GETS', os.environ.get('DATABASE_READONLY_GETS', '1') == '1')
+
+def _apply_pragmas(pragmas, readonly):
+    def on_connect(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        for name, value in pragmas.items():
+            # journal_mode é persistente no arquivo e não pode ser alterado em modo ro
+            if readonly and name == 'journal_mode':
+                continue
+            cursor.execute(f'PRAGMA {name}={value}')
+        cursor.close()
+    return on_connect
+
+def install_pragmas(app, db):
+    """Registra os PRAGMAs no evento connect de cada engine SQLite"""
+    with app.app_context():
+        for bind_key, engine in db.engines.items():
+            if engine.dialect.name == 'sqlite':
+                readonly = bind_key == READONLY_BIND
+                event.listen(engine, 'connect', _apply_pragmas(app.config['SQLITE_PRAGMAS'], readonly))
+
+class RoutingSession(Session):
+    """Sessão que envia as leituras de requisições GET para o pool somente leitura.
+
+    Escritas (flush) e qualquer uso fora de uma requisição GET continuam no
+    engine principal.
+    """
+
+    def get_bind(self, mapper=None, clause=None, bind=None, **kwargs):
+        if bind is None and not self._flushing and has_request_context() and request.method in ('GET', 'HEAD'):
+            app = current_app._get_current_object()
+            if app.config.get('DATABASE_READONLY_GETS'):
+                engines = app.extensions['sqlalchemy'].engines
+                if READONLY_BIND in engines:
+                    return engines[READONLY_BIND]
+        return super().get_bind(mapper=mapper, clause=clause, bind=bind, **kwargs)
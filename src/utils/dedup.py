@@ -0,0 +1,145 @@
+import hashlib
+import re
+import struct
+import unicodedata
+
+try:
+    import numpy as np
+except ImportError:  # NumPy é opcional: sem ele as assinaturas são calculadas em Python puro
+    np = None
+
+# Parâmetros do MinHash/LSH: 12 bandas x 6 linhas encontram ~97% dos pares com
+# similaridade de Jaccard 0.8 e quase nunca juntam pares abaixo de 0.4
+NUM_PERM = 72
+BANDS = 12
+ROWS = NUM_PERM // BANDS
+SHINGLE_SIZE = 4
+DEFAULT_THRESHOLD = 0.8
+
+# Limite de candidatos comparados por pergunta, para manter o custo linear
+# mesmo com baldes muito cheios (textos curtos e repetitivos)
+MAX_CANDIDATES = 100
+
+# Primo de Mersenne 2^31 - 1: a * x (x < 2^32) cabe em 64 bits, inclusive no NumPy
+_MERSENNE_PRIME = (1 << 31) - 1
+
+def _permutations(seed=1):
+    """Coeficientes (a, b) fixos das permutações, gerados de forma determinística"""
+    coefficients = []
+    for i in range(NUM_PERM):
+        digest = hashlib.blake2b(f'{seed}:{i}'.encode(), digest_size=16).digest()
+        a, b = struct.unpack('<QQ', digest)
+        coefficients.append((a % (_MERSENNE_PRIME - 1) + 1, b % _MERSENNE_PRIME))
+    return coefficients
+
+_PERMUTATIONS = _permutations()
+if np is not None:
+    _PERM_A = np.array([a for a, _ in _PERMUTATIONS], dtype=np.uint64)
+    _PERM_B = np.array([b for _, b in _PERMUTATIONS], dtype=np.uint64)
+
+def normalize(text):
+    """Minúsculas, sem acentos, pontuação ou numeração: base da comparação"""
+    text = unicodedata.normalize('NFKD', text or '')
+    text = ''.join(char for char in text if not unicodedata.combining(char)).lower()
+    text = re.sub(r'[^\w\s]', ' ', text)
+    return re.sub(r'\s+', ' ', text).strip()
+
+def exact_key(text):
+    return hashlib.sha1(normalize(text).encode('utf-8')).hexdigest()
+
+def _shingle_hashes(normalized):
+    if len(normalized) <= SHINGLE_SIZE:
+        shingles = {normalized}
+    else:
+        shingles = {normalized[i:i + SHINGLE_SIZE] for i in range(len(normalized) - SHINGLE_SIZE + 1)}
+    return [int.from_bytes(hashlib.blake2b(shingle.encode('utf-8'), digest_size=4).digest(), 'little')
+            for shingle in shingles]
+
+def minhash(normalized):
+    """Assinatura MinHash (NUM_PERM valores) do conjunto de shingles de caracteres"""
+    hashes = _shingle_hashes(normalized)
+    if np is not None:
+        values = np.array(hashes, dtype=np.uint64)
+        permuted = (_PERM_A[:, None] * values[None, :] + _PERM_B[:, None]) % np.uint64(_MERSENNE_PRIME)
+        return tuple(int(value) for value in permuted.min(axis=1))
+    return tuple(
+        min((a * value + b) % _MERSENNE_PRIME for value in hashes)
+        for a, b in _PERMUTATIONS
+    )
+
+def similarity(signature_a, signature_b):
+    """Estimativa da similaridade de Jaccard a partir de duas assinaturas"""
+    return sum(1 for x, y in zip(signature_a, signature_b) if x == y) / NUM_PERM
+
+def find_duplicates(questions, existing=(), threshold=DEFAULT_THRESHOLD, near=True):
+    """Encontra duplicatas exatas e quase-duplicatas nas perguntas novas.
+
+    `questions` é a lista nova (na ordem do upload); `existing` são tuplas
+    (id, question_text, question_list_id) já gravadas no escopo (mesma lista
+    ou mesma categoria). Cada pergunta nova é comparada com as existentes e
+    com as anteriores do próprio upload. O custo é linear: cada item só é
+    comparado com os candidatos que caem no mesmo balde do LSH.
+
+    Retorna {'exact': [...], 'near': [...], 'duplicate_indexes': [...]}.
+    """
+    exact = []
+    near_matches = []
+    seen = {}
+    for row_id, question_text, list_id in existing:
+        seen.setdefault(exact_key(question_text), {'id': row_id, 'question_list_id': list_id,
+                                                   'question_text': question_text})
+
+    buckets = {}
+    signatures = {}
+
+    def add_to_buckets(key, signature):
+        signatures[key] = signature
+        for band in range(BANDS):
+            buckets.setdefault((band, signature[band * ROWS:(band + 1) * ROWS]), []).append(key)
+
+    def best_candidate(signature):
+        best, best_score = None, 0.0
+        checked = set()
+        for band in range(BANDS):
+            for key in reversed(buckets.get((band, signature[band * ROWS:(band + 1) * ROWS]), ())):
+                if key in checked:
+                    continue
+                if len(checked) >= MAX_CANDIDATES:
+                    return best, best_score
+                checked.add(key)
+                score = similarity(signature, signatures[key])
+                if score > best_score:
+                    best, best_score = key, score
+        return best, best_score
+
+    existing_by_key = {}
+    if near:
+        for row_id, question_text, list_id in existing:
+            key = ('existing', row_id)
+            existing_by_key[key] = {'id': row_id, 'question_list_id': list_id, 'question_text': question_text}
+            add_to_buckets(key, minhash(normalize(question_text)))
+
+    duplicate_indexes = []
+    for index, question_text in enumerate(questions):
+        digest = exact_key(question_text)
+        if digest in seen:
+            exact.append({'index': index, 'question_text': question_text, 'duplicate_of': seen[digest]})
+            duplicate_indexes.append(index)
+            continue
+        seen[digest] = {'index': index, 'question_text': question_text}
+
+        if not near:
+            continue
+        signature = minhash(normalize(question_text))
+        candidate, score = best_candidate(signature)
+        if candidate is not None and score >= threshold:
+            similar_to = existing_by_key.get(candidate) or {
+                'index': candidate[1], 'question_text': questions[candidate[1]]
+            }
+            near_matches.append({'index': index, 'question_text': question_text,
+                                 'similar_to': similar_to, 'similarity': round(score, 3)})
+            duplicate_indexes.append(index)
+            continue
+        add_to_buckets(('new', index), signature)
+
+    return {'exact': exact, 'near': near_matches, 'duplicate_indexes': duplicate_indexes}
@@ -0,0 +1,29 @@
+from functools import wraps
+from flask import request, make_response
+
+def conditional(version_func):
+    """Decorador de GET condicional com ETag fraca.
+
+    `version_func` recebe os mesmos argumentos da view e retorna um carimbo
+    de versão barato (ou None para desativar). Se o cliente já tem essa versão
+    (If-None-Match), responde 304 sem executar a view nem serializar nada.
+    """
+    def decorator(view):
+        @wraps(view)
+        def wrapper(*args, **kwargs):
+            version = version_func(*args, **kwargs)
+            if version is None:
+                return view(*args, **kwargs)
+
+            etag = f'{request.endpoint}-{version}'
+            if request.if_none_match.contains_weak(etag):
+                response = make_response('', 304)
+                response.set_etag(etag, weak=True)
+                return response
+
+            response = make_response(view(*args, **kwargs))
+            if response.status_code == 200:
+                response.set_etag(etag, weak=True)
+            return response
+        return wrapper
+    return decorator
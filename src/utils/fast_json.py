@@ -0,0 +1,116 @@
+from datetime import date, datetime, time
+from decimal import Decimal
+import json
+import uuid
+from flask import Response, stream_with_context
+from flask.json.provider import DefaultJSONProvider
+
+try:
+    import orjson
+except ImportError:  # orjson é opcional: sem ele usa-se o json da biblioteca padrão
+    orjson = None
+
+# Itens serializados por pedaço enviado nas respostas em streaming
+STREAM_CHUNK_SIZE = 500
+
+def default(value):
+    """Tipos que o json padrão não conhece; datas saem em ISO 8601, como nos to_dict"""
+    if isinstance(value, (datetime, date, time)):
+        return value.isoformat()
+    if isinstance(value, Decimal):
+        return float(value)
+    if isinstance(value, (set, frozenset)):
+        return list(value)
+    if isinstance(value, uuid.UUID):
+        return str(value)
+    raise TypeError(f'Objeto do tipo {type(value).__name__} não é serializável em JSON')
+
+def dumps(value, sort_keys=False):
+    """Serializa para bytes UTF-8 (orjson quando disponível)"""
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_SORT_KEYS if sort_keys else 0)
+        return orjson.dumps(value, default=default, option=option)
+    return json.dumps(value, default=default, ensure_ascii=False, sort_keys=sort_keys,
+                      separators=(',', ':')).encode('utf-8')
+
+def loads(data):
+    return orjson.loads(data) if orjson is not None else json.loads(data)
+
+class FastJSONProvider(DefaultJSONProvider):
+    """Provider do Flask que usa orjson em jsonify/get_json.
+
+    orjson serializa datetime nativamente (no mesmo formato de isoformat),
+    então to_dict e encoders de linha podem devolver as datas sem convertê-las.
+    Sem orjson, cai no json padrão com o mesmo tratamento de datas.
+    """
+
+    default = staticmethod(default)
+
+    def dumps(self, obj, **kwargs):
+        if orjson is None or kwargs.keys() - {'indent', 'separators', 'default'}:
+            kwargs.setdefault('default', self.default)
+            kwargs.setdefault('ensure_ascii', self.ensure_ascii)
+            kwargs.setdefault('sort_keys', self.sort_keys)
+            return json.dumps(obj, **kwargs)
+        option = orjson.OPT_NON_STR_KEYS
+        if self.sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        if kwargs.get('indent'):
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, default=kwargs.get('default', self.default), option=option).decode('utf-8')
+
+    def loads(self, s, **kwargs):
+        if orjson is None or kwargs:
+            return json.loads(s, **kwargs)
+        return orjson.loads(s)
+
+    def response(self, *args, **kwargs):
+        if orjson is None or (self.compact is None and self._app.debug) or self.compact is False:
+            return super().response(*args, **kwargs)
+        # Caminho rápido: bytes direto para a resposta, sem decodificar/recodificar
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(dumps(obj, sort_keys=self.sort_keys) + b'\n', mimetype=self.mimetype)
+
+def row_encoder(fields, converters=None):
+    """Função que transforma linhas Core (tuplas na ordem de `fields`) em dicts.
+
+    Não hidrata objetos ORM nem converte datas (o serializador cuida disso);
+    só as colunas em `converters` passam por uma função.
+    """
+    fields = tuple(fields)
+    converters = {fields.index(name): func for name, func in (converters or {}).items() if name in fields}
+    if not converters:
+        return lambda row: dict(zip(fields, row))
+
+    def encode(row):
+        values = list(row)
+        for index, func in converters.items():
+            values[index] = func(values[index])
+        return dict(zip(fields, values))
+    return encode
+
+def json_array_response(items, head=None, key=None, chunk_size=STREAM_CHUNK_SIZE):
+    """Resposta JSON em streaming para resultados grandes.
+
+    Sem `head`, gera `[item, ...]`; com `head` (dict) e `key`, gera
+    `{...head, "key": [item, ...]}`. Os itens são serializados em pedaços de
+    `chunk_size`, sem montar a lista inteira em memória.
+    """
+    def generate():
+        if head is None:
+            yield b'['
+        else:
+            prefix = dumps(head)[:-1]
+            yield prefix + (b',' if head else b'') + dumps(key) + b':['
+        first = True
+        chunk = []
+        for item in items:
+            chunk.append(dumps(item))
+            if len(chunk) >= chunk_size:
+                yield (b'' if first else b',') + b','.join(chunk)
+                first = False
+                chunk = []
+        if chunk:
+            yield (b'' if first else b',') + b','.join(chunk)
+        yield b']' if head is None else b']}'
+    return Response(stream_with_context(generate()), mimetype='application/json')
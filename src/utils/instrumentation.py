@@ -0,0 +1,175 @@
+from collections import Counter
+from functools import partial
+import re
+import threading
+import time
+from flask import g, has_request_context, request, current_app
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+# Limites (segundos) dos histogramas de latência
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+# Mesma consulta repetida N vezes numa requisição = provável N+1
+N_PLUS_ONE_THRESHOLD = 5
+
+_NUMBER = re.compile(r'\b\d+\b')
+
+def _statement_shape(statement):
+    """Normaliza o SQL para agrupar execuções da mesma consulta com parâmetros diferentes"""
+    return _NUMBER.sub('?', ' '.join(statement.split()))
+
+class Histogram:
+    def __init__(self, buckets=LATENCY_BUCKETS):
+        self.buckets = buckets
+        self.counts = [0] * len(buckets)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value):
+        for i, limit in enumerate(self.buckets):
+            if value <= limit:
+                self.counts[i] += 1
+        self.sum += value
+        self.count += 1
+
+class Metrics:
+    """Métricas por endpoint (latência, SQL, N+1) mantidas em memória no processo.
+
+    Cada worker expõe os próprios números em /metrics; o Prometheus agrega
+    os alvos. O endpoint é a regra da rota (ex: /api/cards/<int:card_id>),
+    nunca a URL concreta, para manter a cardinalidade baixa.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        with self._lock:
+            self.latency = {}
+            self.requests = Counter()
+            self.sql_queries = Counter()
+            self.sql_seconds = Counter()
+            self.n_plus_one = Counter()
+
+    def init_app(self, app):
+        app.config.setdefault('METRICS_N_PLUS_ONE_THRESHOLD', N_PLUS_ONE_THRESHOLD)
+        app.before_request(self._before_request)
+        app.after_request(self._after_request)
+        if not event.contains(Engine, 'before_cursor_execute', _before_cursor_execute):
+            event.listen(Engine, 'before_cursor_execute', _before_cursor_execute)
+            event.listen(Engine, 'after_cursor_execute', _after_cursor_execute)
+            event.listen(Engine, 'handle_error', _handle_error)
+
+    def _before_request(self):
+        g.metrics_start = time.perf_counter()
+        g.sql_count = 0
+        g.sql_seconds = 0.0
+        g.sql_shapes = Counter()
+
+    def _after_request(self, response):
+        start = g.pop('metrics_start', None)
+        if start is None:
+            return response
+        # O cabeçalho sai antes do corpo: em respostas em streaming ele só cobre
+        # o trabalho feito até aqui (as consultas do gerador ainda não rodaram)
+        elapsed = time.perf_counter() - start
+        response.headers.add('Server-Timing', f'app;dur={elapsed * 1000:.1f}')
+        response.headers.add('Server-Timing', f'db;dur={g.get("sql_seconds", 0.0) * 1000:.1f};'
+                             f'desc="{g.get("sql_count", 0)} queries"')
+
+        # Os números só fecham quando o corpo termina de ser enviado. O objeto g
+        # continua recebendo as consultas do gerador (stream_with_context) e
+        # segue acessível pela closure depois que o contexto é desfeito.
+        endpoint = request.url_rule.rule if request.url_rule else 'unmatched'
+        response.call_on_close(partial(self._record, current_app._get_current_object(), g._get_current_object(),
+                                       start, request.method, endpoint, str(response.status_code)))
+        return response
+
+    def _record(self, app, state, start, method, endpoint, status):
+        elapsed = time.perf_counter() - start
+        sql_count = getattr(state, 'sql_count', 0)
+        sql_seconds = getattr(state, 'sql_seconds', 0.0)
+
+        threshold = app.config['METRICS_N_PLUS_ONE_THRESHOLD']
+        shapes = getattr(state, 'sql_shapes', Counter())
+        repeated = [(shape, count) for shape, count in shapes.items() if count >= threshold]
+        for shape, count in repeated:
+            app.logger.warning("Possível N+1 em %s %s: %d execuções de %s",
+                               method, endpoint, count, shape[:200])
+
+        key = (method, endpoint)
+        with self._lock:
+            self.latency.setdefault(key, Histogram()).observe(elapsed)
+            self.requests[key + (status,)] += 1
+            self.sql_queries[key] += sql_count
+            self.sql_seconds[key] += sql_seconds
+            if repeated:
+                self.n_plus_one[key] += 1
+
+    def render(self):
+        """Exporta no formato texto do Prometheus"""
+        def labels(method, endpoint, **extra):
+            items = [('method', method), ('endpoint', endpoint)] + list(extra.items())
+            escaped = ((name, str(value).replace('\\', '\\\\').replace('"', '\\"')) for name, value in items)
+            return '{' + ','.join(f'{name}="{value}"' for name, value in escaped) + '}'
+
+        lines = []
+        with self._lock:
+            lines.append('# HELP medcards_request_duration_seconds Latência das requisições por endpoint')
+            lines.append('# TYPE medcards_request_duration_seconds histogram')
+            for (method, endpoint), histogram in sorted(self.latency.items()):
+                for limit, count in zip(histogram.buckets, histogram.counts):
+                    lines.append(f'medcards_request_duration_seconds_bucket{labels(method, endpoint, le=limit)} {count}')
+                lines.append(f'medcards_request_duration_seconds_bucket{labels(method, endpoint, le="+Inf")} '
+                             f'{histogram.count}')
+                lines.append(f'medcards_request_duration_seconds_sum{labels(method, endpoint)} {histogram.sum:.6f}')
+                lines.append(f'medcards_request_duration_seconds_count{labels(method, endpoint)} {histogram.count}')
+
+            lines.append('# HELP medcards_requests_total Requisições por endpoint e status')
+            lines.append('# TYPE medcards_requests_total counter')
+            for (method, endpoint, status), count in sorted(self.requests.items()):
+                lines.append(f'medcards_requests_total{labels(method, endpoint, status=status)} {count}')
+
+            lines.append('# HELP medcards_sql_queries_total Comandos SQL executados por endpoint')
+            lines.append('# TYPE medcards_sql_queries_total counter')
+            for (method, endpoint), count in sorted(self.sql_queries.items()):
+                lines.append(f'medcards_sql_queries_total{labels(method, endpoint)} {count}')
+
+            lines.append('# HELP medcards_sql_duration_seconds_total Tempo gasto em SQL por endpoint')
+            lines.append('# TYPE medcards_sql_duration_seconds_total counter')
+            for (method, endpoint), seconds in sorted(self.sql_seconds.items()):
+                lines.append(f'medcards_sql_duration_seconds_total{labels(method, endpoint)} {seconds:.6f}')
+
+            lines.append('# HELP medcards_n_plus_one_total Requisições com consulta repetida (provável N+1)')
+            lines.append('# TYPE medcards_n_plus_one_total counter')
+            for (method, endpoint), count in sorted(self.n_plus_one.items()):
+                lines.append(f'medcards_n_plus_one_total{labels(method, endpoint)} {count}')
+        return '\n'.join(lines) + '\n'
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    if has_request_context():
+        conn.info.setdefault('metrics_query_start', []).append(time.perf_counter())
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    if not has_request_context():
+        return
+    starts = conn.info.get('metrics_query_start')
+    if not starts or 'sql_count' not in g:
+        return
+    g.sql_seconds += time.perf_counter() - starts.pop()
+    g.sql_count += 1
+    g.sql_shapes[_statement_shape(statement)] += 1
+
+def _handle_error(exception_context):
+    # Comando com erro não passa por after_cursor_execute: descartar o início
+    # empilhado para não desalinhar a pilha da conexão
+    conn = exception_context.connection
+    if conn is None:
+        return
+    starts = conn.info.get('metrics_query_start')
+    if starts:
+        starts.pop()
+
+metrics = Metrics()
@@ -0,0 +1,244 @@
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+import json
+import os
+import socket
+import threading
+import time
+import uuid
+from sqlalchemy.exc import OperationalError
+from src.models.user import db
+from src.models.job import Job
+
+# Funções que executam cada tipo de tarefa: job_type -> handler(context, payload)
+JOB_HANDLERS = {}
+
+def register_job(job_type):
+    """Decorador para registrar o handler de um tipo de tarefa"""
+    def decorator(func):
+        JOB_HANDLERS[job_type] = func
+        return func
+    return decorator
+
+class JobCancelled(Exception):
+    pass
+
+class JobContext:
+    """Passado ao handler para reportar progresso e verificar cancelamento"""
+
+    def __init__(self, runner, job_id):
+        self.runner = runner
+        self.job_id = job_id
+
+    def report_progress(self, value):
+        self.runner._progress[self.job_id] = value
+
+    def check_cancelled(self):
+        event = self.runner._cancel_events.get(self.job_id)
+        if event is not None and event.is_set():
+            raise JobCancelled()
+
+class JobRunner:
+    """Executor de tarefas em segundo plano dentro do processo.
+
+    O estado durável fica na tabela `jobs`. Vários workers podem rodar o
+    mesmo executor: uma tarefa só roda onde o UPDATE atômico
+    `status = 'queued' -> 'running'` a reivindicou (worker_id). Enquanto
+    roda, uma thread renova `heartbeat_at` e lê `cancel_requested`; no
+    início, só voltam para a fila as tarefas 'running' cujo heartbeat está
+    parado há mais de JOB_STALE_AFTER segundos (worker morto).
+
+    Progresso e o sinal de cancelamento ficam em memória para a tarefa, para
+    não disputar o lock de escrita do SQLite com a transação dela.
+
+    O heartbeat roda numa conexão própria enquanto a tarefa pode estar com o
+    lock de escrita do SQLite. Por isso ele lê `cancel_requested` antes de
+    escrever (no WAL a leitura não espera o escritor) e grava `heartbeat_at`
+    com o busy_timeout da conexão, repetindo até JOB_HEARTBEAT_RETRIES vezes
+    se o banco continuar travado. Se nada disso bastar, a rodada é pulada e a
+    próxima tenta de novo. Consequência: nenhuma transação de uma tarefa pode
+    segurar o lock por mais que JOB_STALE_AFTER segundos, senão ela seria dada
+    como morta; handlers longos devem gravar em lotes com commit por lote.
+    """
+
+    def __init__(self, app=None, max_workers=2, heartbeat_interval=10, stale_after=60, heartbeat_retries=2):
+        self.app = None
+        self.max_workers = max_workers
+        self.heartbeat_interval = heartbeat_interval
+        self.stale_after = stale_after
+        self.heartbeat_retries = heartbeat_retries
+        self.worker_id = f'{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}'
+        self._executor = None
+        self._progress = {}
+        self._cancel_events = {}
+        self._running = set()
+        self._heartbeat_thread = None
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app):
+        self.app = app
+        self.max_workers = app.config.get('JOB_WORKERS', self.max_workers)
+        self.heartbeat_interval = app.config.get('JOB_HEARTBEAT_INTERVAL', self.heartbeat_interval)
+        self.stale_after = app.config.get('JOB_STALE_AFTER', self.stale_after)
+        self.heartbeat_retries = app.config.get('JOB_HEARTBEAT_RETRIES', self.heartbeat_retries)
+        self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix='medcards-job')
+        app.extensions['job_runner'] = self
+        if self._heartbeat_thread is None:
+            self._heartbeat_thread = threading.Thread(target=self._heartbeat_loop, name='job-heartbeat', daemon=True)
+            self._heartbeat_thread.start()
+
+    def reap_stale(self):
+        """Devolve à fila as tarefas 'running' com heartbeat parado (worker morto). Retorna quantas."""
+        stale = datetime.utcnow() - timedelta(seconds=self.stale_after)
+        reaped = Job.query.filter(
+            Job.status == 'running',
+            db.or_(Job.heartbeat_at.is_(None), Job.heartbeat_at < stale)
+        ).update({'status': 'queued', 'worker_id': None}, synchronize_session=False)
+        db.session.commit()
+        return reaped
+
+    def resume_pending(self):
+        """Reenfileira tarefas de workers mortos e agenda as que estão na fila"""
+        with self.app.app_context():
+            self.reap_stale()
+            for (job_id,) in db.session.query(Job.id).filter_by(status='queued').all():
+                self._schedule(job_id)
+
+    def submit(self, job_type, payload, created_by=None):
+        if job_type not in JOB_HANDLERS:
+            raise ValueError(f'Tipo de tarefa desconhecido: {job_type}')
+        job = Job(job_type=job_type, payload=json.dumps(payload), created_by=created_by)
+        db.session.add(job)
+        db.session.commit()
+        self._schedule(job.id)
+        return job
+
+    def cancel(self, job):
+        """Cancela uma tarefa na fila ou pede o cancelamento da tarefa em execução (em qualquer worker)"""
+        if job.status == 'queued':
+            cancelled = Job.query.filter_by(id=job.id, status='queued').update(
+                {'status': 'cancelled', 'finished_at': datetime.utcnow()}, synchronize_session=False)
+            db.session.commit()
+            db.session.refresh(job)
+            if cancelled:
+                return True
+        if job.status == 'running':
+            job.cancel_requested = True
+            db.session.commit()
+            event = self._cancel_events.get(job.id)
+            if event is not None:
+                event.set()
+            return True
+        return False
+
+    def retry(self, job):
+        if job.status not in ('failed', 'cancelled'):
+            return False
+        job.status = 'queued'
+        job.error = None
+        job.result = None
+        job.progress = 0
+        job.started_at = None
+        job.finished_at = None
+        job.worker_id = None
+        job.heartbeat_at = None
+        job.cancel_requested = False
+        db.session.commit()
+        self._schedule(job.id)
+        return True
+
+    def live_progress(self, job_id):
+        return self._progress.get(job_id)
+
+    def _schedule(self, job_id):
+        self._cancel_events[job_id] = threading.Event()
+        self._executor.submit(self._run, job_id)
+
+    def _claim(self, job_id):
+        """Passa a tarefa de 'queued' para 'running' em nome deste worker; False se outro já pegou"""
+        now = datetime.utcnow()
+        claimed = Job.query.filter_by(id=job_id, status='queued').update({
+            'status': 'running',
+            'worker_id': self.worker_id,
+            'heartbeat_at': now,
+            'started_at': now,
+            'attempts': db.func.coalesce(Job.attempts, 0) + 1,
+            'cancel_requested': False
+        }, synchronize_session=False)
+        db.session.commit()
+        return claimed == 1
+
+    def _run(self, job_id):
+        with self.app.app_context():
+            try:
+                if not self._claim(job_id):
+                    return
+                self._running.add(job_id)
+                job = Job.query.get(job_id)
+
+                context = JobContext(self, job_id)
+                try:
+                    result = JOB_HANDLERS[job.job_type](context, job.get_payload())
+                    status, result, error = 'succeeded', json.dumps(result) if result is not None else None, None
+                except JobCancelled:
+                    db.session.rollback()
+                    status, result, error = 'cancelled', None, None
+                except Exception as e:
+                    db.session.rollback()
+                    status, result, error = 'failed', None, str(e)
+
+                # Só grava o desfecho se a tarefa ainda é deste worker
+                Job.query.filter_by(id=job_id, worker_id=self.worker_id).update({
+                    'status': status,
+                    'result': result,
+                    'error': error,
+                    'progress': self._progress.get(job_id, job.progress),
+                    'finished_at': datetime.utcnow()
+                }, synchronize_session=False)
+                db.session.commit()
+            finally:
+                self._running.discard(job_id)
+                self._progress.pop(job_id, None)
+                self._cancel_events.pop(job_id, None)
+                db.session.remove()
+
+    def _heartbeat(self):
+        """Repassa pedidos de cancelamento e renova o heartbeat das tarefas em execução aqui"""
+        running = list(self._running)
+        if not running:
+            return
+        with self.app.app_context():
+            table = Job.__table__
+            # Só leitura: não espera o lock de escrita de uma tarefa em andamento
+            with db.engine.connect() as connection:
+                cancelled = connection.execute(db.select(table.c.id).where(
+                    table.c.id.in_(running), table.c.cancel_requested == True
+                )).scalars().all()
+            for job_id in cancelled:
+                event = self._cancel_events.get(job_id)
+                if event is not None:
+                    event.set()
+
+            for attempt in range(self.heartbeat_retries + 1):
+                try:
+                    with db.engine.begin() as connection:
+                        connection.execute(table.update().where(
+                            table.c.id.in_(running), table.c.worker_id == self.worker_id
+                        ).values(heartbeat_at=datetime.utcnow()))
+                    return
+                except OperationalError as e:
+                    # Cada tentativa já esperou o busy_timeout; outro erro não é de lock
+                    if 'locked' not in str(e) or attempt == self.heartbeat_retries:
+                        raise
+
+    def _heartbeat_loop(self):
+        while True:
+            time.sleep(self.heartbeat_interval)
+            try:
+                self._heartbeat()
+            except Exception as e:
+                if self.app is not None:
+                    self.app.logger.warning("Falha ao renovar o heartbeat das tarefas: %s", e)
+
+job_runner = JobRunner()
@@ -0,0 +1,60 @@
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeout
+import os
+import threading
+from werkzeug.security import check_password_hash, generate_password_hash
+
+class PasswordPoolBusy(Exception):
+    """Fila de hashing cheia (ou espera esgotada): o cliente deve tentar de novo"""
+
+class PasswordHasher:
+    """Executa hash/verificação de senha num pool limitado de threads.
+
+    O hash é caro de propósito; num pico de logins (dia de prova) ele não
+    pode ocupar todas as threads de requisição. No máximo `workers` hashes
+    rodam ao mesmo tempo e no máximo `max_pending` esperam na fila; acima
+    disso a chamada falha na hora com PasswordPoolBusy (HTTP 503).
+    """
+
+    def __init__(self, workers=None, max_pending=64, timeout=10):
+        self.workers = workers or min(4, os.cpu_count() or 1)
+        self.max_pending = max_pending
+        self.timeout = timeout
+        self._executor = None
+        self._slots = None
+        self._lock = threading.Lock()
+
+    def init_app(self, app):
+        self.workers = app.config.setdefault('PASSWORD_HASH_WORKERS', self.workers)
+        self.max_pending = app.config.setdefault('PASSWORD_HASH_MAX_PENDING', self.max_pending)
+        self.timeout = app.config.setdefault('PASSWORD_HASH_TIMEOUT', self.timeout)
+        self.shutdown()
+
+    def _run(self, func, *args):
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix='password-hash')
+                self._slots = threading.BoundedSemaphore(self.workers + self.max_pending)
+            executor, slots = self._executor, self._slots
+        if not slots.acquire(blocking=False):
+            raise PasswordPoolBusy('Muitas requisições de login simultâneas, tente novamente')
+        future = executor.submit(func, *args)
+        future.add_done_callback(lambda _: slots.release())
+        try:
+            return future.result(timeout=self.timeout)
+        except FutureTimeout:
+            future.cancel()
+            raise PasswordPoolBusy('Tempo esgotado aguardando verificação de senha')
+
+    def hash(self, password):
+        return self._run(generate_password_hash, password)
+
+    def verify(self, password_hash, password):
+        return self._run(check_password_hash, password_hash, password)
+
+    def shutdown(self):
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=False)
+            self._executor = None
+
+password_hasher = PasswordHasher()
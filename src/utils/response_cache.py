@@ -0,0 +1,215 @@
+from collections import OrderedDict
+from functools import wraps
+import os
+import pickle
+import sqlite3
+import threading
+import time
+import uuid
+from flask import g, request, make_response
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+class MemoryBackend:
+    """Cache em memória do processo, com TTL e descarte LRU (desenvolvimento)"""
+
+    def __init__(self, max_entries=10000):
+        self.max_entries = max_entries
+        self._data = OrderedDict()
+        self._counters = {}
+        self._lock = threading.Lock()
+        # Contadores vivem só neste processo: a época distingue reinícios
+        self.epoch = uuid.uuid4().hex[:8]
+
+    def get(self, key):
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return None
+            value, expires_at = entry
+            if expires_at is not None and expires_at < time.time():
+                del self._data[key]
+                return None
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key, value, ttl=None):
+        with self._lock:
+            self._data[key] = (value, time.time() + ttl if ttl else None)
+            self._data.move_to_end(key)
+            while len(self._data) > self.max_entries:
+                self._data.popitem(last=False)
+
+    def counter(self, key):
+        with self._lock:
+            return self._counters.get(key, 0)
+
+    def incr(self, key):
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + 1
+            return self._counters[key]
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+            self._counters.clear()
+
+class SQLiteBackend:
+    """Cache num arquivo SQLite local, compartilhado entre os workers (produção)"""
+
+    def __init__(self, path, max_entries=100000):
+        self.path = path
+        self.max_entries = max_entries
+        self._local = threading.local()
+        with self._connect() as conn:
+            conn.execute('CREATE TABLE IF NOT EXISTS cache ('
+                         'key TEXT PRIMARY KEY, value BLOB, expires_at REAL, accessed_at REAL)')
+            conn.execute('CREATE INDEX IF NOT EXISTS ix_cache_accessed_at ON cache (accessed_at)')
+            conn.execute('CREATE TABLE IF NOT EXISTS counters (key TEXT PRIMARY KEY, value INTEGER NOT NULL)')
+        self.epoch = 'shared'
+
+    def _connect(self):
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=5, isolation_level=None)
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute('PRAGMA synchronous=NORMAL')
+            self._local.conn = conn
+        return conn
+
+    def get(self, key):
+        conn = self._connect()
+        row = conn.execute('SELECT value, expires_at FROM cache WHERE key = ?', (key,)).fetchone()
+        if row is None:
+            return None
+        value, expires_at = row
+        now = time.time()
+        if expires_at is not None and expires_at < now:
+            conn.execute('DELETE FROM cache WHERE key = ?', (key,))
+            return None
+        conn.execute('UPDATE cache SET accessed_at = ? WHERE key = ?', (now, key))
+        return pickle.loads(value)
+
+    def set(self, key, value, ttl=None):
+        conn = self._connect()
+        now = time.time()
+        conn.execute('INSERT OR REPLACE INTO cache (key, value, expires_at, accessed_at) VALUES (?, ?, ?, ?)',
+                     (key, pickle.dumps(value), now + ttl if ttl else None, now))
+        # Descarte LRU ocasional, para não contar a tabela a cada escrita
+        if hash(key) % 100 == 0:
+            conn.execute('DELETE FROM cache WHERE key IN (SELECT key FROM cache ORDER BY accessed_at '
+                         'LIMIT max(0, (SELECT count(*) FROM cache) - ?))', (self.max_entries,))
+
+    def counter(self, key):
+        row = self._connect().execute('SELECT value FROM counters WHERE key = ?', (key,)).fetchone()
+        return row[0] if row else 0
+
+    def incr(self, key):
+        conn = self._connect()
+        conn.execute('INSERT INTO counters (key, value) VALUES (?, 1) '
+                     'ON CONFLICT(key) DO UPDATE SET value = value + 1', (key,))
+        return self.counter(key)
+
+    def clear(self):
+        conn = self._connect()
+        conn.execute('DELETE FROM cache')
+        conn.execute('DELETE FROM counters')
+
+class ResponseCache:
+    """Cache de respostas GET por usuário, invalidado por contadores de geração.
+
+    A chave inclui a geração atual do usuário; qualquer escrita confirmada que
+    afete o usuário incrementa a geração e torna as entradas antigas
+    inalcançáveis (elas expiram pelo TTL ou saem pelo LRU).
+    """
+
+    def __init__(self, app=None):
+        self.backend = None
+        self.default_ttl = 60
+        self.enabled = True
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app):
+        self.enabled = app.config.get('RESPONSE_CACHE_ENABLED', True)
+        self.default_ttl = app.config.get('RESPONSE_CACHE_TTL', 60)
+        max_entries = app.config.get('RESPONSE_CACHE_MAX_ENTRIES', 10000)
+        backend = app.config.get('RESPONSE_CACHE_BACKEND', 'memory')
+        if backend == 'sqlite':
+            path = app.config.get('RESPONSE_CACHE_PATH') or os.path.join(app.instance_path, 'response_cache.db')
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            self.backend = SQLiteBackend(path, max_entries=max_entries)
+        else:
+            self.backend = MemoryBackend(max_entries=max_entries)
+        app.extensions['response_cache'] = self
+
+    def generation(self, user_id):
+        return self.backend.counter(f'gen:{user_id}')
+
+    def version(self, user_id):
+        """Carimbo de versão dos dados do usuário (usado em ETags)
+
+        Inclui o id: dois usuários na mesma geração não podem compartilhar ETag.
+        """
+        if self.backend is None:
+            return None
+        return f'{user_id}-{self.backend.epoch}-{self.generation(user_id)}'
+
+    def invalidate_user(self, user_id):
+        if self.backend is not None:
+            self.backend.incr(f'gen:{user_id}')
+
+    def cached(self, ttl=None):
+        """Decorador para rotas GET autenticadas (aplicado abaixo de require_user)"""
+        def decorator(view):
+            @wraps(view)
+            def wrapper(*args, **kwargs):
+                principal = g.get('principal')
+                if not self.enabled or self.backend is None or principal is None:
+                    return view(*args, **kwargs)
+
+                user_id = principal.id
+
+                args_key = '&'.join(f'{key}={value}' for key, value in sorted(request.args.items(multi=True)))
+                key = f'resp:{request.endpoint}:{user_id}:{self.generation(user_id)}:{args_key}'
+                entry = self.backend.get(key)
+                if entry is not None:
+                    body, status, mimetype = entry
+                    response = make_response(body, status)
+                    response.mimetype = mimetype
+                    response.headers['X-Cache'] = 'HIT'
+                    return response
+
+                response = make_response(view(*args, **kwargs))
+                if response.status_code == 200 and not response.is_streamed:
+                    self.backend.set(key, (response.get_data(), response.status_code, response.mimetype),
+                                     ttl or self.default_ttl)
+                response.headers['X-Cache'] = 'MISS'
+                return response
+            return wrapper
+        return decorator
+
+response_cache = ResponseCache()
+
+def mark_user_dirty(session, user_id):
+    """Agenda a invalidação do cache do usuário para quando a transação for confirmada"""
+    if user_id is not None:
+        session.info.setdefault('dirty_users', set()).add(int(user_id))
+
+@event.listens_for(Session, 'after_commit')
+def _invalidate_dirty_users(session):
+    for user_id in session.info.pop('dirty_users', ()):
+        response_cache.invalidate_user(user_id)
+
+@event.listens_for(Session, 'after_rollback')
+def _discard_dirty_users(session):
+    session.info.pop('dirty_users', None)
+
+def track_user_writes(model, user_id_getter):
+    """Invalida o cache do usuário quando o ORM insere, altera ou remove `model`"""
+    def listener(mapper, connection, target):
+        session = Session.object_session(target)
+        if session is not None:
+            mark_user_dirty(session, user_id_getter(connection, target))
+    for name in ('after_insert', 'after_update', 'after_delete'):
+        event.listen(model, name, listener)
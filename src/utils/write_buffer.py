@@ -0,0 +1,134 @@
+import atexit
+import threading
+from flask import current_app
+from sqlalchemy import bindparam
+
+class WriteBehindBuffer:
+    """Acumula em memória atualizações de baixo valor e grava em lote.
+
+    Cada `assign` (ex: User.last_login) guarda o último valor da coluna; a cada
+    `interval` segundos, ou quando há `max_pending` linhas pendentes, uma
+    thread grava tudo numa única transação com executemany. Assim cada
+    login não abre a própria transação de escrita no SQLite.
+
+    Leituras devem passar por `overlay` para enxergar os valores ainda não
+    gravados (read-your-writes). O buffer é gravado no encerramento do
+    processo (atexit); o que estiver pendente num crash é perdido, por isso
+    só serve para dados que podem ser reconstruídos ou tolerar essa perda.
+    """
+
+    def __init__(self, interval=2.0, max_pending=500):
+        self.app = None
+        self.interval = interval
+        self.max_pending = max_pending
+        self._assignments = {}
+        # Lote em gravação: continua visível no overlay até o commit
+        self._in_flight = {}
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._wake = threading.Event()
+        self._stopped = threading.Event()
+        self._thread = None
+
+    def init_app(self, app):
+        self.app = app
+        self.interval = app.config.setdefault('WRITE_BUFFER_INTERVAL', self.interval)
+        self.max_pending = app.config.setdefault('WRITE_BUFFER_MAX_PENDING', self.max_pending)
+        app.extensions['write_buffer'] = self
+        if app.config.setdefault('WRITE_BUFFER_ENABLED', True) and self._thread is None:
+            self._stopped.clear()
+            self._thread = threading.Thread(target=self._run, name='write-behind', daemon=True)
+            self._thread.start()
+            atexit.register(self.shutdown)
+
+    @staticmethod
+    def _key(model, pk):
+        return model.__table__.name, pk
+
+    def assign(self, model, pk, **values):
+        """Define colunas da linha `pk`; vale o último valor (ex: last_login)"""
+        with self._lock:
+            self._assignments.setdefault(self._key(model, pk), {}).update(values)
+        self._after_write()
+
+    def _after_write(self):
+        if self._thread is None:
+            # Sem thread (scripts, WRITE_BUFFER_ENABLED=False): grava na hora
+            self.flush()
+        elif len(self._assignments) >= self.max_pending:
+            self._wake.set()
+
+    def overlay(self, instance, columns):
+        """Valores atuais de `columns`, aplicando o que ainda não foi gravado"""
+        key = self._key(type(instance), instance.id)
+        values = {column: getattr(instance, column) for column in columns}
+        with self._lock:
+            for assignments in (self._in_flight, self._assignments):
+                for column, value in assignments.get(key, {}).items():
+                    if column in values:
+                        values[column] = value
+        return values
+
+    def flush(self):
+        """Grava tudo o que está pendente numa transação. Retorna o número de linhas."""
+        with self._flush_lock:
+            with self._lock:
+                assignments = self._assignments
+                if not assignments:
+                    return 0
+                self._assignments = {}
+                self._in_flight = assignments
+            try:
+                app = self.app or current_app._get_current_object()
+                with app.app_context():
+                    db = app.extensions['sqlalchemy']
+                    with db.engine.begin() as connection:
+                        self._apply(connection, db.metadata, assignments)
+            except Exception:
+                # Devolve ao buffer para a próxima tentativa, sem perder nada
+                with self._lock:
+                    for key, values in assignments.items():
+                        self._assignments[key] = {**values, **self._assignments.get(key, {})}
+                raise
+            finally:
+                with self._lock:
+                    self._in_flight = {}
+            return len(assignments)
+
+    @staticmethod
+    def _apply(connection, metadata, assignments):
+        # Um executemany por (tabela, conjunto de colunas)
+        groups = {}
+        for (table_name, pk), values in assignments.items():
+            groups.setdefault((table_name, tuple(sorted(values))), []).append((pk, values))
+
+        for (table_name, columns), rows in groups.items():
+            table = metadata.tables[table_name]
+            pk_column = list(table.primary_key.columns)[0]
+            connection.execute(
+                table.update().where(pk_column == bindparam('b_pk')).values(
+                    {column: bindparam(f'v_{column}') for column in columns}
+                ),
+                [{'b_pk': pk, **{f'v_{column}': row[column] for column in columns}} for pk, row in rows]
+            )
+
+    def _run(self):
+        while not self._stopped.is_set():
+            self._wake.wait(self.interval)
+            self._wake.clear()
+            try:
+                self.flush()
+            except Exception as e:
+                if self.app is not None:
+                    self.app.logger.warning("Falha ao gravar o buffer de escrita: %s", e)
+
+    def shutdown(self):
+        """Para a thread e grava o que restou (chamado no encerramento do processo)"""
+        self._stopped.set()
+        self._wake.set()
+        if self._thread is not None:
+            self._thread.join(timeout=10)
+            self._thread = None
+        self.flush()
+
+write_buffer = WriteBehindBuffer()
@@ -0,0 +1,55 @@
+import os
+import sys
+import tempfile
+import pytest
+
+# Mesmo layout dos scripts da raiz (seed_synthetic.py, migrate.py): o pacote é `src`
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Banco SQLite descartável, definido antes de importar a aplicação
+os.environ['DATABASE_URL'] = 'sqlite:///' + os.path.join(tempfile.mkdtemp(prefix='medcards-tests-'), 'app.db')
+os.environ.setdefault('MEDCARDS_AUTH_LEGACY', '0')
+
+from src.main import app as flask_app, db
+from src.models.user import User
+from src.models.category import Category
+from src.models.due_queue import due_queue
+from src.utils.auth_tokens import issue_token, principal_cache
+from src.utils.response_cache import response_cache
+from src.utils.write_buffer import write_buffer
+
+@pytest.fixture
+def app():
+    with flask_app.app_context():
+        yield flask_app
+        write_buffer.flush()
+        db.session.remove()
+        with db.engine.begin() as connection:
+            for table in reversed(db.metadata.sorted_tables):
+                connection.execute(table.delete())
+        principal_cache.clear()
+        response_cache.backend.clear()
+        due_queue.invalidate()
+
+@pytest.fixture
+def client(app):
+    return app.test_client()
+
+@pytest.fixture
+def make_user(app):
+    """Cria um usuário e retorna (id, cabeçalhos com o token de acesso)"""
+    def make(username='ana', is_admin=False):
+        user = User(username=username, email=f'{username}@example.com', password_hash='-', is_admin=is_admin)
+        db.session.add(user)
+        db.session.commit()
+        return user.id, {'Authorization': f'Bearer {issue_token(user)}'}
+    return make
+
+@pytest.fixture
+def make_category(app):
+    def make(user_id, name='Cardiologia'):
+        category = Category(user_id=user_id, name=name)
+        db.session.add(category)
+        db.session.commit()
+        return category.id
+    return make
@@ -0,0 +1,144 @@
+import io
+import json
+import os
+import sqlite3
+import tempfile
+import zipfile
+from datetime import datetime, timedelta
+from src.main import db
+from src.models.category import Category, Theme
+from src.models.card import Card
+from src.models.study import StudySession, CardReview
+from src.utils.anki_package import AnkiPackage, MILLISECONDS_PER_DAY, field_to_text, note_to_question
+
+CREATED = 1_700_000_000  # criação da coleção (segundos)
+DECKS = {'1': {'name': 'Default'}, '10': {'name': 'Cardiologia::Arritmias::FA'}}
+
+def build_apkg(notes, cards, revlog=()):
+    """Pacote .apkg mínimo (formato collection.anki21) com as linhas dadas"""
+    handle, path = tempfile.mkstemp(suffix='.anki21')
+    os.close(handle)
+    try:
+        connection = sqlite3.connect(path)
+        connection.executescript("""
+            CREATE TABLE col (id INTEGER PRIMARY KEY, crt INTEGER, decks TEXT, models TEXT);
+            CREATE TABLE notes (id INTEGER PRIMARY KEY, mid INTEGER, flds TEXT, tags TEXT, mod INTEGER);
+            CREATE TABLE cards (id INTEGER PRIMARY KEY, nid INTEGER, did INTEGER, ord INTEGER, type INTEGER,
+                                queue INTEGER, due INTEGER, ivl INTEGER, factor INTEGER, reps INTEGER, lapses INTEGER);
+            CREATE TABLE revlog (id INTEGER PRIMARY KEY, cid INTEGER, usn INTEGER, ease INTEGER, ivl INTEGER,
+                                 lastIvl INTEGER, factor INTEGER, time INTEGER, type INTEGER);
+        """)
+        connection.execute('INSERT INTO col VALUES (1, ?, ?, ?)', (CREATED, json.dumps(DECKS), '{}'))
+        connection.executemany('INSERT INTO notes VALUES (?, 1, ?, ?, 0)', notes)
+        connection.executemany('INSERT INTO cards VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, 0)', cards)
+        connection.executemany('INSERT INTO revlog VALUES (?, ?, 0, ?, 1, 1, 2500, ?, 1)', revlog)
+        connection.commit()
+        connection.close()
+        output = io.BytesIO()
+        with zipfile.ZipFile(output, 'w') as archive:
+            archive.write(path, 'collection.anki21')
+            archive.writestr('media', '{}')
+        return output.getvalue()
+    finally:
+        os.unlink(path)
+
+NOTE_MS = CREATED * 1000
+DAY_ONE = NOTE_MS + 10 * MILLISECONDS_PER_DAY
+
+def sample_deck():
+    notes = [
+        (NOTE_MS + 1, '{{c1::Amiodarona::droga}} trata <b>FA</b>&nbsp;aguda\x1fextra', ' cardio FA '),
+        (NOTE_MS + 2, 'Dose de adenosina?<br>adulto\x1f6 mg [sound:a.mp3]', ''),
+        (NOTE_MS + 3, '<img src="ecg.png">\x1fsó imagem', ''),
+    ]
+    cards = [
+        # id, nota, baralho, ord, tipo, fila, due, ivl, fator, reps
+        (11, NOTE_MS + 1, 10, 0, 2, 2, 30, 20, 2300, 5),
+        (12, NOTE_MS + 1, 10, 1, 0, 0, 1, 0, 0, 0),
+        (21, NOTE_MS + 2, 1, 0, 0, 0, 2, 0, 0, 0),
+        (31, NOTE_MS + 3, 1, 0, 1, 1, CREATED + 600, 0, 2500, 1),
+    ]
+    revlog = [
+        (DAY_ONE + 1000, 11, 3, 8000),
+        (DAY_ONE + 2000, 11, 1, 12000),
+        (DAY_ONE + 3000, 31, 4, 3000),  # nota sem card importado: fica de fora
+        (DAY_ONE + MILLISECONDS_PER_DAY, 11, 4, 5000),
+        (DAY_ONE + MILLISECONDS_PER_DAY + 500, 11, 0, 0),  # reagendamento manual
+    ]
+    return build_apkg(notes, cards, revlog)
+
+def _import(client, headers, data, include_reviews=True):
+    response = client.post('/api/anki/import', headers=headers, data={
+        'file': (io.BytesIO(data), 'deck.apkg'), 'include_reviews': 'true' if include_reviews else 'false'
+    }, content_type='multipart/form-data')
+    assert response.status_code == 200
+    return [json.loads(line) for line in response.get_data().splitlines()]
+
+def test_field_to_text_strips_markup_and_media():
+    assert field_to_text('Linha 1<br>Linha 2 [sound:x.mp3]&nbsp;<b>fim</b>') == 'Linha 1\nLinha 2  fim'
+
+def test_cloze_note_hides_the_gaps():
+    question, answer = note_to_question(['{{c1::Amiodarona::droga}} e {{c2::sotalol}} na FA', 'extra'])
+    assert question == '[droga] e [...] na FA'
+    assert answer == 'Amiodarona e sotalol na FA\nextra'
+
+def test_due_dates_by_card_type():
+    package = AnkiPackage(io.BytesIO(build_apkg([], [])))
+    try:
+        now = datetime(2026, 1, 1)
+        assert package.due_date(0, 5, now) == now
+        assert package.due_date(1, CREATED + 600, now) == datetime.utcfromtimestamp(CREATED + 600)
+        assert package.due_date(2, 30, now) == datetime.utcfromtimestamp(CREATED) + timedelta(days=30)
+    finally:
+        package.close()
+
+def test_import_creates_cards_decks_and_history(client, make_user):
+    user_id, headers = make_user()
+    lines = _import(client, headers, sample_deck())
+    assert 'error' not in lines[-1]
+    assert lines[-1]['done'] is True
+    assert (lines[-1]['notes'], lines[-1]['cards'], lines[-1]['skipped']) == (3, 2, 1)
+    assert (lines[-1]['sessions'], lines[-1]['reviews']) == (2, 3)
+
+    category = Category.query.filter_by(user_id=user_id, name='Cardiologia').one()
+    theme = Theme.query.filter_by(category_id=category.id).one()
+    assert theme.name == 'Arritmias::FA'
+
+    cloze = Card.query.filter_by(user_id=user_id, theme_id=theme.id).one()
+    assert cloze.question == '[droga] trata FA aguda'
+    assert sorted(cloze.get_tags()) == ['FA', 'cardio']
+    assert (cloze.review_count, cloze.ease_factor) == (5, 2.3)
+    assert cloze.next_review == datetime.utcfromtimestamp(CREATED) + timedelta(days=30)
+    basic = Card.query.filter_by(user_id=user_id, category_id=Category.query.filter_by(
+        user_id=user_id, name='Default').one().id).one()
+    assert (basic.question, basic.answer) == ('Dose de adenosina?\nadulto', '6 mg')
+
+    sessions = StudySession.query.filter_by(user_id=user_id).order_by(StudySession.started_at).all()
+    assert [(session.total_cards, session.correct_answers) for session in sessions] == [(2, 1), (1, 1)]
+    reviews = CardReview.query.filter_by(user_id=user_id).order_by(CardReview.reviewed_at).all()
+    assert [(review.is_correct, review.difficulty_rating) for review in reviews] == [(True, 4), (False, 1), (True, 5)]
+
+def test_import_merges_into_existing_categories(client, make_user, make_category):
+    user_id, headers = make_user()
+    category_id = make_category(user_id, 'Cardiologia')
+    _import(client, headers, sample_deck(), include_reviews=False)
+    _import(client, headers, sample_deck(), include_reviews=False)
+    assert Category.query.filter_by(user_id=user_id, name='Cardiologia').count() == 1
+    assert Theme.query.filter_by(category_id=category_id).count() == 1
+    assert Card.query.filter_by(user_id=user_id).count() == 4
+    assert StudySession.query.filter_by(user_id=user_id).count() == 0
+
+def test_import_without_history_and_include_reviews(client, make_user):
+    user_id, headers = make_user()
+    data = build_apkg([(NOTE_MS + 1, 'Frente\x1fVerso', '')], [(11, NOTE_MS + 1, 1, 0, 0, 0, 0, 0, 0, 0)])
+    lines = _import(client, headers, data)
+    assert lines[-1]['done'] is True
+    assert (lines[-1]['cards'], lines[-1]['sessions'], lines[-1]['reviews']) == (1, 0, 0)
+
+def test_import_rejects_invalid_package(client, make_user):
+    _, headers = make_user()
+    response = client.post('/api/anki/import', headers=headers, data=b'nada de zip')
+    assert response.status_code == 400
+
+def test_import_requires_authentication(client):
+    assert client.post('/api/anki/import', data=sample_deck()).status_code == 401
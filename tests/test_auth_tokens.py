@@ -0,0 +1,71 @@
+import pytest
+from src.main import db
+from src.models.user import User
+from src.utils.auth_tokens import issue_token, verify_token, principal_cache
+
+@pytest.fixture
+def legacy_auth(app, monkeypatch):
+    monkeypatch.setitem(app.config, 'AUTH_ALLOW_LEGACY_USER_ID', True)
+
+def test_token_round_trip(make_user):
+    user_id, _ = make_user()
+    assert verify_token(issue_token(db.session.get(User, user_id))) == user_id
+
+def test_tampered_or_expired_token_is_rejected(app, make_user, monkeypatch):
+    user_id, _ = make_user()
+    token = issue_token(db.session.get(User, user_id))
+    assert verify_token(token[:-2] + ('A' if token[-2] != 'A' else 'B') + token[-1]) is None
+    assert verify_token('not-a-token') is None
+    monkeypatch.setitem(app.config, 'ACCESS_TOKEN_TTL', -1)
+    assert verify_token(token) is None
+
+def test_token_signed_with_other_secret_is_rejected(app, make_user, monkeypatch):
+    user_id, _ = make_user()
+    token = issue_token(db.session.get(User, user_id))
+    monkeypatch.setitem(app.config, 'SECRET_KEY', 'outra-chave')
+    assert verify_token(token) is None
+
+def test_me_requires_a_valid_token(client, make_user):
+    user_id, headers = make_user('ana')
+    response = client.get('/api/auth/me', headers=headers)
+    assert response.status_code == 200
+    assert response.get_json()['id'] == user_id
+    assert response.get_json()['legacy'] is False
+
+    assert client.get('/api/auth/me').status_code == 401
+    assert client.get('/api/auth/me', headers={'Authorization': 'Bearer x.y.z'}).status_code == 401
+
+def test_claimed_user_must_match_token(client, make_user):
+    _, headers = make_user('ana')
+    other_id, _ = make_user('bia')
+    response = client.get('/api/auth/me', headers=headers, query_string={'user_id': other_id})
+    assert response.status_code == 403
+
+def test_claimed_user_id_is_ignored_by_default(client, make_user):
+    user_id, _ = make_user('ana')
+    assert client.get('/api/auth/me', query_string={'user_id': user_id}).status_code == 401
+
+def test_legacy_principal_is_never_admin(client, make_user, legacy_auth):
+    admin_id, _ = make_user('admin', is_admin=True)
+    response = client.get('/api/auth/me', query_string={'user_id': admin_id})
+    assert response.status_code == 200
+    assert response.get_json()['is_admin'] is False
+    assert response.get_json()['legacy'] is True
+
+    response = client.post('/api/question-lists/upload-text', json={'created_by': admin_id, 'name': 'x',
+                                                                     'questions_text': 'Pergunta'})
+    assert response.status_code == 403
+
+def test_admin_routes_require_admin_token(client, make_user):
+    _, headers = make_user('ana')
+    response = client.post('/api/question-lists/upload-text', headers=headers,
+                           json={'name': 'x', 'questions_text': 'Pergunta'})
+    assert response.status_code == 403
+
+def test_principal_cache_sees_user_changes(app, make_user):
+    user_id, _ = make_user('ana')
+    assert principal_cache.get(user_id).is_admin is False
+    user = db.session.get(User, user_id)
+    user.is_admin = True
+    db.session.commit()
+    assert principal_cache.get(user_id).is_admin is True
@@ -0,0 +1,140 @@
+from datetime import datetime, timedelta
+import pytest
+from src.main import db
+from src.models.card import Card
+from src.models.category import Theme
+from src.routes.cards import encode_cursor, decode_cursor
+
+def test_cursor_round_trip():
+    moment = datetime(2026, 3, 1, 14, 30, 5, 123456)
+    assert decode_cursor(encode_cursor(moment, 42)) == (moment, 42)
+
+def test_cursor_rejects_garbage():
+    for cursor in ('', 'abc', '2026-03-01T14:30:05|x'):
+        with pytest.raises(ValueError):
+            decode_cursor(cursor)
+
+def test_due_pages_cover_every_card_once(client, make_user, make_category):
+    user_id, headers = make_user()
+    category_id = make_category(user_id)
+    moment = datetime.utcnow() - timedelta(days=1)
+    # Várias datas repetidas: o desempate por id não pode pular nem repetir cards
+    db.session.add_all([Card(user_id=user_id, category_id=category_id, question=f'q{i}', answer='a',
+                             next_review=moment + timedelta(minutes=i % 3)) for i in range(25)])
+    db.session.add(Card(user_id=user_id, category_id=category_id, question='futuro', answer='a',
+                        next_review=datetime.utcnow() + timedelta(days=3)))
+    db.session.commit()
+
+    seen = []
+    cursor = None
+    while True:
+        response = client.get('/api/cards/due', headers=headers,
+                              query_string={'limit': 7, **({'cursor': cursor} if cursor else {})})
+        assert response.status_code == 200
+        body = response.get_json()
+        seen.extend((card['next_review'], card['id']) for card in body['cards'])
+        cursor = body['next_cursor']
+        if not cursor:
+            break
+    assert len(seen) == 25
+    assert seen == sorted(seen)
+    assert len({card_id for _, card_id in seen}) == 25
+
+def test_due_rejects_invalid_cursor(client, make_user):
+    _, headers = make_user()
+    response = client.get('/api/cards/due', headers=headers, query_string={'cursor': 'nope'})
+    assert response.status_code == 400
+
+def test_due_requires_authentication(client, make_user):
+    user_id, _ = make_user()
+    assert client.get('/api/cards/due', query_string={'user_id': user_id}).status_code == 401
+
+def test_bulk_create_returns_201_when_every_card_is_created(client, make_user, make_category):
+    user_id, headers = make_user()
+    category_id = make_category(user_id)
+    response = client.post('/api/cards/bulk', headers=headers, json={
+        'defaults': {'category_id': category_id, 'answer': 'a'},
+        'cards': [{'question': 'q1'}, {'question': 'q2', 'difficulty': 'hard'}]
+    })
+    assert response.status_code == 201
+    body = response.get_json()
+    assert (body['created'], body['failed']) == (2, 0)
+    assert Card.query.filter_by(user_id=user_id).count() == 2
+
+def test_bulk_create_reports_partial_failure_with_207(client, make_user, make_category):
+    user_id, headers = make_user()
+    category_id = make_category(user_id)
+    response = client.post('/api/cards/bulk', headers=headers, json={'cards': [
+        {'category_id': category_id, 'question': 'q', 'answer': 'a'},
+        {'category_id': category_id, 'question': 'sem resposta'},
+        {'category_id': category_id, 'question': 'q', 'answer': 'a', 'difficulty': 'impossível'}
+    ]})
+    assert response.status_code == 207
+    assert [result['status'] for result in response.get_json()['results']] == ['created', 'error', 'error']
+
+def test_bulk_create_rejects_categories_and_themes_of_other_users(client, make_user, make_category):
+    user_id, headers = make_user('ana')
+    other_id, _ = make_user('bia')
+    own_category = make_category(user_id)
+    other_category = make_category(other_id)
+    other_theme = Theme(category_id=other_category, name='Arritmias')
+    db.session.add(other_theme)
+    db.session.commit()
+
+    response = client.post('/api/cards/bulk', headers=headers, json={'cards': [
+        {'category_id': 999, 'question': 'q', 'answer': 'a'},
+        {'category_id': other_category, 'question': 'q', 'answer': 'a'},
+        {'category_id': own_category, 'theme_id': other_theme.id, 'question': 'q', 'answer': 'a'}
+    ]})
+    assert response.status_code == 400
+    assert response.get_json()['created'] == 0
+    assert Card.query.count() == 0
+
+def test_single_card_requires_an_owned_category(client, make_user, make_category):
+    _, headers = make_user('ana')
+    other_id, _ = make_user('bia')
+    response = client.post('/api/cards', headers=headers, json={
+        'category_id': make_category(other_id), 'question': 'q', 'answer': 'a'
+    })
+    assert response.status_code == 400
+    assert Card.query.count() == 0
+
+def test_page_projects_only_requested_fields(client, make_user, make_category):
+    user_id, headers = make_user()
+    db.session.add(Card(user_id=user_id, category_id=make_category(user_id), question='q', answer='a',
+                        tags='["cardio"]'))
+    db.session.commit()
+
+    response = client.get('/api/cards/page', headers=headers, query_string={'fields': 'id, question,tags'})
+    assert response.status_code == 200
+    [card] = response.get_json()['cards']
+    assert set(card) == {'id', 'question', 'tags'}
+    assert card['tags'] == ['cardio']
+
+    response = client.get('/api/cards/page', headers=headers, query_string={'fields': 'id,password'})
+    assert response.status_code == 400
+    assert 'password' in response.get_json()['error']
+
+def test_page_cursor_walks_every_card_once(client, make_user, make_category):
+    user_id, headers = make_user()
+    category_id = make_category(user_id)
+    moment = datetime(2026, 3, 1, 12, 0)
+    # created_at repetido: o desempate é pelo id
+    db.session.add_all([Card(user_id=user_id, category_id=category_id, question=f'q{i}', answer='a',
+                             created_at=moment + timedelta(minutes=i // 2)) for i in range(5)])
+    db.session.commit()
+
+    seen, cursor, pages = [], None, 0
+    while True:
+        response = client.get('/api/cards/page', headers=headers, query_string={
+            'limit': 2, 'fields': 'question', **({'cursor': cursor} if cursor else {})
+        })
+        assert response.status_code == 200
+        body = response.get_json()
+        seen.extend(card['question'] for card in body['cards'])
+        pages += 1
+        cursor = body['next_cursor']
+        if not cursor:
+            break
+    assert seen == [f'q{i}' for i in range(5)]
+    assert pages == 3
@@ -0,0 +1,29 @@
+def test_unchanged_categories_answer_304(client, make_user, make_category):
+    user_id, headers = make_user()
+    make_category(user_id)
+
+    first = client.get('/api/categories', headers=headers)
+    etag = first.headers['ETag']
+    assert first.status_code == 200 and etag.startswith('W/')
+
+    again = client.get('/api/categories', headers={**headers, 'If-None-Match': etag})
+    assert again.status_code == 304
+    assert again.get_data() == b''
+    assert again.headers['ETag'] == etag
+
+def test_a_write_changes_the_etag(client, make_user, make_category):
+    user_id, headers = make_user()
+    etag = client.get('/api/categories', headers=headers).headers['ETag']
+
+    make_category(user_id, 'Pediatria')
+    response = client.get('/api/categories', headers={**headers, 'If-None-Match': etag})
+    assert response.status_code == 200
+    assert response.headers['ETag'] != etag
+    assert [category['name'] for category in response.get_json()] == ['Pediatria']
+
+def test_etags_are_per_user(client, make_user):
+    _, headers = make_user('ana')
+    _, other_headers = make_user('bia')
+    etag = client.get('/api/categories', headers=headers).headers['ETag']
+    response = client.get('/api/categories', headers={**other_headers, 'If-None-Match': etag})
+    assert response.status_code == 200
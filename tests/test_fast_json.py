@@ -0,0 +1,53 @@
+from datetime import date, datetime
+from decimal import Decimal
+import json
+import uuid
+import pytest
+from flask import jsonify
+from src.utils import fast_json
+from src.utils.fast_json import dumps, json_array_response, row_encoder
+
+@pytest.fixture(params=['orjson', 'json'])
+def encoder(request, monkeypatch):
+    """Roda o teste com orjson e com o fallback do json padrão"""
+    if request.param == 'orjson':
+        pytest.importorskip('orjson')
+    else:
+        monkeypatch.setattr(fast_json, 'orjson', None)
+    return request.param
+
+def _streamed(app, *args, **kwargs):
+    with app.test_request_context():
+        response = json_array_response(*args, **kwargs)
+        assert response.mimetype == 'application/json'
+        return json.loads(response.get_data())
+
+@pytest.mark.parametrize('count', [0, 1, 3, 7])
+def test_streamed_array_matches_json(app, encoder, count):
+    items = [{'id': i, 'nome': f'questão {i}'} for i in range(count)]
+    assert _streamed(app, iter(items), chunk_size=3) == items
+
+@pytest.mark.parametrize('head', [{}, {'list_id': 1, 'name': 'Cardio'}])
+def test_streamed_object_keeps_the_head(app, encoder, head):
+    items = [{'id': i} for i in range(5)]
+    assert _streamed(app, iter(items), head=head, key='questions', chunk_size=2) == {**head, 'questions': items}
+
+def test_dumps_handles_extra_types(encoder):
+    moment = datetime(2026, 3, 1, 14, 30, 5)
+    token = uuid.UUID('12345678-1234-5678-1234-567812345678')
+    value = {'at': moment, 'day': date(2026, 3, 1), 'score': Decimal('2.5'), 'tags': {'ECG'}, 'id': token}
+    assert json.loads(dumps(value)) == {
+        'at': '2026-03-01T14:30:05', 'day': '2026-03-01', 'score': 2.5, 'tags': ['ECG'], 'id': str(token)
+    }
+    with pytest.raises(TypeError):
+        dumps({'x': object()})
+
+def test_row_encoder_applies_only_listed_converters():
+    encode = row_encoder(['id', 'tags'], {'tags': json.loads, 'answer': str.upper})
+    assert encode((1, '["a"]')) == {'id': 1, 'tags': ['a']}
+    assert row_encoder(['id'])((2,)) == {'id': 2}
+
+def test_jsonify_uses_the_same_date_format(app, encoder):
+    with app.test_request_context():
+        response = jsonify({'at': datetime(2026, 3, 1, 14, 30, 5), 'n': None})
+    assert response.get_json() == {'at': '2026-03-01T14:30:05', 'n': None}
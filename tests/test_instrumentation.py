@@ -0,0 +1,42 @@
+import re
+import pytest
+from src.main import db
+from src.models.question_list import QuestionList, PresetQuestion
+from src.utils.instrumentation import metrics
+
+ENDPOINT = ('GET', '/api/question-lists/<int:list_id>/questions')
+
+@pytest.fixture(autouse=True)
+def clean_metrics():
+    metrics.reset()
+    yield
+    metrics.reset()
+
+def _list_with_questions(count):
+    question_list = QuestionList(name='Lista', created_by=1)
+    db.session.add(question_list)
+    db.session.flush()
+    db.session.add_all([PresetQuestion(question_list_id=question_list.id, question_text=f'q{i}', order_index=i)
+                        for i in range(count)])
+    db.session.commit()
+    return question_list.id
+
+def test_streamed_response_is_recorded_on_close(client):
+    list_id = _list_with_questions(3)
+
+    response = client.get(f'/api/question-lists/{list_id}/questions', buffered=False)
+    assert metrics.requests[ENDPOINT + ('200',)] == 0
+    assert len(response.get_json()['questions']) == 3
+    before_body = int(re.search(r'"(\d+) queries"', response.headers.getlist('Server-Timing')[1]).group(1))
+    response.close()
+
+    assert metrics.requests[ENDPOINT + ('200',)] == 1
+    # A consulta das perguntas roda dentro do gerador, depois do after_request
+    assert metrics.sql_queries[ENDPOINT] > before_body
+
+def test_buffered_response_counts_its_queries(client):
+    client.get('/api/question-lists').close()
+    key = ('GET', '/api/question-lists')
+    assert metrics.requests[key + ('200',)] == 1
+    assert metrics.sql_queries[key] >= 1
+    assert 'medcards_requests_total{method="GET",endpoint="/api/question-lists",status="200"} 1' in metrics.render()
@@ -0,0 +1,109 @@
+from datetime import datetime, timedelta
+import threading
+import pytest
+from src.main import db
+from src.models.job import Job
+from src.utils.job_runner import JobRunner, register_job
+
+@register_job('test_echo')
+def _echo(context, payload):
+    context.report_progress(1)
+    context.check_cancelled()
+    return payload
+
+@pytest.fixture
+def runner(app):
+    """Executor sem pool nem thread de heartbeat: os passos são chamados direto"""
+    runner = JobRunner(heartbeat_retries=1)
+    runner.app = app
+    return runner
+
+def _job(**values):
+    job = Job(job_type='test_echo', payload='{"ok": true}', **values)
+    db.session.add(job)
+    db.session.commit()
+    return job.id
+
+def _fresh(job_id):
+    db.session.expire_all()
+    return db.session.get(Job, job_id)
+
+def test_claim_is_exclusive(app, runner):
+    job_id = _job()
+    other = JobRunner()
+    other.app = app
+
+    assert runner._claim(job_id)
+    assert not other._claim(job_id)
+    job = _fresh(job_id)
+    assert (job.status, job.worker_id, job.attempts) == ('running', runner.worker_id, 1)
+
+def test_run_records_the_result(runner):
+    job_id = _job()
+    runner._cancel_events[job_id] = threading.Event()
+    runner._run(job_id)
+
+    job = _fresh(job_id)
+    assert (job.status, job.get_result(), job.progress) == ('succeeded', {'ok': True}, 1)
+
+def test_heartbeat_renews_and_relays_cancellation(runner):
+    job_id = _job()
+    runner._claim(job_id)
+    old = datetime.utcnow() - timedelta(minutes=5)
+    Job.query.filter_by(id=job_id).update({'heartbeat_at': old, 'cancel_requested': True})
+    db.session.commit()
+    runner._running.add(job_id)
+    event = runner._cancel_events[job_id] = threading.Event()
+
+    runner._heartbeat()
+    assert event.is_set()
+    assert _fresh(job_id).heartbeat_at > old
+
+def test_heartbeat_waits_for_a_write_lock_held_by_a_job(runner):
+    job_id = _job()
+    runner._claim(job_id)
+    runner._running.add(job_id)
+    before = _fresh(job_id).heartbeat_at
+    db.session.remove()
+
+    # Outra transação (a da tarefa) segura o lock de escrita por um instante
+    connection = db.engine.connect()
+    transaction = connection.begin()
+    connection.execute(Job.__table__.update().where(Job.__table__.c.id == job_id).values(progress=5))
+    timer = threading.Timer(0.3, transaction.commit)
+    timer.start()
+    try:
+        runner._heartbeat()
+    finally:
+        timer.join()
+        connection.close()
+    job = _fresh(job_id)
+    assert job.progress == 5 and job.heartbeat_at > before
+
+def test_reap_stale_requeues_only_silent_workers(runner):
+    silent = _job(status='running', worker_id='morto', heartbeat_at=datetime.utcnow() - timedelta(minutes=5))
+    alive = _job(status='running', worker_id='vivo', heartbeat_at=datetime.utcnow())
+
+    assert runner.reap_stale() == 1
+    assert (_fresh(silent).status, _fresh(silent).worker_id) == ('queued', None)
+    assert _fresh(alive).status == 'running'
+
+def test_cancel_queued_job(runner):
+    job_id = _job()
+    assert runner.cancel(db.session.get(Job, job_id))
+    assert _fresh(job_id).status == 'cancelled'
+    assert not runner._claim(job_id)
+
+def test_cancel_running_job_stops_its_handler(runner):
+    job_id = _job()
+    runner._claim(job_id)
+    event = runner._cancel_events[job_id] = threading.Event()
+
+    assert runner.cancel(db.session.get(Job, job_id))
+    assert event.is_set() and _fresh(job_id).cancel_requested
+
+    # O handler vê o sinal no próximo check_cancelled e a tarefa termina cancelada
+    Job.query.filter_by(id=job_id).update({'status': 'queued'})
+    db.session.commit()
+    runner._run(job_id)
+    assert _fresh(job_id).status == 'cancelled'
@@ -0,0 +1,27 @@
+from sqlalchemy import text
+from src.main import db
+from src.models.card import Card
+from src.models.migrations import HOT_QUERIES, check_query_plans, pending_migrations, run_migrations
+from src.models.tag import Tag
+
+def test_schema_is_up_to_date(app):
+    assert pending_migrations() == []
+
+def test_hot_queries_use_indexes(app):
+    assert HOT_QUERIES
+    assert check_query_plans() == {}
+
+def test_tag_backfill_migration_links_legacy_json_tags(app, make_user, make_category):
+    user_id, _ = make_user()
+    category_id = make_category(user_id)
+    # Card gravado antes das tabelas de tags: só a coluna JSON preenchida
+    with db.engine.begin() as connection:
+        connection.execute(Card.__table__.insert(), {
+            'user_id': user_id, 'category_id': category_id, 'question': 'q', 'answer': 'a',
+            'tags': '["cardio", " ECG ", "cardio"]'
+        })
+        connection.execute(text("DELETE FROM schema_migrations WHERE version = '0004'"))
+
+    assert pending_migrations() == [('0004', 'Tags normalizadas a partir da coluna JSON dos cards')]
+    assert run_migrations() == ['0004']
+    assert Tag.facets(user_id) == [{'tag': 'ECG', 'count': 1}, {'tag': 'cardio', 'count': 1}]
@@ -0,0 +1,46 @@
+from src.main import db
+from src.models.card import Card
+from src.models.job import Job
+from src.models.study import StudySession
+
+def test_claimed_user_id_must_match_the_token(client, make_user):
+    user_id, _ = make_user('ana')
+    _, other_headers = make_user('bia')
+    response = client.get('/api/cards/page', headers=other_headers, query_string={'user_id': user_id})
+    assert response.status_code == 403
+
+def test_card_listings_only_show_the_callers_cards(client, make_user, make_category):
+    user_id, _ = make_user('ana')
+    other_id, other_headers = make_user('bia')
+    db.session.add(Card(user_id=user_id, category_id=make_category(user_id), question='q', answer='a'))
+    db.session.commit()
+
+    assert client.get('/api/cards', headers=other_headers).get_json() == []
+    assert client.get('/api/cards/page', headers=other_headers).get_json()['cards'] == []
+    assert client.get('/api/categories', headers=other_headers).get_json() == []
+
+def test_batch_answers_reject_another_users_session(client, make_user, make_category):
+    user_id, _ = make_user('ana')
+    _, other_headers = make_user('bia')
+    card = Card(user_id=user_id, category_id=make_category(user_id), question='q', answer='a')
+    session = StudySession(user_id=user_id)
+    db.session.add_all([card, session])
+    db.session.commit()
+
+    response = client.post('/api/study/answers/batch', headers=other_headers, json={
+        'session_id': session.id, 'answers': [{'card_id': card.id, 'is_correct': True}]
+    })
+    assert response.status_code == 404
+
+def test_jobs_are_visible_to_their_creator_and_admins(client, make_user):
+    user_id, headers = make_user('ana')
+    _, other_headers = make_user('bia')
+    _, admin_headers = make_user('root', is_admin=True)
+    job = Job(job_type='noop', payload='{}', created_by=user_id)
+    db.session.add(job)
+    db.session.commit()
+
+    assert client.get(f'/api/jobs/{job.id}', headers=headers).status_code == 200
+    assert client.get(f'/api/jobs/{job.id}', headers=admin_headers).status_code == 200
+    assert client.get(f'/api/jobs/{job.id}', headers=other_headers).status_code == 404
+    assert client.get(f'/api/jobs/{job.id}').status_code == 401
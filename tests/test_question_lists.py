@@ -0,0 +1,197 @@
+import io
+import json
+import random
+from src.main import db
+from src.models.card import Card
+from src.models.question_list import QuestionList, PresetQuestion
+from src.routes.question_lists import diff_questions, read_uploaded_questions, ORDER_INDEX_STEP
+from src.utils import dedup
+
+def _existing(questions):
+    return [(i + 1, text, (i + 1) * ORDER_INDEX_STEP) for i, text in enumerate(questions)]
+
+def _apply(existing, questions):
+    """Aplica o diff em memória e retorna as perguntas na ordem de order_index"""
+    inserts, updates, delete_ids = diff_questions(existing, questions)
+    rows = {row_id: (order_index, text) for row_id, text, order_index in existing}
+    for row_id in delete_ids:
+        del rows[row_id]
+    for update in updates:
+        rows[update['b_id']] = (update['order_index'], update['question_text'])
+    result = list(rows.values()) + list(inserts)
+    assert len({order_index for order_index, _ in result}) == len(result)
+    return [text for _, text in sorted(result)]
+
+def test_diff_unchanged_list_touches_nothing():
+    questions = [f'Pergunta {i}' for i in range(10)]
+    assert diff_questions(_existing(questions), questions) == ([], [], [])
+
+def test_diff_append_only_inserts_after_last():
+    questions = ['a', 'b', 'c']
+    inserts, updates, delete_ids = diff_questions(_existing(questions), questions + ['d'])
+    assert inserts == [(4 * ORDER_INDEX_STEP, 'd')]
+    assert (updates, delete_ids) == ([], [])
+
+def test_diff_edit_reuses_row():
+    inserts, updates, delete_ids = diff_questions(_existing(['a', 'b', 'c']), ['a', 'B', 'c'])
+    assert (inserts, delete_ids) == ([], [])
+    assert updates == [{'b_id': 2, 'question_text': 'B', 'order_index': 2 * ORDER_INDEX_STEP}]
+
+def test_diff_removal_deletes_row():
+    assert diff_questions(_existing(['a', 'b', 'c']), ['a', 'c']) == ([], [], [2])
+
+def test_diff_insert_between_keeps_neighbours():
+    inserts, updates, delete_ids = diff_questions(_existing(['a', 'b']), ['a', 'x', 'b'])
+    assert (updates, delete_ids) == ([], [])
+    assert inserts == [(ORDER_INDEX_STEP + ORDER_INDEX_STEP // 2, 'x')]
+
+def test_diff_moving_one_question_updates_one_row():
+    questions = [f'q{i}' for i in range(8)]
+    moved = questions[1:] + questions[:1]
+    inserts, updates, delete_ids = diff_questions(_existing(questions), moved)
+    assert (inserts, delete_ids) == ([], [])
+    assert [update['b_id'] for update in updates] == [1]
+
+def test_diff_random_edits_produce_new_order():
+    rng = random.Random(5)
+    for _ in range(200):
+        old = [f'q{rng.randint(0, 30)}' for _ in range(rng.randint(0, 20))]
+        new = [f'q{rng.randint(0, 30)}' for _ in range(rng.randint(0, 20))]
+        assert _apply(_existing(old), new) == new
+
+def test_exact_duplicates_ignore_case_accents_and_punctuation():
+    report = dedup.find_duplicates(['Qual a dose da Amiodarona?', 'qual a dose da amiodarona', 'Outra pergunta'])
+    assert report['duplicate_indexes'] == [1]
+    assert report['exact'][0]['duplicate_of']['index'] == 0
+
+def test_near_duplicates_found_against_existing_rows():
+    existing = [(7, 'Qual o tratamento de primeira linha da fibrilação atrial aguda?', 3)]
+    questions = ['Qual o tratamento de primeira linha da fibrilação atrial aguda ?!',
+                 'Qual o tratamento de primeira linha na fibrilação atrial aguda?',
+                 'Quais os critérios diagnósticos de síndrome nefrótica?']
+    report = dedup.find_duplicates(questions, existing=existing)
+    assert report['duplicate_indexes'] == [0, 1]
+    assert report['near'][0]['similar_to']['id'] == 7
+    assert report['near'][0]['similarity'] >= dedup.DEFAULT_THRESHOLD
+
+def test_near_disabled_reports_only_exact():
+    questions = ['Qual o tratamento da fibrilação atrial aguda?', 'Qual o tratamento na fibrilação atrial aguda?']
+    assert dedup.find_duplicates(questions, near=False)['duplicate_indexes'] == []
+
+def test_minhash_similarity_tracks_jaccard():
+    text = dedup.normalize('Paciente com dor torácica típica e supradesnivelamento de ST em parede anterior')
+    assert dedup.similarity(dedup.minhash(text), dedup.minhash(text)) == 1.0
+    other = dedup.normalize('Criança com febre, exantema e manchas de Koplik na mucosa oral')
+    assert dedup.similarity(dedup.minhash(text), dedup.minhash(other)) < 0.2
+
+def _question_list(category_id, questions, name='Lista'):
+    question_list = QuestionList(name=name, category_id=category_id, created_by=1)
+    db.session.add(question_list)
+    db.session.flush()
+    db.session.add_all([PresetQuestion(question_list_id=question_list.id, question_text=text,
+                                       order_index=(i + 1) * ORDER_INDEX_STEP) for i, text in enumerate(questions)])
+    db.session.commit()
+    return question_list.id
+
+def test_upload_of_only_duplicates_keeps_the_list(client, make_user):
+    _, headers = make_user('admin', is_admin=True)
+    _question_list(1, ['Dose da amiodarona na FA?'], name='Outra')
+    list_id = _question_list(1, ['Pergunta antiga'])
+
+    response = client.post(f'/api/question-lists/{list_id}/upload', headers=headers, json={
+        'questions_text': '1. Dose da amiodarona na FA?', 'dedup': 'exact'
+    })
+    assert response.status_code == 400
+    assert [row.question_text for row in PresetQuestion.query.filter_by(question_list_id=list_id)] == ['Pergunta antiga']
+
+def test_upload_rejects_unknown_dedup_mode(client, make_user):
+    _, headers = make_user('admin', is_admin=True)
+    list_id = _question_list(1, ['Pergunta antiga'])
+    response = client.post(f'/api/question-lists/{list_id}/upload', headers=headers, json={
+        'questions_text': 'Nova pergunta', 'dedup': 'fuzzy'
+    })
+    assert response.status_code == 400
+
+def _ndjson(response):
+    return [json.loads(line) for line in response.get_data(as_text=True).splitlines()]
+
+def test_stream_upload_replaces_through_the_diff(client, make_user):
+    _, headers = make_user('admin', is_admin=True)
+    list_id = _question_list(1, ['Primeira', 'Segunda', 'Terceira'])
+    kept = {row.question_text: row.id for row in PresetQuestion.query.filter_by(question_list_id=list_id)}
+
+    response = client.post(f'/api/question-lists/{list_id}/upload-stream', headers=headers,
+                           data='1. Primeira\n2. Segunda editada\n3. Terceira\n', content_type='text/plain')
+    done = _ndjson(response)[-1]
+    assert done['done'] and done['questions_count'] == 3
+    assert done['changes'] == {'inserted': 0, 'updated': 1, 'deleted': 0}
+
+    rows = PresetQuestion.query.filter_by(question_list_id=list_id).order_by(PresetQuestion.order_index).all()
+    assert [row.question_text for row in rows] == ['Primeira', 'Segunda editada', 'Terceira']
+    assert rows[0].id == kept['Primeira'] and rows[2].id == kept['Terceira']
+
+def test_uploaded_questions_are_parsed_in_batches():
+    questions = []
+    lines = io.StringIO('1. Um\n\n2) Dois -\n3- Três\n4. Quatro\n5. Cinco\n')
+    assert list(read_uploaded_questions(lines, questions, batch_size=2)) == [2, 4]
+    assert questions == ['Um', 'Dois', 'Três', 'Quatro', 'Cinco']
+
+class _WritingStream(io.BytesIO):
+    """Corpo que grava no banco por outra conexão enquanto é lido"""
+
+    def _write(self):
+        with db.engine.begin() as connection:
+            connection.execute(QuestionList.__table__.insert(), {'name': 'Concorrente', 'created_by': 1})
+
+    def read(self, *args):
+        self._write()
+        return super().read(*args)
+
+    def readinto(self, buffer):
+        self._write()
+        return super().readinto(buffer)
+
+def test_stream_create_reads_the_body_before_writing(client, make_user):
+    _, headers = make_user('admin', is_admin=True)
+    body = ''.join(f'{n}. Pergunta {n}?\n' for n in range(1, 2501)).encode('utf-8')
+
+    response = client.post('/api/question-lists/upload-stream?name=Grande', headers=headers,
+                           input_stream=_WritingStream(body), content_type='text/plain',
+                           content_length=len(body))
+    lines = _ndjson(response)
+    assert [line['parsed'] for line in lines if 'parsed' in line] == [1000, 2000]
+    assert lines[-1]['done'] and lines[-1]['questions_count'] == 2500
+
+    names = {row.name for row in QuestionList.query.all()}
+    assert names == {'Grande', 'Concorrente'}
+    assert PresetQuestion.query.filter_by(question_list_id=lines[-1]['list_id']).count() == 2500
+
+def test_stream_create_without_questions_creates_no_list(client, make_user):
+    _, headers = make_user('admin', is_admin=True)
+    response = client.post('/api/question-lists/upload-stream?name=Vazia', headers=headers,
+                           data='\n\n', content_type='text/plain')
+    assert 'error' in _ndjson(response)[-1]
+    assert QuestionList.query.count() == 0
+
+def test_materialize_creates_cards_in_an_owned_category(client, make_user, make_category):
+    user_id, headers = make_user()
+    category_id = make_category(user_id)
+    list_id = _question_list(None, ['Primeira', 'Segunda'])
+
+    response = client.post(f'/api/question-lists/{list_id}/materialize', headers=headers,
+                           json={'category_id': category_id})
+    assert response.status_code == 201
+    assert response.get_json()['created'] == 2
+    assert [card.question for card in Card.query.filter_by(user_id=user_id).order_by(Card.id)] == \
+        ['Primeira', 'Segunda']
+
+def test_materialize_rejects_unknown_or_foreign_categories(client, make_user, make_category):
+    _, headers = make_user('ana')
+    other_id, _ = make_user('bia')
+    list_id = _question_list(None, ['Primeira'])
+
+    for category_id in (999, make_category(other_id)):
+        response = client.post(f'/api/question-lists/{list_id}/materialize', headers=headers,
+                               json={'category_id': category_id})
+        assert response.status_code == 400
+    assert Card.query.count() == 0
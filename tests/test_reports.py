@@ -0,0 +1,72 @@
+from datetime import datetime, timedelta
+from src.main import db
+from src.models.card import Card
+from src.models.daily_stats import DailyUserStats
+from src.models.study import StudySession, CardReview
+
+def _snapshot(user_id):
+    db.session.expire_all()
+    return sorted(tuple(sorted(row.to_dict().items())) for row in DailyUserStats.query.filter_by(user_id=user_id))
+
+def _deck(user_id, make_category):
+    cardio, neuro = make_category(user_id, 'Cardiologia'), make_category(user_id, 'Neurologia')
+    cards = [Card(user_id=user_id, category_id=category_id, question=f'q{i}', answer='a')
+             for i, category_id in enumerate([cardio, cardio, neuro])]
+    session = StudySession(user_id=user_id)
+    db.session.add_all(cards + [session])
+    db.session.commit()
+    return [card.id for card in cards], session.id
+
+def test_incremental_rollup_matches_a_full_rebuild(client, make_user, make_category):
+    user_id, headers = make_user()
+    card_ids, session_id = _deck(user_id, make_category)
+
+    # Revisão de dois dias atrás, gravada pelo ORM (gancho after_insert)
+    db.session.add(CardReview(user_id=user_id, card_id=card_ids[2], session_id=session_id, is_correct=False,
+                              response_time=3, reviewed_at=datetime.utcnow() - timedelta(days=2)))
+    db.session.commit()
+    # Hoje: lote (SQL direto) e resposta avulsa; o card revisado antes não conta como novo
+    client.post('/api/study/answers/batch', headers=headers, json={'session_id': session_id, 'answers': [
+        {'card_id': card_ids[0], 'is_correct': True, 'response_time': 4},
+        {'card_id': card_ids[0], 'is_correct': False, 'response_time': 9},
+        {'card_id': card_ids[2], 'is_correct': True}
+    ]})
+    client.post('/api/study/answer', headers=headers, json={
+        'card_id': card_ids[1], 'session_id': session_id, 'is_correct': True, 'response_time': 7
+    })
+
+    incremental = _snapshot(user_id)
+    DailyUserStats.rebuild(user_id=user_id)
+    db.session.commit()
+    assert incremental and _snapshot(user_id) == incremental
+
+def test_reports_read_the_rollup(client, make_user, make_category):
+    user_id, headers = make_user()
+    card_ids, session_id = _deck(user_id, make_category)
+    client.post('/api/study/answers/batch', headers=headers, json={'session_id': session_id, 'answers': [
+        {'card_id': card_ids[0], 'is_correct': True},
+        {'card_id': card_ids[1], 'is_correct': False},
+        {'card_id': card_ids[2], 'is_correct': True}
+    ]})
+
+    performance = client.get('/api/reports/performance?days=7', headers=headers).get_json()
+    assert (performance['total_reviews'], performance['correct_reviews'], performance['accuracy']) == (3, 2, 66.7)
+    assert sorted((category['name'], category['accuracy']) for category in performance['categories']) == \
+        [('Cardiologia', 50.0), ('Neurologia', 100.0)]
+
+    progress = client.get('/api/reports/progress?days=7', headers=headers).get_json()
+    assert [(day['total_cards'], day['new_cards']) for day in progress] == [(3, 3)]
+
+def test_reports_follow_new_answers(client, make_user, make_category):
+    user_id, headers = make_user()
+    card_ids, session_id = _deck(user_id, make_category)
+    assert client.get('/api/reports/performance', headers=headers).get_json()['total_reviews'] == 0
+
+    client.post('/api/study/answer', headers=headers, json={
+        'card_id': card_ids[0], 'session_id': session_id, 'is_correct': True
+    })
+    assert client.get('/api/reports/performance', headers=headers).get_json()['total_reviews'] == 1
+
+def test_reports_require_authentication(client, make_user):
+    user_id, _ = make_user()
+    assert client.get('/api/reports/performance', query_string={'user_id': user_id}).status_code == 401
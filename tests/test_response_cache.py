@@ -0,0 +1,48 @@
+from src.main import db
+from src.models.card import Card
+from src.utils.response_cache import MemoryBackend, mark_user_dirty, response_cache
+
+def _page(client, headers):
+    response = client.get('/api/cards/page', headers=headers, query_string={'fields': 'id,question'})
+    return response.headers.get('X-Cache'), [card['question'] for card in response.get_json()['cards']]
+
+def test_write_invalidates_the_cached_page(client, make_user, make_category):
+    user_id, headers = make_user()
+    category_id = make_category(user_id)
+
+    assert _page(client, headers) == ('MISS', [])
+    assert _page(client, headers) == ('HIT', [])
+
+    response = client.post('/api/cards', headers=headers, json={
+        'category_id': category_id, 'question': 'Nova', 'answer': 'a'
+    })
+    assert response.status_code == 201
+    assert _page(client, headers) == ('MISS', ['Nova'])
+
+def test_each_user_has_its_own_entries(client, make_user, make_category):
+    user_id, headers = make_user('ana')
+    _, other_headers = make_user('bia')
+    db.session.add(Card(user_id=user_id, category_id=make_category(user_id), question='Da Ana', answer='a'))
+    db.session.commit()
+
+    assert _page(client, headers) == ('MISS', ['Da Ana'])
+    assert _page(client, other_headers) == ('MISS', [])
+
+def test_rollback_keeps_the_generation(app, make_user):
+    user_id, _ = make_user()
+    before = response_cache.generation(user_id)
+    mark_user_dirty(db.session, user_id)
+    db.session.rollback()
+    assert response_cache.generation(user_id) == before
+
+    mark_user_dirty(db.session, user_id)
+    db.session.commit()
+    assert response_cache.generation(user_id) == before + 1
+
+def test_memory_backend_evicts_least_recently_used():
+    backend = MemoryBackend(max_entries=2)
+    backend.set('a', 1, ttl=60)
+    backend.set('b', 2, ttl=60)
+    assert backend.get('a') == 1
+    backend.set('c', 3, ttl=60)
+    assert (backend.get('a'), backend.get('b'), backend.get('c')) == (1, None, 3)
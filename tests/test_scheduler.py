@@ -0,0 +1,96 @@
+import random
+from datetime import datetime
+from src.main import db
+from src.models.card import Card
+from src.models.study import StudySession
+from src.models import scheduler
+
+def _random_answers(count, seed=7):
+    rng = random.Random(seed)
+    return (
+        [rng.randint(0, 8) for _ in range(count)],
+        [round(rng.uniform(1.3, 3.0), 2) for _ in range(count)],
+        [rng.random() < 0.7 for _ in range(count)],
+        [rng.randint(1, 5) for _ in range(count)],
+    )
+
+def _card_formula(review_count, ease_factor, is_correct, rating):
+    """Card.calculate_next_review num card fora da sessão: (review_count, ease_factor, dias)"""
+    card = Card(review_count=review_count, ease_factor=ease_factor)
+    before = datetime.utcnow()
+    next_review = card.calculate_next_review(is_correct, rating)
+    return card.review_count, card.ease_factor, (next_review - before).total_seconds() / 86400
+
+def test_sm2_intervals_matches_scalar_formula():
+    counts, eases, correct, ratings = _random_answers(500)
+    new_count, new_ease, interval = scheduler.sm2_intervals(counts, eases, correct, ratings)
+    for i in range(len(counts)):
+        expected_count, expected_ease, expected_days = _card_formula(counts[i], eases[i], correct[i], ratings[i])
+        assert int(new_count[i]) == expected_count
+        assert float(new_ease[i]) == expected_ease
+        assert abs(float(interval[i]) - expected_days) < 1e-6
+
+def test_sm2_scalar_fallback_matches_vectorized():
+    counts, eases, correct, ratings = _random_answers(200, seed=3)
+    vectorized = scheduler.sm2_intervals(counts, eases, correct, ratings)
+    scalar = scheduler._sm2_intervals_scalar(counts, eases, correct, ratings)
+    for values, expected in zip(vectorized, scalar):
+        assert [float(value) for value in values] == [float(value) for value in expected]
+
+def test_apply_answers_matches_sequential_updates(app, make_user, make_category):
+    user_id, _ = make_user()
+    category_id = make_category(user_id)
+    cards = [Card(user_id=user_id, category_id=category_id, question=f'q{i}', answer='a') for i in range(5)]
+    db.session.add_all(cards)
+    db.session.commit()
+    card_ids = [card.id for card in cards]
+
+    rng = random.Random(11)
+    answers = [(rng.choice(card_ids), rng.random() < 0.75, rng.randint(1, 5)) for _ in range(40)]
+    expected = {card_id: (0, 2.5) for card_id in card_ids}
+    for card_id, is_correct, rating in answers:
+        count, ease, _ = _card_formula(*expected[card_id], is_correct, rating)
+        expected[card_id] = (count, ease)
+
+    now = datetime(2026, 1, 1)
+    next_reviews = scheduler.apply_answers(user_id, answers, now=now)
+    db.session.commit()
+
+    assert set(next_reviews) == {card_id for card_id, _, _ in answers}
+    db.session.expire_all()
+    for card_id in next_reviews:
+        card = db.session.get(Card, card_id)
+        assert (card.review_count, card.ease_factor) == expected[card_id]
+        assert card.next_review == next_reviews[card_id] > now
+
+def test_apply_answers_ignores_other_users_cards(app, make_user, make_category):
+    owner_id, _ = make_user('ana')
+    other_id, _ = make_user('bia')
+    card = Card(user_id=owner_id, category_id=make_category(owner_id), question='q', answer='a')
+    db.session.add(card)
+    db.session.commit()
+
+    assert scheduler.apply_answers(other_id, [(card.id, True, 5)]) == {}
+
+def test_batch_endpoint_schedules_with_sm2(client, make_user, make_category):
+    user_id, headers = make_user()
+    card = Card(user_id=user_id, category_id=make_category(user_id), question='q', answer='a')
+    session = StudySession(user_id=user_id)
+    db.session.add_all([card, session])
+    db.session.commit()
+
+    response = client.post('/api/study/answers/batch', headers=headers, json={
+        'session_id': session.id,
+        'answers': [{'card_id': card.id, 'is_correct': True, 'difficulty_rating': 4},
+                    {'card_id': card.id, 'is_correct': True, 'difficulty_rating': 4}]
+    })
+    assert response.status_code == 200
+    body = response.get_json()
+    assert body['recorded'] == 2
+    assert body['session']['total_cards'] == 2
+    assert body['session']['correct_answers'] == 2
+
+    db.session.expire_all()
+    card = db.session.get(Card, card.id)
+    assert card.review_count == 2
+    assert card.next_review.isoformat() == body['results'][-1]['next_review']
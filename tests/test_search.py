@@ -0,0 +1,54 @@
+from src.main import db
+from src.models.card import Card
+from src.models.question_list import QuestionList, PresetQuestion
+
+def _card(user_id, category_id, question, answer='osso'):
+    db.session.add(Card(user_id=user_id, category_id=category_id, question=question, answer=answer))
+    db.session.commit()
+
+def test_card_search_only_returns_own_cards(client, make_user, make_category):
+    ana, ana_headers = make_user('ana')
+    bia, bia_headers = make_user('bia')
+    _card(ana, make_category(ana), 'Fratura do fêmur')
+    _card(bia, make_category(bia), 'Fratura do fêmur proximal')
+
+    body = client.get('/api/search', headers=ana_headers, query_string={'q': 'femur', 'scope': 'cards'}).get_json()
+    assert len(body['cards']) == 1
+    assert '<mark>fêmur</mark>' in body['cards'][0]['question_snippet']
+
+def test_another_token_cannot_search_someone_elses_cards(client, make_user, make_category):
+    ana, _ = make_user('ana')
+    _, bia_headers = make_user('bia')
+    _card(ana, make_category(ana), 'Fratura do fêmur')
+
+    body = client.get('/api/search', headers=bia_headers, query_string={'q': 'femur', 'scope': 'cards'}).get_json()
+    assert body['cards'] == []
+    # Informar o id de outro usuário não troca o escopo da busca
+    response = client.get('/api/search', headers=bia_headers,
+                          query_string={'q': 'femur', 'scope': 'cards', 'user_id': ana})
+    assert response.status_code == 403
+
+def test_search_requires_authentication(client, make_user):
+    user_id, _ = make_user()
+    response = client.get('/api/search', query_string={'q': 'femur', 'user_id': user_id})
+    assert response.status_code == 401
+
+def test_snippets_escape_card_html(client, make_user, make_category):
+    user_id, headers = make_user()
+    _card(user_id, make_category(user_id), '<img src=x onerror=alert(1)> fêmur', '<b>osso</b>')
+
+    card = client.get('/api/search', headers=headers, query_string={'q': 'femur', 'scope': 'cards'}
+                      ).get_json()['cards'][0]
+    assert card['question_snippet'] == '&lt;img src=x onerror=alert(1)&gt; <mark>fêmur</mark>'
+    assert card['answer_snippet'] == '&lt;b&gt;osso&lt;/b&gt;'
+
+def test_question_snippets_are_escaped(client, make_user):
+    _, headers = make_user()
+    question_list = QuestionList(name='Lista', created_by=1)
+    db.session.add(question_list)
+    db.session.flush()
+    db.session.add(PresetQuestion(question_list_id=question_list.id, question_text='<script>x</script> arritmia'))
+    db.session.commit()
+
+    body = client.get('/api/search', headers=headers, query_string={'q': 'arritmia', 'scope': 'questions'}).get_json()
+    assert body['questions'][0]['snippet'] == '&lt;script&gt;x&lt;/script&gt; <mark>arritmia</mark>'
@@ -0,0 +1,92 @@
+import pytest
+from src.main import db
+from src.models.card import Card
+from src.models.study import StudySession, CardReview
+from src.routes.study_answers import parse_answer
+
+@pytest.fixture
+def study(make_user, make_category):
+    """Usuário com um card e uma sessão: (cabeçalhos, card_id, session_id)"""
+    user_id, headers = make_user()
+    card = Card(user_id=user_id, category_id=make_category(user_id), question='q', answer='a')
+    session = StudySession(user_id=user_id)
+    db.session.add_all([card, session])
+    db.session.commit()
+    return headers, card.id, session.id
+
+@pytest.mark.parametrize('answer', [
+    'card', None, {'card_id': '1', 'is_correct': True}, {'card_id': True, 'is_correct': True},
+    {'card_id': 1, 'is_correct': 'false'}, {'card_id': 1, 'is_correct': 0},
+    {'card_id': 1, 'is_correct': True, 'difficulty_rating': 0},
+    {'card_id': 1, 'is_correct': True, 'difficulty_rating': 6},
+    {'card_id': 1, 'is_correct': True, 'difficulty_rating': 2.5},
+    {'card_id': 1, 'is_correct': True, 'response_time': -1},
+    {'card_id': 1, 'is_correct': True, 'idempotency_key': 7},
+])
+def test_parse_answer_rejects_loose_types(answer):
+    with pytest.raises(ValueError):
+        parse_answer(answer)
+
+def test_parse_answer_fills_defaults():
+    assert parse_answer({'card_id': 1, 'is_correct': False}) == {
+        'card_id': 1, 'is_correct': False, 'difficulty_rating': 3, 'response_time': None, 'idempotency_key': None
+    }
+
+def test_batch_reports_invalid_items_individually(client, study):
+    headers, card_id, session_id = study
+    response = client.post('/api/study/answers/batch', headers=headers, json={'session_id': session_id, 'answers': [
+        {'card_id': card_id, 'is_correct': True},
+        {'card_id': card_id, 'is_correct': 'false'},
+        'nope',
+        {'card_id': card_id, 'is_correct': True, 'difficulty_rating': 9},
+        {'card_id': 999, 'is_correct': True}
+    ]})
+    assert response.status_code == 207
+    body = response.get_json()
+    assert body['recorded'] == 1
+    assert [(result['status'], result.get('code')) for result in body['results']] == [
+        ('recorded', None), ('error', 400), ('error', 400), ('error', 400), ('error', 404)
+    ]
+    assert body['session']['total_cards'] == 1
+
+def test_batch_with_only_invalid_items_is_a_400(client, study):
+    headers, card_id, session_id = study
+    response = client.post('/api/study/answers/batch', headers=headers, json={
+        'session_id': session_id, 'answers': [{'card_id': card_id, 'is_correct': 'true'}]
+    })
+    assert response.status_code == 400
+    assert CardReview.query.count() == 0
+
+def test_batch_rejects_a_non_integer_session(client, study):
+    headers, card_id, _ = study
+    response = client.post('/api/study/answers/batch', headers=headers, json={
+        'session_id': 'abc', 'answers': [{'card_id': card_id, 'is_correct': True}]
+    })
+    assert response.status_code == 400
+
+def test_replayed_idempotency_key_records_one_review(client, study):
+    headers, card_id, session_id = study
+    payload = {'session_id': session_id, 'answers': [
+        {'card_id': card_id, 'is_correct': True, 'idempotency_key': 'offline-1'}
+    ]}
+    first = client.post('/api/study/answers/batch', headers=headers, json=payload)
+    replay = client.post('/api/study/answers/batch', headers=headers, json=payload)
+
+    assert first.get_json()['results'][0]['status'] == 'recorded'
+    assert replay.status_code == 200
+    assert replay.get_json()['results'][0]['status'] == 'duplicate'
+    assert CardReview.query.count() == 1
+    assert db.session.get(StudySession, session_id).total_cards == 1
+
+def test_single_answer_uses_the_same_validation(client, study):
+    headers, card_id, session_id = study
+    response = client.post('/api/study/answer', headers=headers, json={
+        'card_id': card_id, 'session_id': session_id, 'is_correct': 'false'
+    })
+    assert response.status_code == 400
+
+    response = client.post('/api/study/answer', headers=headers, json={
+        'card_id': card_id, 'session_id': session_id, 'is_correct': False, 'difficulty_rating': 2
+    })
+    assert response.status_code == 201
+    assert response.get_json()['session']['correct_answers'] == 0
@@ -0,0 +1,94 @@
+import gzip
+import json
+from datetime import datetime, timedelta
+import pytest
+from src.main import db
+from src.models.category import Category, Theme
+from src.models.card import Card
+from src.models.study import StudySession, CardReview
+
+@pytest.fixture
+def study_data(make_user):
+    """Usuário com categoria, tema, cards, uma sessão e revisões"""
+    user_id, headers = make_user('ana')
+    category = Category(user_id=user_id, name='Cardiologia')
+    db.session.add(category)
+    db.session.flush()
+    theme = Theme(category_id=category.id, name='Arritmias')
+    db.session.add(theme)
+    db.session.flush()
+    cards = [Card(user_id=user_id, category_id=category.id, theme_id=theme.id if i % 2 else None,
+                  question=f'Pergunta {i} — "fêmur"', answer=f'Resposta {i}', tags=json.dumps(['fa', f't{i}']),
+                  next_review=datetime(2026, 1, 1) + timedelta(days=i), review_count=i, ease_factor=2.5 - i / 10)
+             for i in range(5)]
+    session = StudySession(user_id=user_id, total_cards=3, correct_answers=2)
+    db.session.add_all(cards + [session])
+    db.session.flush()
+    db.session.add_all([CardReview(user_id=user_id, card_id=cards[i].id, session_id=session.id,
+                                   is_correct=i != 1, difficulty_rating=4, reviewed_at=datetime(2025, 12, 1, 10, i))
+                        for i in range(3)])
+    db.session.commit()
+    return user_id, headers
+
+def _snapshot(user_id):
+    """Conteúdo do usuário sem ids, com as referências resolvidas"""
+    themes = {theme.id: theme.name for theme in Theme.query.join(Category).filter(Category.user_id == user_id)}
+    cards = Card.query.filter_by(user_id=user_id).order_by(Card.id).all()
+    questions = {card.id: card.question for card in cards}
+    return {
+        'categories': [category.name for category in Category.query.filter_by(user_id=user_id)],
+        'cards': [(card.question, card.answer, themes.get(card.theme_id), card.get_tags(), card.next_review,
+                   card.review_count, card.ease_factor) for card in cards],
+        'sessions': [(session.total_cards, session.correct_answers)
+                     for session in StudySession.query.filter_by(user_id=user_id)],
+        'reviews': [(questions[review.card_id], review.is_correct, review.reviewed_at)
+                    for review in CardReview.query.filter_by(user_id=user_id).order_by(CardReview.id)],
+    }
+
+def _export(client, user_id, headers, **params):
+    response = client.get(f'/api/users/{user_id}/export', headers=headers, query_string=params)
+    assert response.status_code == 200
+    return response.get_data()
+
+def test_export_is_ndjson_with_header_and_counts(client, study_data):
+    user_id, headers = study_data
+    lines = [json.loads(line) for line in _export(client, user_id, headers).splitlines()]
+    assert lines[0]['type'] == 'header'
+    assert lines[-1] == {'type': 'end', 'counts': {'category': 1, 'theme': 1, 'card': 5,
+                                                   'study_session': 1, 'card_review': 3}}
+    assert all('user_id' not in line for line in lines[1:-1])
+
+@pytest.mark.parametrize('compress', [None, 'gzip'])
+def test_export_import_round_trip(client, study_data, make_user, compress):
+    user_id, headers = study_data
+    data = _export(client, user_id, headers, **({'compress': compress} if compress else {}))
+    if compress:
+        assert gzip.decompress(data).startswith(b'{')
+
+    other_id, other_headers = make_user('bia')
+    response = client.post(f'/api/users/{other_id}/import', data=data, headers={
+        **other_headers, 'Content-Type': 'application/gzip' if compress else 'application/x-ndjson'
+    })
+    assert response.status_code == 201
+    assert response.get_json()['imported']['card'] == 5
+    assert _snapshot(other_id) == _snapshot(user_id)
+
+def test_cannot_export_another_users_data(client, study_data, make_user):
+    user_id, _ = study_data
+    _, other_headers = make_user('bia')
+    assert client.get(f'/api/users/{user_id}/export', headers=other_headers).status_code == 403
+
+def test_export_and_import_reject_legacy_principals(app, client, study_data, monkeypatch):
+    user_id, _ = study_data
+    monkeypatch.setitem(app.config, 'AUTH_ALLOW_LEGACY_USER_ID', True)
+    assert client.get(f'/api/users/{user_id}/export', query_string={'user_id': user_id}).status_code == 401
+    response = client.post(f'/api/users/{user_id}/import', query_string={'user_id': user_id}, data=b'')
+    assert response.status_code == 401
+
+def test_import_reports_invalid_line(client, make_user):
+    user_id, headers = make_user('bia')
+    response = client.post(f'/api/users/{user_id}/import', headers=headers,
+                           data=b'{"type": "header", "version": 1}\n{quebrado\n')
+    assert response.status_code == 400
+    assert 'linha 2' in response.get_json()['error']
+    assert Card.query.filter_by(user_id=user_id).count() == 0
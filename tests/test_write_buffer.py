@@ -0,0 +1,66 @@
+import threading
+from datetime import datetime
+from types import SimpleNamespace
+import pytest
+from src.main import db
+from src.models.user import User
+from src.utils.passwords import password_hasher
+from src.utils.write_buffer import WriteBehindBuffer
+
+@pytest.fixture
+def buffer(app):
+    """Buffer próprio com a thread parada no intervalo: só grava no flush explícito"""
+    buffer = WriteBehindBuffer(interval=3600)
+    buffer.app = app
+    buffer._thread = threading.Thread(target=buffer._run, daemon=True)
+    buffer._thread.start()
+    yield buffer
+    buffer._assignments.clear()
+    buffer.shutdown()
+
+def test_assign_keeps_last_value_and_overlays_reads(buffer, make_user):
+    user_id, _ = make_user()
+    first, last = datetime(2026, 1, 1, 8), datetime(2026, 1, 1, 9)
+    buffer.assign(User, user_id, last_login=first)
+    buffer.assign(User, user_id, last_login=last)
+
+    user = db.session.get(User, user_id)
+    assert user.last_login is None
+    assert buffer.overlay(user, ['last_login']) == {'last_login': last}
+
+    assert buffer.flush() == 1
+    db.session.expire_all()
+    assert db.session.get(User, user_id).last_login == last
+    assert buffer.flush() == 0
+
+def test_assignments_to_the_same_columns_share_one_update(buffer, make_user):
+    first_id, _ = make_user('ana')
+    second_id, _ = make_user('bia')
+    moment = datetime(2026, 1, 1, 8)
+    buffer.assign(User, first_id, last_login=moment)
+    buffer.assign(User, second_id, last_login=moment)
+
+    assert buffer.flush() == 2
+    db.session.expire_all()
+    assert [db.session.get(User, user_id).last_login for user_id in (first_id, second_id)] == [moment, moment]
+
+def test_failed_flush_keeps_pending_writes(buffer, make_user):
+    user_id, _ = make_user()
+    missing = SimpleNamespace(__table__=SimpleNamespace(name='tabela_inexistente'))
+    buffer.assign(missing, 1, total=1)
+    buffer.assign(User, user_id, last_login=datetime(2026, 1, 1))
+
+    with pytest.raises(KeyError):
+        buffer.flush()
+    assert buffer._assignments == {('tabela_inexistente', 1): {'total': 1},
+                                   ('user', user_id): {'last_login': datetime(2026, 1, 1)}}
+
+def test_login_buffers_last_login(client, app, make_user):
+    user_id, _ = make_user('ana')
+    user = db.session.get(User, user_id)
+    user.password_hash = password_hasher.hash('segredo')
+    db.session.commit()
+
+    response = client.post('/api/auth/login', json={'username': 'ana', 'password': 'segredo'})
+    assert response.status_code == 200
+    assert response.get_json()['user']['last_login'] is not None